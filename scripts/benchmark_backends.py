@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""Benchmark hand landmark backends on this machine.
+
+Times every available detector backend on full frames and on tracking
+crops, and reports the fastest one to put in ``detector_backend``.
+Backends whose dependencies or model files are missing are skipped, and
+crop-only backends (``onnx``) are only timed on crops.
+
+Usage:
+    python scripts/benchmark_backends.py
+    python scripts/benchmark_backends.py --image hand.jpg --backends solutions,onnx_int8
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from detector_backends import BACKENDS, create_backend  # noqa: E402
+
+# Input sizes: a 720p full frame and a typical tracking crop
+SIZES = {
+    "frame": (1280, 720),
+    "crop": (256, 256),
+}
+
+
+def time_backend(backend, image, repeats, warmup=3):
+    """Time backend inference on an image.
+
+    Args:
+        backend: HandLandmarkBackend instance
+        image: RGB image
+        repeats: Number of timed calls
+        warmup: Number of untimed calls first
+
+    Returns:
+        Median time in milliseconds
+    """
+    samples = []
+    for i in range(warmup + repeats):
+        start = time.perf_counter()
+        backend.process(image)
+        elapsed = time.perf_counter() - start
+        if i >= warmup:
+            samples.append(elapsed * 1000)
+    return float(np.median(samples))
+
+
+def main():
+    """Run the backend benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark hand landmark backends.")
+    parser.add_argument(
+        "--backends", default=",".join(BACKENDS),
+        help="Comma-separated backends (default: all)"
+    )
+    parser.add_argument("--image", help="Test image (default: random noise)")
+    parser.add_argument("--model-path", help="Model file for tasks/onnx backends")
+    parser.add_argument("--repeats", type=int, default=30, help="Timed runs per case")
+    args = parser.parse_args()
+
+    if args.image:
+        source = cv2.imread(args.image)
+        if source is None:
+            parser.error(f"Cannot read image: {args.image}")
+    else:
+        source = np.random.default_rng(0).integers(0, 256, (720, 1280, 3), dtype=np.uint8)
+
+    results = {}
+    for name in [b.strip() for b in args.backends.split(",") if b.strip()]:
+        try:
+            backend = create_backend(name, full_frame=False, model_path=args.model_path)
+        except Exception as e:
+            print(f"{name:<12} skipped: {e}")
+            continue
+
+        try:
+            for size_name, size in SIZES.items():
+                if size_name == "frame" and not backend.finds_hands:
+                    continue
+                image = cv2.cvtColor(cv2.resize(source, size), cv2.COLOR_BGR2RGB)
+                median = time_backend(backend, image, args.repeats)
+                results[(name, size_name)] = median
+                print(f"{name:<12} {size_name:<6} {median:>9.2f} ms")
+        finally:
+            backend.close()
+
+    if not results:
+        print("No backend could be benchmarked")
+        sys.exit(1)
+
+    for size_name in SIZES:
+        timings = {name: ms for (name, size), ms in results.items() if size == size_name}
+        if timings:
+            fastest = min(timings, key=timings.get)
+            print(f"Fastest on {size_name}: {fastest} ({timings[fastest]:.2f} ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""Benchmark effect rendering across resolutions and animation progress.
+
+Times every BaseEffect subclass and AnimationEngine.render with all effects
+active on 480p, 720p and 1080p frames. Results can be saved as a JSON
+baseline and later compared against it to catch rendering regressions.
+
+Usage:
+    python scripts/benchmark_effects.py --save benchmarks/baseline.json
+    python scripts/benchmark_effects.py --compare benchmarks/baseline.json
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from animation_engine import AnimationEngine  # noqa: E402
+from effects import (  # noqa: E402
+    HeartsEffect, ConfettiEffect, BalloonsEffect, ThumbsEffect, LasersEffect
+)
+
+RESOLUTIONS = {
+    "480p": (640, 480),
+    "720p": (1280, 720),
+    "1080p": (1920, 1080),
+}
+PROGRESS_VALUES = [0.1, 0.5, 0.9]
+
+EFFECTS = {
+    "HeartsEffect": lambda: HeartsEffect(seed=0),
+    "ConfettiEffect": lambda: ConfettiEffect(seed=0),
+    "BalloonsEffect": lambda: BalloonsEffect(seed=0),
+    "ThumbsEffect": lambda: ThumbsEffect(direction="up", seed=0),
+    "LasersEffect": lambda: LasersEffect(seed=0),
+}
+
+# Differences below this are treated as timer noise when comparing
+NOISE_FLOOR_MS = 0.05
+
+
+def time_render(render, base_frame, repeats, warmup=3):
+    """Time a render callable on fresh copies of a frame.
+
+    Args:
+        render: Callable taking a frame and returning the rendered frame
+        base_frame: Frame to copy before every call
+        repeats: Number of timed calls
+        warmup: Number of untimed calls first
+
+    Returns:
+        Dictionary with median, p95 and mean time in milliseconds
+    """
+    frame = np.empty_like(base_frame)
+    samples = []
+
+    for i in range(warmup + repeats):
+        np.copyto(frame, base_frame)
+        start = time.perf_counter()
+        render(frame)
+        elapsed = time.perf_counter() - start
+        if i >= warmup:
+            samples.append(elapsed * 1000)
+
+    return {
+        "median_ms": round(float(np.median(samples)), 4),
+        "p95_ms": round(float(np.percentile(samples, 95)), 4),
+        "mean_ms": round(float(np.mean(samples)), 4),
+    }
+
+
+def run_benchmarks(resolutions, repeats, name_filter=None):
+    """Run all benchmark cases.
+
+    Args:
+        resolutions: Resolution names to benchmark
+        repeats: Timed calls per case
+        name_filter: Only run cases whose name contains this string
+
+    Returns:
+        Dictionary mapping case name to timing results
+    """
+    results = {}
+    rng = np.random.default_rng(0)
+
+    for res_name in resolutions:
+        width, height = RESOLUTIONS[res_name]
+        base_frame = rng.integers(0, 256, (height, width, 3), dtype=np.uint8)
+
+        cases = {}
+        for effect_name, factory in EFFECTS.items():
+            effect = factory()
+            for progress in PROGRESS_VALUES:
+                cases[f"{effect_name}@{res_name}@p{progress}"] = (
+                    lambda frame, e=effect, p=progress: e.render(frame, p)
+                )
+
+        engine = AnimationEngine(effect_duration=3.0, seed=0)
+        for progress in PROGRESS_VALUES:
+            cases[f"AnimationEngine@{res_name}@p{progress}"] = (
+                lambda frame, p=progress: _render_all(engine, frame, p)
+            )
+
+        for case_name, render in cases.items():
+            if name_filter and name_filter not in case_name:
+                continue
+            results[case_name] = time_render(render, base_frame, repeats)
+            print(f"{case_name:<40} {results[case_name]['median_ms']:>9.3f} ms")
+
+    return results
+
+
+def _render_all(engine, frame, progress):
+    """Render every effect through the engine at the given progress.
+
+    Args:
+        engine: AnimationEngine instance
+        frame: Input frame
+        progress: Animation progress shared by all effects
+
+    Returns:
+        Rendered frame
+    """
+    engine.clear_effects()
+    for gesture_name in engine.gestures:
+        engine.trigger_effect(gesture_name, timestamp=0.0)
+    return engine.render(frame, timestamp=progress * engine.effect_duration)
+
+
+def compare(results, baseline, tolerance):
+    """Compare results against a baseline.
+
+    Args:
+        results: Current timing results
+        baseline: Baseline timing results
+        tolerance: Allowed relative slowdown (0.2 = 20%)
+
+    Returns:
+        List of regressed case names
+    """
+    regressions = []
+    print(f"\n{'case':<40} {'baseline':>10} {'current':>10} {'change':>8}")
+
+    for case_name, current in results.items():
+        if case_name not in baseline:
+            continue
+        before = baseline[case_name]["median_ms"]
+        after = current["median_ms"]
+        change = (after - before) / before if before > 0 else 0.0
+        regressed = change > tolerance and after - before > NOISE_FLOOR_MS
+        marker = "  REGRESSION" if regressed else ""
+        print(f"{case_name:<40} {before:>10.3f} {after:>10.3f} {change:>+7.0%}{marker}")
+        if regressed:
+            regressions.append(case_name)
+
+    return regressions
+
+
+def main():
+    """Run the benchmark suite."""
+    parser = argparse.ArgumentParser(description="Benchmark effect rendering.")
+    parser.add_argument(
+        "--resolutions", default=",".join(RESOLUTIONS),
+        help="Comma-separated resolutions (default: all)"
+    )
+    parser.add_argument("--repeats", type=int, default=20, help="Timed runs per case")
+    parser.add_argument("--filter", help="Only run cases containing this string")
+    parser.add_argument("--save", help="Save results as a JSON baseline")
+    parser.add_argument("--compare", help="Compare against a JSON baseline")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.2,
+        help="Allowed relative slowdown before failing (default: 0.2)"
+    )
+    args = parser.parse_args()
+
+    resolutions = [r.strip() for r in args.resolutions.split(",") if r.strip()]
+    unknown = set(resolutions) - set(RESOLUTIONS)
+    if unknown:
+        parser.error(f"Unknown resolutions: {', '.join(sorted(unknown))}")
+
+    results = run_benchmarks(resolutions, args.repeats, args.filter)
+
+    if args.save:
+        report = {
+            "meta": {
+                "python": platform.python_version(),
+                "numpy": np.__version__,
+                "opencv": cv2.__version__,
+                "machine": platform.machine(),
+                "platform": platform.platform(),
+                "repeats": args.repeats,
+            },
+            "results": results,
+        }
+        Path(args.save).parent.mkdir(parents=True, exist_ok=True)
+        with open(args.save, "w") as f:
+            json.dump(report, f, indent=4)
+        print(f"\nBaseline saved to {args.save}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"\n{len(regressions)} case(s) regressed by more than {args.tolerance:.0%}")
+            sys.exit(1)
+        print("\nNo regressions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""Report where application import time goes.
+
+Runs ``python -X importtime`` on a module in a fresh interpreter and
+lists the slowest imports by cumulative time, so heavy dependencies that
+creep back into the startup path are easy to spot.
+
+Usage:
+    python scripts/profile_imports.py                 # import main
+    python scripts/profile_imports.py gesture_detector --top 15
+"""
+
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+
+# Modules that must stay out of ``import main``
+HEAVY_MODULES = ("mediapipe", "cv2", "PyQt5", "pyvirtualcam", "onnxruntime")
+
+
+def profile_import(module):
+    """Import a module in a fresh interpreter with import timing.
+
+    Args:
+        module: Module name to import
+
+    Returns:
+        Tuple of (list of (self_us, cumulative_us, module_name) tuples,
+        heavy modules present after the import)
+    """
+    code = (
+        f"import sys; import {module}; "
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=SRC_DIR, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{result.stderr}")
+
+    entries = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3:
+            continue
+        entries.append((int(fields[0]), int(fields[1]), fields[2].strip()))
+
+    loaded = [name for name in result.stdout.strip().split(",") if name]
+    return entries, loaded
+
+
+def main():
+    """Print the import time report."""
+    parser = argparse.ArgumentParser(description="Profile module import time.")
+    parser.add_argument("module", nargs="?", default="main", help="Module to import (default: main)")
+    parser.add_argument("--top", type=int, default=20, help="Number of imports to list")
+    args = parser.parse_args()
+
+    entries, loaded = profile_import(args.module)
+    total = next((cumulative for _, cumulative, name in entries if name == args.module), 0)
+
+    print(f"import {args.module}: {total / 1000:.1f} ms total\n")
+    print(f"{'cumulative':>12} {'self':>10}  module")
+    for self_us, cumulative, name in sorted(entries, key=lambda e: e[1], reverse=True)[:args.top]:
+        print(f"{cumulative / 1000:>10.1f}ms {self_us / 1000:>8.1f}ms  {name}")
+
+    if loaded:
+        print(f"\nHeavy modules loaded: {', '.join(loaded)}")
+
+
+if __name__ == "__main__":
+    main()
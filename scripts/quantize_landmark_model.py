@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""Quantize an ONNX hand landmark model to int8 for the onnx_int8 backend.
+
+Uses ONNX Runtime dynamic quantization: weights are stored as int8 and
+activations are quantized on the fly, which needs no calibration data.
+
+Usage:
+    python scripts/quantize_landmark_model.py models/hand_landmark.onnx
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+
+def main():
+    """Quantize the model."""
+    parser = argparse.ArgumentParser(description="Quantize a hand landmark model to int8.")
+    parser.add_argument("model", help="Float ONNX model")
+    parser.add_argument(
+        "-o", "--output", default="models/hand_landmark_int8.onnx",
+        help="Output path (default: models/hand_landmark_int8.onnx)"
+    )
+    args = parser.parse_args()
+
+    try:
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+    except ImportError:
+        print("onnxruntime is required - install onnxruntime")
+        sys.exit(1)
+
+    Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+    quantize_dynamic(args.model, args.output, weight_type=QuantType.QInt8)
+
+    before = Path(args.model).stat().st_size / 1e6
+    after = Path(args.output).stat().st_size / 1e6
+    print(f"Saved {args.output} ({before:.1f} MB -> {after:.1f} MB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Replay a landmark recording through gesture classification and effects.
+
+Runs the recorded hands through the gesture rules (or learned classifiers)
+and AnimationEngine on a blank frame, without MediaPipe or a camera, and
+reports per-stage timings and the gestures that triggered effects.
+Recordings are made with the ``landmark_recording_path`` config key or
+``offline_render.py --record-landmarks``.
+
+Usage:
+    python scripts/replay_landmarks.py logs/landmarks.npy
+    python scripts/replay_landmarks.py logs/landmarks.npy --no-render
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from animation_engine import AnimationEngine  # noqa: E402
+from landmark_recording import ReplayDetector  # noqa: E402
+
+
+def main():
+    """Replay the recording."""
+    parser = argparse.ArgumentParser(description="Replay a landmark recording.")
+    parser.add_argument("recording", help="Landmark recording (.npy)")
+    parser.add_argument("--width", type=int, default=1280, help="Frame width")
+    parser.add_argument("--height", type=int, default=720, help="Frame height")
+    parser.add_argument("--threshold", type=float, default=0.8, help="Confidence threshold")
+    parser.add_argument("--classifier", nargs="*", default=[], help="Classifier weight files")
+    parser.add_argument("--no-render", action="store_true", help="Only time classification")
+    args = parser.parse_args()
+
+    detector = ReplayDetector(
+        args.recording, confidence_threshold=args.threshold, classifier_paths=args.classifier
+    )
+    engine = AnimationEngine()
+    frame = np.zeros((args.height, args.width, 3), dtype=np.uint8)
+
+    detect_times, render_times, events = [], [], []
+    start_time = None
+    start = time.perf_counter()
+
+    while not detector.finished:
+        stage_start = time.perf_counter()
+        gesture = detector.detect()
+        detect_times.append(time.perf_counter() - stage_start)
+
+        if start_time is None:
+            start_time = detector.last_timestamp
+        timestamp = detector.last_timestamp - start_time
+
+        if gesture and gesture not in engine.active_effects:
+            events.append((detector.position - 1, timestamp, gesture))
+        if gesture:
+            engine.trigger_effect(gesture, timestamp=timestamp)
+
+        if not args.no_render:
+            stage_start = time.perf_counter()
+            engine.render(frame, timestamp=timestamp)
+            render_times.append(time.perf_counter() - stage_start)
+
+    elapsed = time.perf_counter() - start
+    frames = len(detect_times)
+    print(f"Frames:  {frames} in {elapsed:.3f}s ({frames / max(elapsed, 1e-9):.0f} fps)")
+    for name, values in (("detect", detect_times), ("render", render_times)):
+        if values:
+            values_ms = np.array(values) * 1000
+            print(
+                f"  {name:<8} mean {values_ms.mean():>8.3f}  "
+                f"p95 {np.percentile(values_ms, 95):>8.3f} ms"
+            )
+    print(f"Gestures triggered: {len(events)}")
+    for index, timestamp, gesture in events:
+        print(f"  frame {index:>6}  {timestamp:>8.2f}s  {gesture}")
+
+    engine.cleanup()
+    detector.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""Train a landmark gesture classifier from recorded hand landmarks.
+
+Each input is either a landmark recording (``.npy``, see
+``landmark_recording``) or an ``.npz`` file with a ``landmarks`` array of
+shape (samples, hands, 21, 3) and optionally a ``labels`` array of
+gesture names. Inputs without labels take the label given after a colon,
+e.g. ``thumbs.npy:thumbs_up``; use ``none`` for samples showing no
+gesture. Only recorded frames with ``--hands`` hands are used.
+
+Usage:
+    python scripts/train_gesture_classifier.py thumbs.npy:thumbs_up fist.npy:raised_fist \\
+        idle.npy:none -o models/gestures_1h.npz
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from gesture_classifier import landmark_features, train_classifier  # noqa: E402
+from landmark_recording import load_recording  # noqa: E402
+
+
+def load_dataset(inputs, num_hands):
+    """Load and label landmark samples.
+
+    Args:
+        inputs: ``path`` or ``path:label`` strings
+        num_hands: Number of hands per sample in recordings
+
+    Returns:
+        Tuple of (landmarks, labels)
+    """
+    all_landmarks, all_labels = [], []
+
+    for spec in inputs:
+        path, _, label = spec.partition(":")
+        if path.endswith(".npy"):
+            if not label:
+                raise ValueError(f"Recordings have no labels; pass {path}:<label>")
+            records = load_recording(path)
+            records = records[records["num_hands"] == num_hands]
+            landmarks = np.array(records["landmarks"][:, :num_hands])
+            labels = [label] * len(landmarks)
+        else:
+            with np.load(path) as data:
+                landmarks = data["landmarks"]
+                if label:
+                    labels = [label] * len(landmarks)
+                elif "labels" in data.files:
+                    labels = [str(name) for name in data["labels"]]
+                else:
+                    raise ValueError(f"{path} has no labels; pass it as {path}:<label>")
+
+        all_landmarks.append(landmarks)
+        all_labels.extend(labels)
+        print(f"{path}: {len(landmarks)} samples")
+
+    hand_counts = {landmarks.shape[1] for landmarks in all_landmarks}
+    if len(hand_counts) != 1:
+        raise ValueError(f"Inputs mix different hand counts: {sorted(hand_counts)}")
+
+    return np.concatenate(all_landmarks), np.array(all_labels)
+
+
+def main():
+    """Train and save the classifier."""
+    parser = argparse.ArgumentParser(description="Train a landmark gesture classifier.")
+    parser.add_argument("inputs", nargs="+", help="Landmark files as path or path:label")
+    parser.add_argument("-o", "--output", required=True, help="Output weights file (.npz)")
+    parser.add_argument("--hands", type=int, default=1, help="Hands per sample in recordings")
+    parser.add_argument("--hidden", type=int, nargs="*", default=[64], help="Hidden layer sizes")
+    parser.add_argument("--epochs", type=int, default=300, help="Optimization steps")
+    parser.add_argument("--lr", type=float, default=0.01, help="Learning rate")
+    parser.add_argument("--val-split", type=float, default=0.2, help="Validation fraction")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    args = parser.parse_args()
+
+    try:
+        landmarks, labels = load_dataset(args.inputs, args.hands)
+    except (OSError, KeyError, ValueError) as e:
+        parser.error(str(e))
+
+    features = landmark_features(landmarks)
+    order = np.random.default_rng(args.seed).permutation(len(features))
+    num_val = int(len(order) * args.val_split)
+    val, train = order[:num_val], order[num_val:]
+
+    classifier = train_classifier(
+        features[train], labels[train],
+        num_hands=landmarks.shape[1],
+        hidden_sizes=args.hidden,
+        epochs=args.epochs,
+        learning_rate=args.lr,
+        seed=args.seed
+    )
+
+    def accuracy(indices):
+        predicted = np.argmax(classifier.predict_proba(features[indices]), axis=1)
+        return float(np.mean(np.array(classifier.labels)[predicted] == labels[indices]))
+
+    print(f"Classes: {', '.join(classifier.labels)}")
+    print(f"Train accuracy: {accuracy(train):.1%}")
+    if num_val:
+        print(f"Validation accuracy: {accuracy(val):.1%}")
+
+    sample = features[:1]
+    start = time.perf_counter()
+    for _ in range(1000):
+        classifier.predict_proba(sample)
+    print(f"Inference: {(time.perf_counter() - start):.3f} ms per sample")
+
+    classifier.save(args.output)
+    print(f"Saved {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -77,6 +77,7 @@ setup(
     entry_points={
         "console_scripts": [
             "camera-reactions=main:main",
+            "camera-reactions-render=offline_render:main",
         ],
     },
     include_package_data=True,
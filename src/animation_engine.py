@@ -1,57 +1,110 @@
 """Animation engine for rendering visual effects.
 
 This module manages and renders animated effects like hearts, confetti,
-balloons, etc. on video frames.
+balloons, etc. on video frames. Effect modules are imported and their
+renderers created the first time a gesture needs them.
 """
 
+import importlib
 import logging
+import threading
 import time
 from typing import Dict, Optional
-import cv2
 import numpy as np
-from pathlib import Path
 
-from effects.hearts import HeartsEffect
-from effects.confetti import ConfettiEffect
-from effects.balloons import BalloonsEffect
-from effects.thumbs import ThumbsEffect
-from effects.lasers import LasersEffect
+from buffer_pool import FrameRing
+from effect_layer import EffectLayer, clip_rect
+from perf_stats import PerfStats
 
 logger = logging.getLogger(__name__)
 
+# Gesture -> (effect module, effect class, constructor arguments)
+EFFECT_REGISTRY = {
+    "thumbs_up": ("effects.thumbs", "ThumbsEffect", {"direction": "up"}),
+    "thumbs_down": ("effects.thumbs", "ThumbsEffect", {"direction": "down"}),
+    "two_thumbs_up": ("effects.confetti", "ConfettiEffect", {}),
+    "peace_sign": ("effects.balloons", "BalloonsEffect", {}),
+    "heart_hands": ("effects.hearts", "HeartsEffect", {}),
+    "raised_fist": ("effects.lasers", "LasersEffect", {}),
+}
+
 
 class AnimationEngine:
     """Manages and renders animation effects on video frames."""
 
-    def __init__(self, effect_duration: float = 3.0):
+    def __init__(
+        self,
+        effect_duration: float = 3.0,
+        perf_stats: Optional[PerfStats] = None,
+        seed: Optional[int] = None
+    ):
         """Initialize animation engine.
 
         Args:
             effect_duration: Default duration for effects in seconds
+            perf_stats: Optional statistics collector for per-effect timings
+            seed: Random seed for every effect's layout, None for fresh ones
         """
         self.effect_duration = effect_duration
+        self.seed = seed
+        self.perf_stats = perf_stats or PerfStats(enabled=False)
         self.active_effects: Dict[str, Dict] = {}
 
-        # Initialize effect renderers
-        self.effect_renderers = {
-            "thumbs_up": ThumbsEffect(direction="up"),
-            "thumbs_down": ThumbsEffect(direction="down"),
-            "two_thumbs_up": ConfettiEffect(),
-            "peace_sign": BalloonsEffect(),
-            "heart_hands": HeartsEffect(),
-            "raised_fist": LasersEffect(),
-        }
+        # Output frames are reused in rotation instead of copied per frame
+        self._output_ring = FrameRing()
+
+        # Shared layer all effects draw into, blended once per frame
+        self._layer: Optional[EffectLayer] = None
+
+        # Effect renderers are created on first use, possibly ahead of
+        # time by a loader thread
+        self.effect_renderers: Dict[str, object] = {}
+        self._renderer_lock = threading.Lock()
+        self.quality = 1.0
 
         logger.info("AnimationEngine initialized")
 
-    def trigger_effect(self, gesture_name: str, duration: Optional[float] = None) -> None:
+    @property
+    def gestures(self):
+        """Names of all gestures with an effect."""
+        return list(EFFECT_REGISTRY)
+
+    def get_renderer(self, gesture_name: str):
+        """Get the effect renderer for a gesture, creating it if needed.
+
+        Args:
+            gesture_name: Name of the gesture
+
+        Returns:
+            Effect renderer
+        """
+        renderer = self.effect_renderers.get(gesture_name)
+        if renderer is None:
+            with self._renderer_lock:
+                renderer = self.effect_renderers.get(gesture_name)
+                if renderer is None:
+                    module_name, class_name, kwargs = EFFECT_REGISTRY[gesture_name]
+                    effect_class = getattr(importlib.import_module(module_name), class_name)
+                    renderer = effect_class(seed=self.seed, **kwargs)
+                    renderer.quality = self.quality
+                    self.effect_renderers[gesture_name] = renderer
+                    logger.debug(f"Loaded {class_name} for {gesture_name}")
+        return renderer
+
+    def trigger_effect(
+        self,
+        gesture_name: str,
+        duration: Optional[float] = None,
+        timestamp: Optional[float] = None
+    ) -> None:
         """Trigger an animation effect for a gesture.
 
         Args:
             gesture_name: Name of the gesture
             duration: Effect duration (uses default if None)
+            timestamp: Effect start time (uses wall clock if None)
         """
-        if gesture_name not in self.effect_renderers:
+        if gesture_name not in EFFECT_REGISTRY:
             logger.warning(f"Unknown gesture: {gesture_name}")
             return
 
@@ -62,29 +115,54 @@ class AnimationEngine:
         effect_duration = duration or self.effect_duration
 
         self.active_effects[gesture_name] = {
-            "start_time": time.time(),
+            "start_time": time.time() if timestamp is None else timestamp,
             "duration": effect_duration,
-            "renderer": self.effect_renderers[gesture_name]
+            "renderer": self.get_renderer(gesture_name)
         }
 
         logger.debug(f"Triggered effect for {gesture_name} (duration={effect_duration}s)")
 
-    def render(self, frame: np.ndarray) -> np.ndarray:
+    def set_quality(self, quality: float) -> None:
+        """Set the rendering quality of all effects.
+
+        Args:
+            quality: Fraction of full detail to render (0.0 to 1.0)
+        """
+        self.quality = quality
+        for renderer in list(self.effect_renderers.values()):
+            renderer.quality = quality
+
+    def render(self, frame: np.ndarray, timestamp: Optional[float] = None) -> np.ndarray:
         """Render all active effects on the frame.
 
+        The input frame is never modified. When no effect is active or
+        visible it is returned as is; otherwise every effect draws into
+        one shared effect layer, whose dirty rectangles are blended onto
+        a reused output buffer in a single pass. The output stays valid
+        for the next few frames.
+
         Args:
             frame: Input video frame
+            timestamp: Frame time (uses wall clock if None)
 
         Returns:
             Frame with effects rendered
         """
-        current_time = time.time()
-        output_frame = frame.copy()
+        if not self.active_effects:
+            return frame
+
+        current_time = time.time() if timestamp is None else timestamp
+
+        height, width = frame.shape[:2]
+        if self._layer is None or self._layer.shape != (height, width):
+            self._layer = EffectLayer(width, height)
+        layer = self._layer
+        layer.clear()
 
         # Track effects to remove
         to_remove = []
 
-        # Render each active effect
+        # Draw each active effect
         for gesture_name, effect_data in self.active_effects.items():
             elapsed = current_time - effect_data["start_time"]
             duration = effect_data["duration"]
@@ -96,9 +174,20 @@ class AnimationEngine:
             # Calculate progress (0.0 to 1.0)
             progress = elapsed / duration
 
-            # Render effect
             renderer = effect_data["renderer"]
-            output_frame = renderer.render(output_frame, progress)
+            with self.perf_stats.measure(f"effect.{gesture_name}"):
+                # Effects entirely outside the frame do no pixel work
+                if clip_rect(renderer.bounds(width, height, progress), width, height) is None:
+                    continue
+                renderer.draw(layer, progress)
+
+        # Nothing visible was drawn: the input is the output
+        if layer.is_empty:
+            output_frame = frame
+        else:
+            output_frame = self._output_ring.next(frame.shape, frame.dtype)
+            with self.perf_stats.measure("composite"):
+                layer.composite(frame, output_frame)
 
         # Remove completed effects
         for gesture_name in to_remove:
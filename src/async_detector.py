@@ -0,0 +1,128 @@
+"""Asynchronous gesture detection.
+
+This module runs gesture inference on a background worker at its own
+cadence, so rendering can continue at the full camera rate while
+MediaPipe works on the most recent frame.
+"""
+
+import logging
+import threading
+import time
+from typing import List, Optional
+import numpy as np
+
+from frame_pipeline import LatestFrameQueue
+from frame_tracer import current_frame_id, set_current_frame_id
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncGestureDetector:
+    """Runs a gesture detector on a worker thread at a fixed rate."""
+
+    def __init__(self, detector, rate_hz: float = 15.0):
+        """Initialize asynchronous detector.
+
+        Args:
+            detector: Detector with ``detect(frame)`` and ``cleanup()``
+                methods, e.g. ``GestureDetector``
+            rate_hz: Maximum number of inferences per second
+        """
+        self.detector = detector
+        self.rate_hz = rate_hz
+        self.interval = 1.0 / rate_hz if rate_hz > 0 else 0.0
+
+        self._frames = LatestFrameQueue(1)
+        self._result_lock = threading.Lock()
+        self._result: Optional[str] = None
+        self._result_gestures: List = []
+        self._result_seq = 0
+        self._consumed_seq = 0
+        self.last_gestures: List = []
+
+        self.running = True
+        self._worker = threading.Thread(
+            target=self._detect_loop, name="gesture-detector", daemon=True
+        )
+        self._worker.start()
+
+        logger.info(f"AsyncGestureDetector started ({rate_hz} Hz)")
+
+    @property
+    def confidence_threshold(self) -> float:
+        """Confidence threshold of the wrapped detector."""
+        return self.detector.confidence_threshold
+
+    @property
+    def last_hand_count(self) -> int:
+        """Number of hands in the wrapped detector's latest inference."""
+        return getattr(self.detector, "last_hand_count", 0)
+
+    def warm_up(self, *args, **kwargs) -> None:
+        """Warm up the wrapped detector (see ``GestureDetector.warm_up``)."""
+        warm_up = getattr(self.detector, "warm_up", None)
+        if warm_up is not None:
+            warm_up(*args, **kwargs)
+
+    def detect(self, frame: np.ndarray) -> Optional[str]:
+        """Submit a frame and collect the latest finished detection.
+
+        The frame is handed to the worker without blocking. Each
+        detection result is returned once, on the first call after it
+        was published.
+
+        Args:
+            frame: Input BGR image
+
+        Returns:
+            Newly detected gesture name or None; every gesture of that
+            detection is in ``last_gestures``
+        """
+        self._frames.put((current_frame_id(), frame))
+
+        with self._result_lock:
+            if self._result_seq == self._consumed_seq:
+                self.last_gestures = []
+                return None
+            self._consumed_seq = self._result_seq
+            self.last_gestures = self._result_gestures
+            return self._result
+
+    def _publish(self, gesture: Optional[str], gestures: List) -> None:
+        """Store a detection result in the mailbox.
+
+        Args:
+            gesture: Detected gesture name or None
+            gestures: Every gesture of the detection (``HandGesture``)
+        """
+        with self._result_lock:
+            self._result = gesture
+            self._result_gestures = gestures
+            self._result_seq += 1
+
+    def _detect_loop(self) -> None:
+        """Run inference on the newest frame at the configured rate."""
+        while self.running:
+            item = self._frames.get(timeout=0.1)
+            if item is None:
+                continue
+
+            frame_id, frame = item
+            set_current_frame_id(frame_id)
+            start = time.perf_counter()
+            try:
+                gesture = self.detector.detect(frame)
+                self._publish(gesture, list(getattr(self.detector, "last_gestures", [])))
+            except Exception as e:
+                logger.error(f"Gesture detection failed: {e}")
+
+            remaining = self.interval - (time.perf_counter() - start)
+            if remaining > 0:
+                time.sleep(remaining)
+
+    def cleanup(self) -> None:
+        """Stop the worker and release the wrapped detector."""
+        self.running = False
+        self._worker.join(timeout=1.0)
+        self.detector.cleanup()
+        logger.info("AsyncGestureDetector cleanup complete")
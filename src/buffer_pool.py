@@ -0,0 +1,141 @@
+"""Reusable frame buffers.
+
+Per-frame stages (color conversion, resizing, effect overlays, engine
+output) need full-size scratch arrays every frame. Allocating them anew
+costs tens of MB/s of allocator churn at 720p, so this module keeps
+released buffers around and hands them out again by shape and dtype.
+"""
+
+import logging
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Tuple
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class BufferPool:
+    """Pool of NumPy arrays keyed by shape and dtype."""
+
+    def __init__(self, max_per_key: int = 4):
+        """Initialize buffer pool.
+
+        Args:
+            max_per_key: Maximum idle buffers kept per shape/dtype
+        """
+        self.max_per_key = max_per_key
+        self._free: Dict[Tuple, List[np.ndarray]] = defaultdict(list)
+        self._lock = threading.Lock()
+        self.allocations = 0
+        self.reuses = 0
+
+    def acquire(self, shape: Tuple[int, ...], dtype=np.uint8) -> np.ndarray:
+        """Get a buffer with undefined contents.
+
+        Args:
+            shape: Array shape
+            dtype: Array dtype
+
+        Returns:
+            Buffer owned by the caller until released
+        """
+        key = (tuple(shape), np.dtype(dtype).str)
+
+        with self._lock:
+            free = self._free.get(key)
+            if free:
+                self.reuses += 1
+                return free.pop()
+            self.allocations += 1
+
+        return np.empty(shape, dtype=dtype)
+
+    def release(self, buffer: np.ndarray) -> None:
+        """Return a buffer to the pool.
+
+        The caller must not use the buffer afterwards.
+
+        Args:
+            buffer: Buffer obtained from ``acquire``
+        """
+        key = (buffer.shape, buffer.dtype.str)
+
+        with self._lock:
+            free = self._free[key]
+            if len(free) < self.max_per_key:
+                free.append(buffer)
+
+    @contextmanager
+    def borrow(self, shape: Tuple[int, ...], dtype=np.uint8) -> Iterator[np.ndarray]:
+        """Acquire a buffer for the duration of a ``with`` block.
+
+        Args:
+            shape: Array shape
+            dtype: Array dtype
+        """
+        buffer = self.acquire(shape, dtype)
+        try:
+            yield buffer
+        finally:
+            self.release(buffer)
+
+    def clear(self) -> None:
+        """Drop all idle buffers."""
+        with self._lock:
+            self._free.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get allocation statistics.
+
+        Returns:
+            Dictionary with allocation, reuse and idle buffer counts
+        """
+        with self._lock:
+            idle = sum(len(free) for free in self._free.values())
+        return {"allocations": self.allocations, "reuses": self.reuses, "idle": idle}
+
+
+class FrameRing:
+    """Fixed ring of output buffers reused in rotation.
+
+    Used for frames that leave the producing stage (e.g. engine output
+    handed to the virtual camera and preview), where no single consumer
+    can release them. A buffer is overwritten only after ``size`` newer
+    frames have been produced, so ``size`` must exceed the number of
+    frames that can be in flight downstream.
+    """
+
+    def __init__(self, size: int = 6):
+        """Initialize frame ring.
+
+        Args:
+            size: Number of buffers in rotation
+        """
+        self.size = size
+        self._buffers: List[np.ndarray] = []
+        self._index = 0
+
+    def next(self, shape: Tuple[int, ...], dtype=np.uint8) -> np.ndarray:
+        """Get the next buffer in rotation.
+
+        Args:
+            shape: Array shape
+            dtype: Array dtype
+
+        Returns:
+            Buffer with undefined contents
+        """
+        if not self._buffers or self._buffers[0].shape != tuple(shape) \
+                or self._buffers[0].dtype != np.dtype(dtype):
+            self._buffers = [np.empty(shape, dtype=dtype) for _ in range(self.size)]
+            self._index = 0
+
+        buffer = self._buffers[self._index]
+        self._index = (self._index + 1) % self.size
+        return buffer
+
+
+# Shared pool for short-lived per-frame scratch buffers
+frame_pool = BufferPool()
@@ -0,0 +1,183 @@
+"""Webcam capture with explicit format negotiation.
+
+OpenCV opens cameras in whatever mode the driver picks first, which for
+many USB webcams is uncompressed YUYV at a low frame rate with a deep
+driver queue. This module asks for a compressed FOURCC, the resolution
+and frame rate the virtual camera outputs, and a one-frame buffer, then
+reads back what the driver actually granted.
+"""
+
+import logging
+import sys
+from typing import NamedTuple, Optional, Tuple
+import cv2
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class CaptureMode(NamedTuple):
+    """Capture mode granted by the driver."""
+
+    width: int
+    height: int
+    fps: float
+    fourcc: str
+
+
+def default_backend() -> int:
+    """Get the preferred OpenCV capture backend for this platform.
+
+    Returns:
+        OpenCV ``CAP_*`` API preference
+    """
+    if sys.platform.startswith("linux"):
+        return cv2.CAP_V4L2
+    if sys.platform == "win32":
+        return cv2.CAP_DSHOW
+    if sys.platform == "darwin":
+        return cv2.CAP_AVFOUNDATION
+    return cv2.CAP_ANY
+
+
+def decode_fourcc(value: float) -> str:
+    """Decode an OpenCV FOURCC property value.
+
+    Args:
+        value: Value of ``CAP_PROP_FOURCC``
+
+    Returns:
+        Four character code, or an empty string if unknown
+    """
+    code = int(value)
+    if code <= 0:
+        return ""
+    return "".join(chr((code >> (8 * i)) & 0xFF) for i in range(4))
+
+
+class CameraCapture:
+    """Camera source that negotiates its capture mode."""
+
+    def __init__(
+        self,
+        index: int = 0,
+        width: int = 1280,
+        height: int = 720,
+        fps: float = 30,
+        fourcc: Optional[str] = "MJPG",
+        buffer_size: int = 1,
+        backend: Optional[int] = None
+    ):
+        """Initialize camera capture.
+
+        Args:
+            index: Camera device index
+            width: Requested frame width, normally the virtual camera width
+            height: Requested frame height, normally the virtual camera height
+            fps: Requested frames per second
+            fourcc: Requested pixel format, or None to keep the driver default
+            buffer_size: Number of frames the driver may queue
+            backend: OpenCV ``CAP_*`` backend, platform default if None
+        """
+        self.index = index
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.fourcc = fourcc
+        self.buffer_size = buffer_size
+        self.backend = default_backend() if backend is None else backend
+
+        self.capture: Optional[cv2.VideoCapture] = None
+        self.mode: Optional[CaptureMode] = None
+
+    def open(self) -> bool:
+        """Open the camera and negotiate the capture mode.
+
+        Returns:
+            True if the camera was opened
+        """
+        capture = cv2.VideoCapture(self.index, self.backend)
+        if not capture.isOpened() and self.backend != cv2.CAP_ANY:
+            logger.warning(f"Camera {self.index} unavailable via backend {self.backend}, retrying")
+            capture.release()
+            capture = cv2.VideoCapture(self.index)
+
+        if not capture.isOpened():
+            logger.error(f"Failed to open camera {self.index}")
+            capture.release()
+            return False
+
+        self.capture = capture
+        self.mode = self._negotiate()
+        return True
+
+    def _negotiate(self) -> CaptureMode:
+        """Request the configured mode and read back the granted one.
+
+        The FOURCC is set before the resolution because V4L2 validates
+        frame sizes against the current pixel format.
+
+        Returns:
+            Granted capture mode
+        """
+        capture = self.capture
+        if self.fourcc:
+            capture.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*self.fourcc))
+        capture.set(cv2.CAP_PROP_FRAME_WIDTH, self.width)
+        capture.set(cv2.CAP_PROP_FRAME_HEIGHT, self.height)
+        capture.set(cv2.CAP_PROP_FPS, self.fps)
+        capture.set(cv2.CAP_PROP_BUFFERSIZE, self.buffer_size)
+
+        mode = CaptureMode(
+            width=int(capture.get(cv2.CAP_PROP_FRAME_WIDTH)),
+            height=int(capture.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+            fps=capture.get(cv2.CAP_PROP_FPS),
+            fourcc=decode_fourcc(capture.get(cv2.CAP_PROP_FOURCC))
+        )
+
+        if (mode.width, mode.height) != (self.width, self.height):
+            logger.warning(
+                f"Camera granted {mode.width}x{mode.height} instead of "
+                f"{self.width}x{self.height}"
+            )
+        if self.fourcc and mode.fourcc and mode.fourcc != self.fourcc:
+            logger.warning(f"Camera granted {mode.fourcc} instead of {self.fourcc}")
+        if 0 < mode.fps < self.fps:
+            logger.warning(f"Camera granted {mode.fps:g} fps instead of {self.fps:g}")
+
+        logger.info(
+            f"Camera {self.index} capturing {mode.width}x{mode.height} "
+            f"@ {mode.fps:g}fps ({mode.fourcc or 'default format'})"
+        )
+        return mode
+
+    @property
+    def frame_size(self) -> Tuple[int, int]:
+        """Granted (width, height), or the requested size if not open."""
+        if self.mode and self.mode.width > 0 and self.mode.height > 0:
+            return self.mode.width, self.mode.height
+        return self.width, self.height
+
+    def read(self) -> Tuple[bool, Optional[np.ndarray]]:
+        """Read the next frame.
+
+        Returns:
+            Tuple of (success, BGR frame)
+        """
+        if self.capture is None:
+            return False, None
+        return self.capture.read()
+
+    def isOpened(self) -> bool:
+        """Check if the camera is open (``cv2.VideoCapture`` compatible).
+
+        Returns:
+            True if the camera is open
+        """
+        return self.capture is not None and self.capture.isOpened()
+
+    def release(self) -> None:
+        """Release the camera."""
+        if self.capture is not None:
+            self.capture.release()
+            self.capture = None
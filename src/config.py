@@ -19,7 +19,24 @@ class Config:
         "camera_height": 720,
         "camera_fps": 30,
         "camera_index": 0,
+        "camera_fourcc": "MJPG",
+        "camera_buffer_size": 1,
         "gesture_confidence": 0.8,
+        "detection_mode": "sync",
+        "detection_rate_hz": 15,
+        "detection_workers": 2,
+        "detection_tracking": False,
+        "detection_roi_size": 256,
+        "detector_backend": "solutions",
+        "detector_model_path": None,
+        "max_num_hands": 2,
+        "gesture_classifier_paths": [],
+        "landmark_recording_path": None,
+        "motion_gating": True,
+        "motion_threshold": 0.01,
+        "motion_keepalive_s": 2.0,
+        "adaptive_scheduling": True,
+        "frame_deadline_ms": 33,
         "effect_duration": 3.0,
         "enabled_gestures": {
             "thumbs_up": True,
@@ -30,18 +47,24 @@ class Config:
             "raised_fist": True,
         },
         "virtual_camera_name": "Camera Reactions Virtual Camera",
+        "virtual_camera_format": "auto",
+        "preview_fps": 15,
         "show_debug_overlay": False,
+        "enable_tracing": False,
+        "trace_file": "logs/frame_trace.json",
         "enable_gpu": True,
         "log_level": "INFO",
     }
 
-    def __init__(self, config_file: str = "config.json"):
+    def __init__(self, config_file: str = "config.json", create: bool = True):
         """Initialize configuration manager.
 
         Args:
             config_file: Path to configuration file
+            create: Write a default configuration file if none exists
         """
         self.config_file = Path(config_file)
+        self.create = create
         self.settings: Dict[str, Any] = self.DEFAULT_CONFIG.copy()
         self.load()
 
@@ -58,7 +81,8 @@ class Config:
                 logger.info("Using default configuration")
         else:
             logger.info("Config file not found, using defaults")
-            self.save()  # Create default config file
+            if self.create:
+                self.save()  # Create default config file
 
     def save(self) -> None:
         """Save configuration to file."""
@@ -0,0 +1,299 @@
+"""Interchangeable hand landmark backends.
+
+``GestureDetector`` only needs hand landmarks as a ``(hands, 21, 3)``
+array; this module hides which inference engine produces them. Backends:
+
+- ``solutions``: legacy ``mp.solutions.hands`` graph (default)
+- ``tasks``: MediaPipe Tasks ``HandLandmarker`` (needs a ``.task`` model)
+- ``onnx``: ONNX Runtime on CPU with a hand landmark model
+- ``onnx_int8``: the same with an int8-quantized model
+  (see ``scripts/quantize_landmark_model.py``)
+
+The ONNX backends have no palm detector: they only refine one hand in a
+crop around it, so they cannot search full frames (``finds_hands`` is
+False) and serve as the tracking backend behind a palm-capable one.
+"""
+
+import logging
+import time
+from abc import ABC, abstractmethod
+from typing import List, NamedTuple, Optional
+import cv2
+import numpy as np
+
+from gesture_rules import NUM_LANDMARKS, landmarks_to_array
+
+try:
+    import onnxruntime as ort
+    ONNX_AVAILABLE = True
+except ImportError:
+    ONNX_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Default model files for backends that need one
+DEFAULT_MODEL_PATHS = {
+    "tasks": "models/hand_landmarker.task",
+    "onnx": "models/hand_landmark.onnx",
+    "onnx_int8": "models/hand_landmark_int8.onnx",
+}
+
+
+class HandLandmarks(NamedTuple):
+    """Hands found in one image."""
+
+    landmarks: np.ndarray  # (hands, 21, 3), normalized to the input image
+    handedness: List[str]  # "Left"/"Right" per hand
+
+
+def no_hands() -> HandLandmarks:
+    """Get an empty result.
+
+    Returns:
+        HandLandmarks with zero hands
+    """
+    return HandLandmarks(np.empty((0, NUM_LANDMARKS, 3), dtype=np.float32), [])
+
+
+class HandLandmarkBackend(ABC):
+    """Base class for hand landmark inference engines."""
+
+    name = "base"
+
+    # Whether the backend can locate hands anywhere in a full frame
+    finds_hands = True
+
+    @abstractmethod
+    def process(self, image: np.ndarray) -> HandLandmarks:
+        """Find hand landmarks in an image.
+
+        Args:
+            image: RGB image
+
+        Returns:
+            Landmarks normalized to the image size
+        """
+
+    def close(self) -> None:
+        """Release backend resources."""
+
+
+class SolutionsBackend(HandLandmarkBackend):
+    """Legacy MediaPipe Solutions hand tracking graph."""
+
+    name = "solutions"
+
+    def __init__(
+        self,
+        max_num_hands: int = 2,
+        min_detection_confidence: float = 0.7,
+        min_tracking_confidence: float = 0.5,
+        **kwargs
+    ):
+        """Initialize solutions backend.
+
+        Args:
+            max_num_hands: Maximum number of hands to detect
+            min_detection_confidence: Palm detection threshold
+            min_tracking_confidence: Landmark tracking threshold
+        """
+        # MediaPipe takes seconds to import, so only backends using it do
+        import mediapipe as mp
+
+        self.hands = mp.solutions.hands.Hands(
+            static_image_mode=False,
+            max_num_hands=max_num_hands,
+            min_detection_confidence=min_detection_confidence,
+            min_tracking_confidence=min_tracking_confidence
+        )
+
+    def process(self, image: np.ndarray) -> HandLandmarks:
+        """Find hand landmarks in an image."""
+        results = self.hands.process(image)
+        if not results.multi_hand_landmarks:
+            return no_hands()
+
+        handedness = [
+            hand.classification[0].label for hand in (results.multi_handedness or [])
+        ]
+        return HandLandmarks(landmarks_to_array(results.multi_hand_landmarks), handedness)
+
+    def close(self) -> None:
+        """Release backend resources."""
+        self.hands.close()
+
+
+class TasksBackend(HandLandmarkBackend):
+    """MediaPipe Tasks hand landmarker in video mode."""
+
+    name = "tasks"
+
+    def __init__(
+        self,
+        model_path: Optional[str] = None,
+        max_num_hands: int = 2,
+        min_detection_confidence: float = 0.7,
+        min_tracking_confidence: float = 0.5,
+        **kwargs
+    ):
+        """Initialize tasks backend.
+
+        Args:
+            model_path: Path to a ``hand_landmarker.task`` model bundle
+            max_num_hands: Maximum number of hands to detect
+            min_detection_confidence: Palm detection threshold
+            min_tracking_confidence: Landmark tracking threshold
+        """
+        import mediapipe as mp
+
+        self._mp = mp
+        vision = mp.tasks.vision
+        options = vision.HandLandmarkerOptions(
+            base_options=mp.tasks.BaseOptions(
+                model_asset_path=model_path or DEFAULT_MODEL_PATHS["tasks"]
+            ),
+            running_mode=vision.RunningMode.VIDEO,
+            num_hands=max_num_hands,
+            min_hand_detection_confidence=min_detection_confidence,
+            min_tracking_confidence=min_tracking_confidence
+        )
+        self.landmarker = vision.HandLandmarker.create_from_options(options)
+        self._last_timestamp_ms = -1
+
+    def process(self, image: np.ndarray) -> HandLandmarks:
+        """Find hand landmarks in an image."""
+        # Video mode requires strictly increasing timestamps
+        timestamp_ms = max(int(time.monotonic() * 1000), self._last_timestamp_ms + 1)
+        self._last_timestamp_ms = timestamp_ms
+
+        mp = self._mp
+        mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=np.ascontiguousarray(image))
+        result = self.landmarker.detect_for_video(mp_image, timestamp_ms)
+        if not result.hand_landmarks:
+            return no_hands()
+
+        landmarks = np.array(
+            [[(lm.x, lm.y, lm.z) for lm in hand] for hand in result.hand_landmarks],
+            dtype=np.float32
+        )
+        handedness = [hand[0].category_name for hand in result.handedness]
+        return HandLandmarks(landmarks, handedness)
+
+    def close(self) -> None:
+        """Release backend resources."""
+        self.landmarker.close()
+
+
+class OnnxBackend(HandLandmarkBackend):
+    """CPU ONNX Runtime hand landmark model.
+
+    The model is MediaPipe's hand landmark network exported to ONNX. It
+    has no palm detector, so the whole input is letterboxed into the
+    model as a single hand crop and at most one hand is returned.
+    ``GestureDetector`` therefore only runs it in ``tracking_mode``, on
+    one crop per hand found by a palm-capable search backend. Works
+    unchanged with int8 models produced by
+    ``scripts/quantize_landmark_model.py``.
+    """
+
+    name = "onnx"
+    finds_hands = False
+
+    def __init__(
+        self,
+        model_path: Optional[str] = None,
+        min_detection_confidence: float = 0.7,
+        num_threads: int = 0,
+        **kwargs
+    ):
+        """Initialize ONNX backend.
+
+        Args:
+            model_path: Path to the ``.onnx`` hand landmark model
+            min_detection_confidence: Minimum hand presence score
+            num_threads: Intra-op threads, 0 lets ONNX Runtime decide
+        """
+        if not ONNX_AVAILABLE:
+            raise RuntimeError("ONNX backend requires onnxruntime - install onnxruntime")
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        options.intra_op_num_threads = num_threads
+
+        self.session = ort.InferenceSession(
+            model_path or DEFAULT_MODEL_PATHS[self.name],
+            sess_options=options,
+            providers=["CPUExecutionProvider"]
+        )
+        self.min_detection_confidence = min_detection_confidence
+
+        model_input = self.session.get_inputs()[0]
+        self.input_name = model_input.name
+        self.channels_first = model_input.shape[1] == 3
+        self.input_size = int(model_input.shape[2 if self.channels_first else 1])
+        self._input = np.zeros((self.input_size, self.input_size, 3), dtype=np.float32)
+
+    def process(self, image: np.ndarray) -> HandLandmarks:
+        """Find hand landmarks in an image."""
+        h, w = image.shape[:2]
+        size = self.input_size
+        scale = size / max(h, w)
+        new_w, new_h = max(1, int(w * scale)), max(1, int(h * scale))
+
+        # Letterbox into the square input, normalized to [0, 1]
+        resized = cv2.resize(image, (new_w, new_h), interpolation=cv2.INTER_AREA)
+        self._input.fill(0.0)
+        np.multiply(resized, 1.0 / 255.0, out=self._input[:new_h, :new_w], casting="unsafe")
+
+        tensor = self._input.transpose(2, 0, 1) if self.channels_first else self._input
+        outputs = self.session.run(None, {self.input_name: tensor[np.newaxis]})
+
+        # Outputs: landmarks (1, 63) in input pixels, then the hand
+        # presence and right-handedness scores
+        landmarks = next(out for out in outputs if out.size == NUM_LANDMARKS * 3)
+        scores = [float(out.reshape(-1)[0]) for out in outputs if out.size == 1]
+        presence = scores[0] if scores else 1.0
+        if presence < self.min_detection_confidence:
+            return no_hands()
+
+        hand = landmarks.reshape(NUM_LANDMARKS, 3).astype(np.float32) / scale
+        hand /= np.array([w, h, w], dtype=np.float32)
+        handedness = "Right" if len(scores) > 1 and scores[1] > 0.5 else "Left"
+        return HandLandmarks(hand[np.newaxis], [handedness])
+
+
+class OnnxInt8Backend(OnnxBackend):
+    """ONNX backend with an int8-quantized model."""
+
+    name = "onnx_int8"
+
+
+BACKENDS = {
+    backend.name: backend
+    for backend in (SolutionsBackend, TasksBackend, OnnxBackend, OnnxInt8Backend)
+}
+
+
+def create_backend(name: str = "solutions", full_frame: bool = True, **kwargs) -> HandLandmarkBackend:
+    """Create a hand landmark backend by name.
+
+    Args:
+        name: One of ``BACKENDS``
+        full_frame: Whether the backend will search full frames; crop-only
+            backends are rejected then
+        **kwargs: Backend options (``model_path``, ``max_num_hands``, ...)
+
+    Returns:
+        Initialized backend
+    """
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown detector backend '{name}', expected one of {sorted(BACKENDS)}")
+    if full_frame and not BACKENDS[name].finds_hands:
+        raise ValueError(
+            f"Detector backend '{name}' has no palm detector and cannot search full frames; "
+            f"use it with tracking mode, where it runs on hand crops"
+        )
+
+    backend = BACKENDS[name](**kwargs)
+    logger.info(f"Hand landmark backend: {name}")
+    return backend
@@ -0,0 +1,279 @@
+"""Multi-process gesture detection.
+
+This module runs gesture detectors in separate worker processes so that
+MediaPipe inference does not compete with effect rendering for the GIL.
+Frames are handed to the workers through a ring of
+``multiprocessing.shared_memory`` slots; only the slot index goes over a
+worker's task queue, and only the gestures, confidence and hand count come back.
+Every worker has its own task queue, so the frames a worker that exited
+was holding are known and their slots can be reclaimed.
+"""
+
+import logging
+import multiprocessing as mp
+import queue
+from multiprocessing import shared_memory
+from typing import Callable, Dict, List, Optional, Tuple
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+def _detector_worker(
+    task_queue, result_queue, detector_kwargs: Dict, detector_factory: Optional[Callable] = None
+) -> None:
+    """Worker process entry point.
+
+    Args:
+        task_queue: Queue of ``(seq, slot, shm_name, shape)`` tasks,
+            terminated by ``None``
+        result_queue: Queue receiving ``(seq, slot, gesture, confidence,
+            gestures, hand_count)``
+        detector_kwargs: Keyword arguments for the detector
+        detector_factory: Importable callable creating the detector,
+            ``GestureDetector`` by default
+    """
+    if detector_factory is None:
+        from gesture_detector import GestureDetector
+        detector_factory = GestureDetector
+
+    detector = detector_factory(**detector_kwargs)
+    detector.warm_up()
+    segments: Dict[str, shared_memory.SharedMemory] = {}
+
+    try:
+        while True:
+            task = task_queue.get()
+            if task is None:
+                break
+
+            seq, slot, shm_name, shape = task
+            if shm_name not in segments:
+                segments[shm_name] = shared_memory.SharedMemory(name=shm_name)
+            slots = np.ndarray(shape, dtype=np.uint8, buffer=segments[shm_name].buf)
+
+            try:
+                gesture = detector.detect(slots[slot])
+                confidence = detector.last_confidence
+                gestures = detector.last_gestures
+                hand_count = detector.last_hand_count
+            except Exception as e:
+                logger.error(f"Gesture detection failed in worker: {e}")
+                gesture, confidence, gestures, hand_count = None, 0.0, [], 0
+
+            result_queue.put((seq, slot, gesture, confidence, gestures, hand_count))
+    finally:
+        detector.cleanup()
+        for segment in segments.values():
+            segment.close()
+
+
+class ProcessGestureDetector:
+    """Runs gesture detectors in a pool of worker processes."""
+
+    def __init__(
+        self,
+        confidence_threshold: float = 0.8,
+        num_workers: int = 2,
+        slots_per_worker: int = 2,
+        detector_factory: Optional[Callable] = None,
+        **detector_kwargs
+    ):
+        """Initialize process-based detector.
+
+        Each worker owns its own MediaPipe graph. With several workers,
+        consecutive frames go to different processes, so each graph sees
+        every n-th frame.
+
+        Args:
+            confidence_threshold: Minimum confidence for gesture detection
+            num_workers: Number of detector processes
+            slots_per_worker: Shared-memory frame slots per worker
+            detector_factory: Importable callable creating each worker's
+                detector, ``GestureDetector`` by default
+            **detector_kwargs: Extra keyword arguments for each worker's
+                ``GestureDetector``
+        """
+        self.confidence_threshold = confidence_threshold
+        self.num_workers = max(1, num_workers)
+        self.num_slots = self.num_workers * max(1, slots_per_worker)
+
+        self.last_gesture: Optional[str] = None
+        self.last_confidence: float = 0.0
+        self.last_hand_count = 0
+        self.last_gestures: List = []
+        self._result_gestures: List = []
+
+        self._context = mp.get_context("spawn")
+        self._results = self._context.Queue()
+        self._workers: List = []
+        self._task_queues: List = []
+        # Frames each worker is processing, as {seq: slot}
+        self._pending: List[Dict[int, int]] = []
+
+        self._shm: Optional[shared_memory.SharedMemory] = None
+        self._slots: Optional[np.ndarray] = None
+        self._free_slots: List[int] = []
+        self._next_seq = 0
+        self._newest_seq = -1
+        self._fresh_result = False
+
+        detector_kwargs["confidence_threshold"] = confidence_threshold
+        for i in range(self.num_workers):
+            tasks = self._context.Queue()
+            worker = self._context.Process(
+                target=_detector_worker,
+                args=(tasks, self._results, detector_kwargs, detector_factory),
+                name=f"gesture-detector-{i}",
+                daemon=True
+            )
+            worker.start()
+            self._workers.append(worker)
+            self._task_queues.append(tasks)
+            self._pending.append({})
+
+        logger.info(
+            f"ProcessGestureDetector started ({self.num_workers} workers, "
+            f"{self.num_slots} frame slots)"
+        )
+
+    def _allocate_slots(self, frame_shape: Tuple[int, ...]) -> None:
+        """Create the shared-memory frame ring for a frame shape.
+
+        Args:
+            frame_shape: Shape of the frames to transfer
+        """
+        self._release_slots()
+
+        shape = (self.num_slots,) + tuple(frame_shape)
+        size = int(np.prod(shape))
+        self._shm = shared_memory.SharedMemory(create=True, size=size)
+        self._slots = np.ndarray(shape, dtype=np.uint8, buffer=self._shm.buf)
+        self._free_slots = list(range(self.num_slots))
+
+        logger.debug(f"Allocated shared frame ring {shape} ({size} bytes)")
+
+    def _release_slots(self) -> None:
+        """Free the shared-memory frame ring."""
+        if self._shm is None:
+            return
+
+        self._slots = None
+        self._shm.close()
+        self._shm.unlink()
+        self._shm = None
+        self._free_slots = []
+
+    @property
+    def _in_flight(self) -> int:
+        """Number of frames the workers are processing."""
+        return sum(len(pending) for pending in self._pending)
+
+    def _submit(self, frame: np.ndarray) -> bool:
+        """Copy a frame into a free slot and queue it for an idle worker.
+
+        Args:
+            frame: Input BGR image
+
+        Returns:
+            True if the frame was queued, False if it was dropped
+        """
+        if self._slots is None or self._slots.shape[1:] != frame.shape:
+            if self._in_flight:
+                return False
+            self._allocate_slots(frame.shape)
+
+        idle = [i for i, pending in enumerate(self._pending) if not pending]
+        if not self._free_slots or not idle:
+            return False
+
+        # Rotate through the workers so each graph sees every n-th frame
+        worker = min(idle, key=lambda i: (i - self._next_seq) % len(self._pending))
+        slot = self._free_slots.pop()
+        np.copyto(self._slots[slot], frame)
+        self._task_queues[worker].put((self._next_seq, slot, self._shm.name, self._slots.shape))
+        self._pending[worker][self._next_seq] = slot
+        self._next_seq += 1
+        return True
+
+    def _collect(self) -> None:
+        """Drain finished results and keep the newest one."""
+        while True:
+            try:
+                seq, slot, gesture, confidence, gestures, hand_count = self._results.get_nowait()
+            except queue.Empty:
+                break
+
+            for pending in self._pending:
+                if pending.pop(seq, None) is not None:
+                    self._free_slots.append(slot)
+                    break
+
+            # Results can arrive out of order across workers
+            if seq <= self._newest_seq:
+                continue
+
+            self._newest_seq = seq
+            self.last_gesture = gesture
+            self.last_confidence = confidence
+            self.last_hand_count = hand_count
+            self._result_gestures = gestures
+            self._fresh_result = True
+
+        self._reap_workers()
+
+    def _reap_workers(self) -> None:
+        """Drop workers that exited and reclaim the frame slots they held."""
+        for i in reversed(range(len(self._workers))):
+            worker = self._workers[i]
+            if worker.is_alive():
+                continue
+
+            logger.error(
+                f"Gesture detector worker {worker.name} exited with code {worker.exitcode}; "
+                f"{len(self._workers) - 1} workers left"
+            )
+            self._free_slots.extend(self._pending[i].values())
+            del self._workers[i], self._task_queues[i], self._pending[i]
+
+            if not self._workers:
+                logger.error("All gesture detector workers exited, gesture detection stopped")
+
+    def detect(self, frame: np.ndarray) -> Optional[str]:
+        """Submit a frame and collect the latest finished detection.
+
+        Frames arriving while every worker is busy are dropped. Each
+        detection result is returned once.
+
+        Args:
+            frame: Input BGR image
+
+        Returns:
+            Newly detected gesture name or None; every gesture of that
+            detection is in ``last_gestures``
+        """
+        self._collect()
+        self._submit(frame)
+
+        if not self._fresh_result:
+            self.last_gestures = []
+            return None
+
+        self._fresh_result = False
+        self.last_gestures = self._result_gestures
+        return self.last_gesture
+
+    def cleanup(self) -> None:
+        """Stop worker processes and free shared memory."""
+        for tasks in self._task_queues:
+            tasks.put(None)
+        for worker in self._workers:
+            worker.join(timeout=2.0)
+            if worker.is_alive():
+                worker.terminate()
+        self._workers.clear()
+        self._task_queues.clear()
+        self._pending.clear()
+
+        self._release_slots()
+        logger.info("ProcessGestureDetector cleanup complete")
@@ -0,0 +1,380 @@
+"""Premultiplied effect layer composited onto the camera frame in one pass.
+
+Effects used to draw onto a copy of the frame and alpha-blend that copy
+back, once per effect or even once per particle. Instead, every effect
+now draws into one shared layer holding premultiplied BGR color and an
+alpha plane. Each shape carries its own alpha, which covers per-particle
+fades. The layer is then blended onto the frame once:
+
+    output = color + frame * (1 - alpha)
+
+Shapes are grouped by their (color, alpha) value, so each group is
+drawn with one OpenCV call however many particles it contains. Groups
+accumulate with the premultiplied "over" operator, so a translucent
+shape tints whatever was drawn beneath it instead of replacing it:
+
+    color = src_color + color * (1 - src_alpha)
+    alpha = src_alpha + alpha * (1 - src_alpha)
+
+Every draw call marks the rectangle it touched as dirty. Blending and
+clearing only visit the merged dirty rectangles, so their cost follows
+the area the effects cover rather than the camera resolution.
+"""
+
+import logging
+from typing import Callable, Iterator, List, Optional, Sequence, Tuple, Union
+import cv2
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+Alpha = Union[float, np.ndarray]
+
+# Pixel rectangle as (x0, y0, x1, y1), end exclusive
+Rect = Tuple[int, int, int, int]
+
+# Above this many rectangles, their bounding box is used instead
+MAX_DIRTY_RECTS = 8
+
+# Dirty area, as a fraction of the frame, above which the whole frame is
+# blended in one call
+FULL_FRAME_FRACTION = 0.6
+
+
+def clip_rect(rect: Optional[Rect], width: int, height: int) -> Optional[Rect]:
+    """Clip a rectangle to the frame.
+
+    Args:
+        rect: Rectangle, or None
+        width: Frame width in pixels
+        height: Frame height in pixels
+
+    Returns:
+        Clipped rectangle, or None if nothing of it is inside the frame
+    """
+    if rect is None:
+        return None
+    x0, y0, x1, y1 = rect
+    x0, y0 = max(int(x0), 0), max(int(y0), 0)
+    x1, y1 = min(int(x1), width), min(int(y1), height)
+    if x0 >= x1 or y0 >= y1:
+        return None
+    return x0, y0, x1, y1
+
+
+def merge_rects(rects: Sequence[Rect]) -> List[Rect]:
+    """Merge overlapping rectangles until no two overlap.
+
+    Args:
+        rects: Rectangles
+
+    Returns:
+        Disjoint rectangles covering all input rectangles
+    """
+    merged = list(rects)
+    changed = True
+    while changed:
+        changed = False
+        for i in range(len(merged)):
+            for j in range(i + 1, len(merged)):
+                a, b = merged[i], merged[j]
+                if a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]:
+                    merged[i] = (min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3]))
+                    del merged[j]
+                    changed = True
+                    break
+            if changed:
+                break
+
+    if len(merged) > MAX_DIRTY_RECTS:
+        merged = [(
+            min(r[0] for r in merged), min(r[1] for r in merged),
+            max(r[2] for r in merged), max(r[3] for r in merged),
+        )]
+    return merged
+
+
+def polygon_bounds(points: np.ndarray, pad: int = 0) -> Rect:
+    """Get the bounding rectangle of polygon vertices.
+
+    Args:
+        points: Integer vertices of shape (..., 2)
+        pad: Pixels added on every side (e.g. for line thickness)
+
+    Returns:
+        Bounding rectangle
+    """
+    flat = points.reshape(-1, 2)
+    low = flat.min(axis=0) - pad
+    high = flat.max(axis=0) + pad + 1
+    return int(low[0]), int(low[1]), int(high[0]), int(high[1])
+
+
+def _premultiplied(colors: np.ndarray, alpha: Alpha) -> np.ndarray:
+    """Convert colors and alphas to premultiplied 8-bit BGRA values.
+
+    Args:
+        colors: BGR colors of shape (shapes, 3)
+        alpha: Opacity from 0.0 to 1.0, scalar or per shape
+
+    Returns:
+        Values of shape (shapes, 4)
+    """
+    colors = np.asarray(colors, dtype=np.float32).reshape(-1, 3)
+    alpha = np.clip(np.broadcast_to(np.asarray(alpha, dtype=np.float32), len(colors)), 0.0, 1.0)
+
+    values = np.empty((len(colors), 4), dtype=np.float32)
+    values[:, :3] = colors * alpha[:, np.newaxis]
+    values[:, 3] = alpha * 255
+    return np.rint(values).astype(np.uint8)
+
+
+def _groups(colors: np.ndarray, alpha: Alpha) -> Iterator[Tuple[np.ndarray, list, int]]:
+    """Group shapes by their premultiplied value.
+
+    Args:
+        colors: BGR colors of shape (shapes, 3)
+        alpha: Opacity, scalar or per shape
+
+    Yields:
+        Tuple of (shape mask, premultiplied color, alpha value)
+    """
+    values = _premultiplied(colors, alpha)
+    unique, inverse = np.unique(values, axis=0, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    for i, value in enumerate(unique):
+        if value[3] == 0:
+            continue  # fully transparent
+        yield inverse == i, value[:3].tolist(), int(value[3])
+
+
+class EffectLayer:
+    """Premultiplied BGRA drawing surface for effects."""
+
+    def __init__(self, width: int, height: int):
+        """Initialize a cleared effect layer.
+
+        Args:
+            width: Layer width in pixels
+            height: Layer height in pixels
+        """
+        self.width = width
+        self.height = height
+        self.color = np.zeros((height, width, 3), dtype=np.uint8)  # premultiplied BGR
+        self.alpha = np.zeros((height, width), dtype=np.uint8)
+        self._alpha3 = np.empty((height, width, 3), dtype=np.uint8)
+        # Scratch planes a translucent group is drawn into before blending
+        self._src_color = np.zeros((height, width, 3), dtype=np.uint8)
+        self._src_alpha = np.zeros((height, width), dtype=np.uint8)
+        self._dirty: List[Rect] = []
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        """Layer (height, width)."""
+        return self.height, self.width
+
+    def mark_dirty(self, rect: Optional[Rect]) -> None:
+        """Record a rectangle that was drawn into.
+
+        Args:
+            rect: Touched rectangle; clipped to the layer
+        """
+        rect = clip_rect(rect, self.width, self.height)
+        if rect is not None:
+            self._dirty.append(rect)
+
+    def dirty_rects(self) -> List[Rect]:
+        """Get the merged rectangles drawn into since the last clear.
+
+        Returns:
+            Disjoint dirty rectangles, or one full-frame rectangle when
+            they cover most of the layer
+        """
+        rects = merge_rects(self._dirty)
+        area = sum((x1 - x0) * (y1 - y0) for x0, y0, x1, y1 in rects)
+        if area > FULL_FRAME_FRACTION * self.width * self.height:
+            rects = [(0, 0, self.width, self.height)]
+        self._dirty = rects
+        return rects
+
+    @property
+    def is_empty(self) -> bool:
+        """Whether nothing was drawn since the last clear."""
+        return not self._dirty
+
+    def clear(self) -> None:
+        """Make the layer transparent, touching only dirty rectangles."""
+        for x0, y0, x1, y1 in self.dirty_rects():
+            self.color[y0:y1, x0:x1] = 0
+            self.alpha[y0:y1, x0:x1] = 0
+        self._dirty = []
+
+    def _draw_over(
+        self,
+        rect: Rect,
+        color: list,
+        alpha: int,
+        draw: Callable[[np.ndarray, Union[list, int]], None]
+    ) -> None:
+        """Composite one group of shapes over the layer.
+
+        Opaque groups are drawn straight into the layer. Translucent ones
+        are drawn into the scratch planes and blended over the layer
+        within ``rect``.
+
+        Args:
+            rect: Rectangle containing every pixel ``draw`` touches
+            color: Premultiplied BGR value
+            alpha: Alpha value from 1 to 255
+            draw: Draws the shapes into an image with a given value
+        """
+        rect = clip_rect(rect, self.width, self.height)
+        if rect is None:
+            return
+        self._dirty.append(rect)
+
+        if alpha == 255:
+            draw(self.color, color)
+            draw(self.alpha, alpha)
+            return
+
+        x0, y0, x1, y1 = rect
+        src_color = self._src_color[y0:y1, x0:x1]
+        src_alpha = self._src_alpha[y0:y1, x0:x1]
+        src_color[:] = 0
+        src_alpha[:] = 0
+        draw(self._src_color, color)
+        draw(self._src_alpha, alpha)
+
+        inverse = self._alpha3[y0:y1, x0:x1]
+        dst_color = self.color[y0:y1, x0:x1]
+        dst_alpha = self.alpha[y0:y1, x0:x1]
+        cv2.cvtColor(src_alpha, cv2.COLOR_GRAY2BGR, dst=inverse)
+        cv2.bitwise_not(inverse, dst=inverse)
+        cv2.multiply(dst_color, inverse, dst=dst_color, scale=1.0 / 255)
+        cv2.add(dst_color, src_color, dst=dst_color)
+        cv2.multiply(dst_alpha, inverse[:, :, 0], dst=dst_alpha, scale=1.0 / 255)
+        cv2.add(dst_alpha, src_alpha, dst=dst_alpha)
+
+    def fill_polys(self, polygons: np.ndarray, colors: np.ndarray, alpha: Alpha = 1.0) -> None:
+        """Fill polygons.
+
+        Args:
+            polygons: Integer vertices of shape (shapes, vertices, 2)
+            colors: BGR color per polygon, shape (shapes, 3)
+            alpha: Opacity, scalar or per polygon
+        """
+        for mask, color, a in _groups(colors, alpha):
+            group = polygons[mask]
+            self._draw_over(
+                polygon_bounds(group), color, a,
+                lambda image, value: cv2.fillPoly(image, group, value)
+            )
+
+    def polylines(
+        self,
+        lines: np.ndarray,
+        colors: np.ndarray,
+        alpha: Alpha = 1.0,
+        thickness: int = 1,
+        closed: bool = False
+    ) -> None:
+        """Draw polylines, such as line segments of shape (lines, 2, 2).
+
+        Args:
+            lines: Integer vertices of shape (lines, vertices, 2)
+            colors: BGR color per line, shape (lines, 3)
+            alpha: Opacity, scalar or per line
+            thickness: Line thickness in pixels
+            closed: Connect the last vertex back to the first
+        """
+        for mask, color, a in _groups(colors, alpha):
+            group = lines[mask]
+            self._draw_over(
+                polygon_bounds(group, pad=thickness), color, a,
+                lambda image, value: cv2.polylines(image, group, closed, value, thickness)
+            )
+
+    def circle(
+        self,
+        center: Tuple[int, int],
+        radius: int,
+        color: Sequence[int],
+        alpha: float = 1.0,
+        thickness: int = -1
+    ) -> None:
+        """Draw a circle.
+
+        Args:
+            center: Center in pixels
+            radius: Radius in pixels
+            color: BGR color
+            alpha: Opacity
+            thickness: Outline thickness, -1 to fill
+        """
+        pad = radius + max(thickness, 1)
+        rect = (center[0] - pad, center[1] - pad, center[0] + pad + 1, center[1] + pad + 1)
+        for _, value, a in _groups(np.array([color]), alpha):
+            self._draw_over(
+                rect, value, a,
+                lambda image, v: cv2.circle(image, center, radius, v, thickness)
+            )
+
+    def text(
+        self,
+        text: str,
+        origin: Tuple[int, int],
+        font_scale: float,
+        color: Sequence[int],
+        alpha: float = 1.0,
+        thickness: int = 1,
+        font: int = cv2.FONT_HERSHEY_SIMPLEX
+    ) -> None:
+        """Draw text.
+
+        Args:
+            text: Text to draw
+            origin: Bottom-left corner of the text in pixels
+            font_scale: OpenCV font scale
+            color: BGR color
+            alpha: Opacity
+            thickness: Stroke thickness
+            font: OpenCV font face
+        """
+        (text_w, text_h), baseline = cv2.getTextSize(text, font, font_scale, thickness)
+        x, y = origin
+        rect = (
+            x - thickness, y - text_h - thickness,
+            x + text_w + thickness + 1, y + baseline + thickness + 1
+        )
+        for _, value, a in _groups(np.array([color]), alpha):
+            self._draw_over(
+                rect, value, a,
+                lambda image, v: cv2.putText(image, text, origin, font, font_scale, v, thickness)
+            )
+
+    def composite(self, frame: np.ndarray, out: np.ndarray) -> np.ndarray:
+        """Blend the layer over a frame.
+
+        Only the dirty rectangles are blended; elsewhere ``out`` receives
+        the frame unchanged.
+
+        Args:
+            frame: BGR frame of the layer's size
+            out: Output buffer, may be ``frame`` itself
+
+        Returns:
+            ``out`` holding the composited frame
+        """
+        if out is not frame:
+            np.copyto(out, frame)
+
+        # frame * (1 - alpha) + premultiplied color, all in 8 bits
+        for x0, y0, x1, y1 in self.dirty_rects():
+            inverse = self._alpha3[y0:y1, x0:x1]
+            region = out[y0:y1, x0:x1]
+            cv2.cvtColor(self.alpha[y0:y1, x0:x1], cv2.COLOR_GRAY2BGR, dst=inverse)
+            cv2.bitwise_not(inverse, dst=inverse)
+            cv2.multiply(region, inverse, dst=region, scale=1.0 / 255)
+            cv2.add(region, self.color[y0:y1, x0:x1], dst=region)
+        return out
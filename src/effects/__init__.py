@@ -1,17 +1,28 @@
-"""Animation effects for Camera Reactions."""
+"""Animation effects for Camera Reactions.
+
+Effect classes are imported on first access, so importing the package
+(or a single effect module) does not load every effect.
+"""
+
+import importlib
 
 from .base_effect import BaseEffect
-from .hearts import HeartsEffect
-from .confetti import ConfettiEffect
-from .balloons import BalloonsEffect
-from .thumbs import ThumbsEffect
-from .lasers import LasersEffect
 
-__all__ = [
-    "BaseEffect",
-    "HeartsEffect",
-    "ConfettiEffect",
-    "BalloonsEffect",
-    "ThumbsEffect",
-    "LasersEffect",
-]
+# Effect class name -> module within this package
+_EFFECT_MODULES = {
+    "HeartsEffect": "hearts",
+    "ConfettiEffect": "confetti",
+    "BalloonsEffect": "balloons",
+    "ThumbsEffect": "thumbs",
+    "LasersEffect": "lasers",
+}
+
+__all__ = ["BaseEffect", *_EFFECT_MODULES]
+
+
+def __getattr__(name):
+    """Import effect classes on first access."""
+    if name in _EFFECT_MODULES:
+        module = importlib.import_module(f".{_EFFECT_MODULES[name]}", __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,36 +1,56 @@
 """Balloon animation effect - simplified implementation."""
 
-import cv2
+from typing import Optional
 import numpy as np
-import random
+from effect_layer import EffectLayer
 from .base_effect import BaseEffect
+from .particle_system import ParticleSystem, circle_template, transform_polygons
+
+BALLOON_SHAPE = circle_template(24)
+STRING_COLOR = (150, 150, 150)
+STRING_LENGTH = 20
+NUM_COLORS = 8
 
 
 class BalloonsEffect(BaseEffect):
     """Rising balloons animation."""
 
-    def __init__(self, duration: float = 3.0, num_balloons: int = 10):
-        super().__init__(duration)
+    def __init__(self, duration: float = 3.0, num_balloons: int = 10, seed: Optional[int] = None):
+        super().__init__(duration, seed)
         self.num_balloons = num_balloons
-        self.balloons = [
-            {
-                'x': random.uniform(0.1, 0.9),
-                'y': random.uniform(0.7, 1.0),
-                'size': random.randint(30, 60),
-                'speed': random.uniform(0.2, 0.5),
-                'color': (random.randint(100, 255), random.randint(100, 255), random.randint(100, 255))
-            }
-            for _ in range(num_balloons)
-        ]
-
-    def render(self, frame: np.ndarray, progress: float) -> np.ndarray:
-        height, width = frame.shape[:2]
-        for balloon in self.balloons:
-            y_pos = balloon['y'] - balloon['speed'] * progress
-            if y_pos < 0:
-                continue
-            px, py = int(balloon['x'] * width), int(y_pos * height)
-            if 0 <= px < width and 0 <= py < height:
-                cv2.circle(frame, (px, py), balloon['size'], balloon['color'], -1)
-                cv2.line(frame, (px, py + balloon['size']), (px, py + balloon['size'] + 20), (150, 150, 150), 2)
-        return frame
+
+        rng = self.rng
+        n = num_balloons
+        self.balloons = ParticleSystem(n, rng.integers(100, 256, (NUM_COLORS, 3)))
+        self.balloons.x0[:] = rng.uniform(0.1, 0.9, n)
+        self.balloons.y0[:] = rng.uniform(0.7, 1.0, n)
+        self.balloons.vy[:] = -rng.uniform(0.2, 0.5, n)
+        self.balloons.size[:] = rng.integers(30, 61, n)
+        self.balloons.color[:] = rng.integers(0, NUM_COLORS, n)
+
+    def _visible(self, width: int, height: int, progress: float):
+        count = self._visible_count(len(self.balloons))
+        return self._per_frame(
+            (width, height, progress, count),
+            lambda: self.balloons.visible(progress, width, height, count)
+        )
+
+    def bounds(self, width: int, height: int, progress: float):
+        return self.balloons.frame_bounds(
+            self._visible(width, height, progress), pad=STRING_LENGTH + 2
+        )
+
+    def draw(self, layer: EffectLayer, progress: float) -> None:
+        balloons = self.balloons
+        visible = self._visible(layer.width, layer.height, progress)
+        size = balloons.size[visible.index]
+
+        # Strings first, so balloons cover their top ends
+        strings = np.empty((len(size), 2, 2), dtype=np.int32)
+        strings[:, :, 0] = visible.x[:, np.newaxis]
+        strings[:, 0, 1] = visible.y + size
+        strings[:, 1, 1] = visible.y + size + STRING_LENGTH
+        layer.polylines(strings, np.tile(STRING_COLOR, (len(size), 1)), thickness=2)
+
+        polygons = transform_polygons(BALLOON_SHAPE, visible.x, visible.y, size)
+        layer.fill_polys(polygons, balloons.palette[balloons.color[visible.index]])
@@ -1,33 +1,113 @@
 """Base class for animation effects."""
 
 from abc import ABC, abstractmethod
+from typing import Any, Callable, Hashable, Optional
 import numpy as np
 
+from effect_layer import EffectLayer, Rect, clip_rect
+
 
 class BaseEffect(ABC):
     """Abstract base class for visual effects."""
 
-    def __init__(self, duration: float = 3.0):
+    def __init__(self, duration: float = 3.0, seed: Optional[int] = None):
         """Initialize effect.
 
         Args:
             duration: Effect duration in seconds
+            seed: Seed for the effect's random layout, None for a fresh one
         """
         self.duration = duration
+        self.rng = np.random.default_rng(seed)
+        self.quality = 1.0
+        self._layer: Optional[EffectLayer] = None
+
+        # Value shared by bounds() and draw() of the same frame
+        self._frame_key: Optional[Hashable] = None
+        self._frame_value: Any = None
 
     @abstractmethod
+    def draw(self, layer: EffectLayer, progress: float) -> None:
+        """Draw effect into the shared effect layer.
+
+        Args:
+            layer: Effect layer of the frame's size
+            progress: Animation progress from 0.0 to 1.0
+        """
+        pass
+
+    def bounds(self, width: int, height: int, progress: float) -> Optional[Rect]:
+        """Get the rectangle the effect draws into.
+
+        ``AnimationEngine`` skips effects whose bounds are None or lie
+        outside the frame. Override with a cheap estimate; it may be
+        larger than the drawn area but never smaller.
+
+        Args:
+            width: Frame width in pixels
+            height: Frame height in pixels
+            progress: Animation progress from 0.0 to 1.0
+
+        Returns:
+            Rectangle as (x0, y0, x1, y1), or None if nothing is drawn
+        """
+        return 0, 0, width, height
+
     def render(self, frame: np.ndarray, progress: float) -> np.ndarray:
-        """Render effect on frame.
+        """Render effect on its own onto a frame.
+
+        ``AnimationEngine`` draws all effects into one layer and blends it
+        once; this renders a single effect the same way.
 
         Args:
-            frame: Input BGR image
+            frame: Input BGR image, modified in place
             progress: Animation progress from 0.0 to 1.0
 
         Returns:
             Frame with effect rendered
         """
-        pass
+        height, width = frame.shape[:2]
+        if clip_rect(self.bounds(width, height, progress), width, height) is None:
+            return frame
+
+        if self._layer is None or self._layer.shape != (height, width):
+            self._layer = EffectLayer(width, height)
+
+        self._layer.clear()
+        self.draw(self._layer, progress)
+        return self._layer.composite(frame, frame)
+
+    def _per_frame(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Compute a value once per frame.
+
+        ``AnimationEngine`` calls ``bounds()`` and then ``draw()`` for the
+        same frame, so work both need, such as finding the visible
+        particles, is done once and reused.
+
+        Args:
+            key: Frame description the value depends on (size, progress, ...)
+            compute: Computes the value when the key changes
+
+        Returns:
+            Value for ``key``
+        """
+        if key != self._frame_key:
+            self._frame_value = compute()
+            self._frame_key = key
+        return self._frame_value
+
+    def _visible_count(self, count: int) -> int:
+        """Number of elements to draw at the current quality level.
+
+        Args:
+            count: Element count at full quality
+
+        Returns:
+            Element count scaled by quality, at least 1 if count > 0
+        """
+        return min(count, max(1, int(round(count * self.quality)))) if count else 0
 
     def cleanup(self) -> None:
         """Clean up resources. Override if needed."""
-        pass
+        self._frame_key = None
+        self._frame_value = None
@@ -1,151 +1,114 @@
 """Confetti and fireworks animation effect."""
 
-import cv2
+from typing import Optional
 import numpy as np
-import random
+from effect_layer import EffectLayer
 from .base_effect import BaseEffect
+from .particle_system import (
+    ParticleSystem, circle_template, polygon_template, transform_polygons
+)
+
+COLORS = [
+    (0, 0, 255),    # Red
+    (0, 255, 0),    # Green
+    (255, 0, 0),    # Blue
+    (0, 255, 255),  # Yellow
+    (255, 0, 255),  # Magenta
+    (255, 255, 0),  # Cyan
+]
+
+# Particle shapes, as templates drawn at `size` scale
+RECT, CIRCLE, STAR = 0, 1, 2
+SHAPES = {
+    # size x size/2 rectangle
+    RECT: np.array([[-0.5, -0.25], [0.5, -0.25], [0.5, 0.25], [-0.5, 0.25]], dtype=np.float32),
+    CIRCLE: circle_template(12) * 0.5,
+    # 5-pointed star alternating outer and inner radius
+    STAR: polygon_template(np.arange(10) * 36.0, np.tile([1.0, 0.5], 5)),
+}
+
+GRAVITY = 0.5  # frame heights per second squared
 
 
 class ConfettiEffect(BaseEffect):
     """Confetti and fireworks celebration effect."""
 
-    def __init__(self, duration: float = 3.0, num_particles: int = 100):
+    def __init__(self, duration: float = 3.0, num_particles: int = 100, seed: Optional[int] = None):
         """Initialize confetti effect.
 
         Args:
             duration: Effect duration
             num_particles: Number of confetti particles
+            seed: Random seed for the particle layout
         """
-        super().__init__(duration)
+        super().__init__(duration, seed)
         self.num_particles = num_particles
-        self.particles = []
-        self._initialize_particles()
-
-    def _initialize_particles(self) -> None:
-        """Initialize confetti particles."""
-        colors = [
-            (0, 0, 255),    # Red
-            (0, 255, 0),    # Green
-            (255, 0, 0),    # Blue
-            (0, 255, 255),  # Yellow
-            (255, 0, 255),  # Magenta
-            (255, 255, 0),  # Cyan
-        ]
-
-        for _ in range(self.num_particles):
-            self.particles.append({
-                'x': random.uniform(0.2, 0.8),
-                'y': random.uniform(0.3, 0.5),  # Start from middle-top
-                'vx': random.uniform(-0.5, 0.5),  # Horizontal velocity
-                'vy': random.uniform(-1.0, -0.3),  # Upward velocity
-                'rotation': random.uniform(0, 360),
-                'rotation_speed': random.uniform(-10, 10),
-                'size': random.randint(5, 15),
-                'color': random.choice(colors),
-                'shape': random.choice(['rect', 'circle', 'star'])
-            })
-
-    def _draw_particle(
-        self,
-        frame: np.ndarray,
-        x: int,
-        y: int,
-        size: int,
-        color: tuple,
-        rotation: float,
-        shape: str,
-        alpha: float = 1.0
-    ) -> np.ndarray:
-        """Draw a confetti particle.
+        self.particles = self._initialize_particles()
 
-        Args:
-            frame: Input frame
-            x, y: Particle position
-            size: Particle size
-            color: BGR color
-            rotation: Rotation angle in degrees
-            shape: Shape type ('rect', 'circle', 'star')
-            alpha: Opacity
+    def _initialize_particles(self) -> ParticleSystem:
+        """Initialize confetti particles.
 
         Returns:
-            Frame with particle drawn
+            Particle system launched upward from the middle-top under gravity
         """
-        overlay = frame.copy()
-
-        if shape == 'circle':
-            cv2.circle(overlay, (x, y), size // 2, color, -1)
-        elif shape == 'rect':
-            # Draw rotated rectangle
-            pts = cv2.boxPoints(((x, y), (size, size // 2), rotation))
-            pts = np.int0(pts)
-            cv2.fillPoly(overlay, [pts], color)
-        elif shape == 'star':
-            # Simple star shape
-            angle_step = 72  # 5-pointed star
-            outer_r = size
-            inner_r = size // 2
-            pts = []
-            for i in range(10):
-                angle = rotation + i * angle_step / 2
-                r = outer_r if i % 2 == 0 else inner_r
-                px = x + int(r * np.cos(np.radians(angle)))
-                py = y + int(r * np.sin(np.radians(angle)))
-                pts.append([px, py])
-            pts = np.array(pts, np.int32)
-            cv2.fillPoly(overlay, [pts], color)
-
-        # Apply alpha blending
-        cv2.addWeighted(overlay, alpha, frame, 1 - alpha, 0, frame)
-
-        return frame
-
-    def render(self, frame: np.ndarray, progress: float) -> np.ndarray:
-        """Render confetti effect.
+        rng = self.rng
+        n = self.num_particles
+
+        particles = ParticleSystem(n, COLORS)
+        particles.x0[:] = rng.uniform(0.2, 0.8, n)
+        particles.y0[:] = rng.uniform(0.3, 0.5, n)
+        particles.vx[:] = rng.uniform(-0.5, 0.5, n)
+        particles.vy[:] = rng.uniform(-1.0, -0.3, n)
+        particles.ay[:] = GRAVITY
+        particles.rotation0[:] = rng.uniform(0, 360, n)
+        # Up to 10 turns over the whole animation, in degrees per second
+        particles.spin[:] = rng.uniform(-10, 10, n) * 360 / self.duration
+        particles.size[:] = rng.integers(5, 16, n)
+        particles.color[:] = rng.integers(0, len(COLORS), n)
+        particles.kind[:] = rng.integers(0, len(SHAPES), n)
+        return particles
+
+    def _visible(self, width: int, height: int, progress: float):
+        """Get the visible confetti, evaluated once per frame."""
+        count = self._visible_count(len(self.particles))
+        return self._per_frame(
+            (width, height, progress, count),
+            lambda: self.particles.visible(progress * self.duration, width, height, count)
+        )
+
+    def bounds(self, width: int, height: int, progress: float):
+        """Get the rectangle covering the visible confetti."""
+        return self.particles.frame_bounds(self._visible(width, height, progress))
+
+    def draw(self, layer: EffectLayer, progress: float) -> None:
+        """Draw confetti effect.
 
         Args:
-            frame: Input frame
+            layer: Effect layer
             progress: Animation progress (0.0 to 1.0)
-
-        Returns:
-            Frame with confetti rendered
         """
-        height, width = frame.shape[:2]
-        gravity = 0.5  # Gravity effect
-
-        for particle in self.particles:
-            # Physics simulation
-            t = progress * self.duration
-
-            # Update position with gravity
-            x = particle['x'] + particle['vx'] * t
-            y = particle['y'] + particle['vy'] * t + 0.5 * gravity * t**2
-
-            # Update rotation
-            rotation = particle['rotation'] + particle['rotation_speed'] * progress * 360
-
-            # Fade out at end
-            if progress > 0.8:
-                alpha = (1.0 - progress) / 0.2
-            else:
-                alpha = 1.0
-
-            # Convert to pixel coordinates
-            px = int(x * width)
-            py = int(y * height)
-
-            # Draw if on screen
-            if 0 <= px < width and 0 <= py < height:
-                frame = self._draw_particle(
-                    frame, px, py,
-                    particle['size'],
-                    particle['color'],
-                    rotation,
-                    particle['shape'],
-                    alpha
-                )
-
-        return frame
+        # Fade out at end
+        if progress > 0.8:
+            alpha = (1.0 - progress) / 0.2
+        else:
+            alpha = 1.0
+
+        particles = self.particles
+        visible = self._visible(layer.width, layer.height, progress)
+        kinds = particles.kind[visible.index]
+
+        for kind, template in SHAPES.items():
+            mask = kinds == kind
+            if not mask.any():
+                continue
+            index = visible.index[mask]
+            polygons = transform_polygons(
+                template, visible.x[mask], visible.y[mask],
+                particles.size[index], visible.rotation[mask]
+            )
+            layer.fill_polys(polygons, particles.palette[particles.color[index]], alpha)
 
     def cleanup(self) -> None:
         """Clean up confetti effect."""
-        self.particles.clear()
+        super().cleanup()
+        self.particles = ParticleSystem(0, COLORS)
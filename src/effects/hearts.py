@@ -1,128 +1,99 @@
 """Hearts animation effect."""
 
-import cv2
+from typing import Optional
 import numpy as np
-import random
+from effect_layer import EffectLayer
 from .base_effect import BaseEffect
+from .particle_system import ParticleSystem, transform_polygons
+
+# Parametric heart curve, drawn at size / 20 scale
+_T = np.radians(np.arange(0, 360, 10))
+HEART_SHAPE = np.stack([
+    16 * np.sin(_T) ** 3,
+    -(13 * np.cos(_T) - 5 * np.cos(2 * _T) - 2 * np.cos(3 * _T) - np.cos(4 * _T)),
+], axis=1).astype(np.float32)
+
+# Number of heart colors; hearts are filled one color at a time
+NUM_COLORS = 8
 
 
 class HeartsEffect(BaseEffect):
     """Floating hearts animation."""
 
-    def __init__(self, duration: float = 3.0, num_hearts: int = 20):
+    def __init__(self, duration: float = 3.0, num_hearts: int = 20, seed: Optional[int] = None):
         """Initialize hearts effect.
 
         Args:
             duration: Effect duration
             num_hearts: Number of hearts to render
+            seed: Random seed for the heart layout
         """
-        super().__init__(duration)
+        super().__init__(duration, seed)
         self.num_hearts = num_hearts
-        self.hearts = []
-        self._initialize_hearts()
-
-    def _initialize_hearts(self) -> None:
-        """Initialize heart particles."""
-        for _ in range(self.num_hearts):
-            self.hearts.append({
-                'x': random.random(),  # Normalized position (0-1)
-                'y': random.random(),
-                'size': random.randint(20, 60),
-                'speed': random.uniform(0.3, 0.8),
-                'phase': random.uniform(0, 2 * np.pi),  # For horizontal wobble
-                'color': (random.randint(200, 255), random.randint(50, 150), random.randint(150, 255))
-            })
-
-    def _draw_heart(
-        self,
-        frame: np.ndarray,
-        center_x: int,
-        center_y: int,
-        size: int,
-        color: tuple,
-        alpha: float = 1.0
-    ) -> np.ndarray:
-        """Draw a heart shape on the frame.
+        self.hearts = self._initialize_hearts()
 
-        Args:
-            frame: Input frame
-            center_x: Heart center X coordinate
-            center_y: Heart center Y coordinate
-            size: Heart size
-            color: BGR color tuple
-            alpha: Opacity (0.0 to 1.0)
+    def _initialize_hearts(self) -> ParticleSystem:
+        """Initialize heart particles.
 
         Returns:
-            Frame with heart drawn
+            Particle system with hearts rising over the animation
         """
-        # Create overlay for alpha blending
-        overlay = frame.copy()
-
-        # Heart shape using Bezier curves approximation
-        pts = []
-        for angle in range(0, 360, 10):
-            t = np.radians(angle)
-            # Heart curve parametric equation
-            x = 16 * np.sin(t)**3
-            y = -(13 * np.cos(t) - 5 * np.cos(2*t) - 2 * np.cos(3*t) - np.cos(4*t))
-
-            # Scale and translate
-            px = int(center_x + (x * size / 20))
-            py = int(center_y + (y * size / 20))
-            pts.append([px, py])
-
-        pts = np.array(pts, np.int32)
-
-        # Draw filled heart
-        cv2.fillPoly(overlay, [pts], color)
-
-        # Apply alpha blending
-        cv2.addWeighted(overlay, alpha, frame, 1 - alpha, 0, frame)
-
-        return frame
-
-    def render(self, frame: np.ndarray, progress: float) -> np.ndarray:
-        """Render hearts effect.
+        rng = self.rng
+        n = self.num_hearts
+        palette = np.stack([
+            rng.integers(200, 256, NUM_COLORS),
+            rng.integers(50, 151, NUM_COLORS),
+            rng.integers(150, 256, NUM_COLORS),
+        ], axis=1)
+
+        hearts = ParticleSystem(n, palette)
+        # Start anywhere and rise by `speed` frame heights over the animation
+        hearts.x0[:] = rng.random(n)
+        hearts.y0[:] = 1.0 - rng.random(n)
+        hearts.vy[:] = -rng.uniform(0.3, 0.8, n)
+        # Horizontal wobble, two periods per animation
+        hearts.wobble[:] = 0.05
+        hearts.wobble_rate[:] = 4 * np.pi
+        hearts.phase[:] = rng.uniform(0, 2 * np.pi, n)
+        hearts.size[:] = rng.integers(20, 61, n)
+        hearts.color[:] = rng.integers(0, NUM_COLORS, n)
+        return hearts
+
+    def _visible(self, width: int, height: int, progress: float):
+        """Get the visible hearts, evaluated once per frame."""
+        count = self._visible_count(len(self.hearts))
+        return self._per_frame(
+            (width, height, progress, count),
+            lambda: self.hearts.visible(progress, width, height, count)
+        )
+
+    def bounds(self, width: int, height: int, progress: float):
+        """Get the rectangle covering the visible hearts."""
+        return self.hearts.frame_bounds(self._visible(width, height, progress))
+
+    def draw(self, layer: EffectLayer, progress: float) -> None:
+        """Draw hearts effect.
 
         Args:
-            frame: Input frame
+            layer: Effect layer
             progress: Animation progress (0.0 to 1.0)
-
-        Returns:
-            Frame with hearts rendered
         """
-        height, width = frame.shape[:2]
-
-        for heart in self.hearts:
-            # Calculate position with upward movement and horizontal wobble
-            y_pos = heart['y'] + heart['speed'] * progress
-            x_wobble = 0.05 * np.sin(heart['phase'] + progress * 4 * np.pi)
-            x_pos = heart['x'] + x_wobble
-
-            # Wrap around if off screen
-            if y_pos < 0:
-                y_pos += 1.0
-
-            # Convert to pixel coordinates
-            px = int(x_pos * width)
-            py = int((1.0 - y_pos) * height)  # Flip Y (0 at bottom)
-
-            # Fade in/out
-            if progress < 0.2:
-                alpha = progress / 0.2
-            elif progress > 0.8:
-                alpha = (1.0 - progress) / 0.2
-            else:
-                alpha = 1.0
-
-            # Draw heart if on screen
-            if 0 <= px < width and 0 <= py < height:
-                frame = self._draw_heart(
-                    frame, px, py, heart['size'], heart['color'], alpha
-                )
-
-        return frame
+        # Fade in/out
+        if progress < 0.2:
+            alpha = progress / 0.2
+        elif progress > 0.8:
+            alpha = (1.0 - progress) / 0.2
+        else:
+            alpha = 1.0
+
+        hearts = self.hearts
+        visible = self._visible(layer.width, layer.height, progress)
+        polygons = transform_polygons(
+            HEART_SHAPE, visible.x, visible.y, hearts.size[visible.index] / 20
+        )
+        layer.fill_polys(polygons, hearts.palette[hearts.color[visible.index]], alpha)
 
     def cleanup(self) -> None:
         """Clean up hearts effect."""
-        self.hearts.clear()
+        super().cleanup()
+        self.hearts = ParticleSystem(0, self.hearts.palette)
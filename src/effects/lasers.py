@@ -1,45 +1,63 @@
 """Laser beams animation effect."""
 
-import cv2
+from typing import Optional
 import numpy as np
-import random
+from effect_layer import EffectLayer, polygon_bounds
 from .base_effect import BaseEffect
+from .particle_system import ParticleSystem
+
+NUM_COLORS = 8
+BEAM_THICKNESS = 3
 
 
 class LasersEffect(BaseEffect):
     """Laser beams shooting effect."""
 
-    def __init__(self, duration: float = 2.0, num_beams: int = 5):
-        super().__init__(duration)
+    def __init__(self, duration: float = 2.0, num_beams: int = 5, seed: Optional[int] = None):
+        super().__init__(duration, seed)
         self.num_beams = num_beams
-        self.beams = [
-            {
-                'start_x': random.uniform(0.3, 0.7),
-                'start_y': random.uniform(0.4, 0.6),
-                'angle': random.uniform(0, 360),
-                'length': random.uniform(0.3, 0.6),
-                'color': (random.randint(0, 255), random.randint(0, 255), 255)
-            }
-            for _ in range(num_beams)
-        ]
-
-    def render(self, frame: np.ndarray, progress: float) -> np.ndarray:
-        height, width = frame.shape[:2]
-        overlay = frame.copy()
 
+        # Beams are particles fixed at their origin; `size` is the full
+        # beam length as a fraction of the frame's longer side
+        rng = self.rng
+        n = num_beams
+        palette = np.column_stack([
+            rng.integers(0, 256, (NUM_COLORS, 2)), np.full(NUM_COLORS, 255)
+        ])
+        self.beams = ParticleSystem(n, palette)
+        self.beams.x0[:] = rng.uniform(0.3, 0.7, n)
+        self.beams.y0[:] = rng.uniform(0.4, 0.6, n)
+        self.beams.rotation0[:] = rng.uniform(0, 360, n)
+        self.beams.size[:] = rng.uniform(0.3, 0.6, n)
+        self.beams.color[:] = rng.integers(0, NUM_COLORS, n)
+
+    def _lines(self, width: int, height: int, progress: float) -> np.ndarray:
+        count = self._visible_count(len(self.beams))
+        return self._per_frame(
+            (width, height, progress, count),
+            lambda: self._compute_lines(width, height, progress, count)
+        )
+
+    def _compute_lines(self, width: int, height: int, progress: float, count: int) -> np.ndarray:
+        beams = self.beams
+        x, y = beams.positions(progress, count)
+        length = beams.size[:count] * max(width, height) * progress
+        angle = np.radians(beams.rotation0[:count])
+
+        lines = np.empty((count, 2, 2), dtype=np.int32)
+        lines[:, 0, 0] = x * width
+        lines[:, 0, 1] = y * height
+        lines[:, 1, 0] = lines[:, 0, 0] + length * np.cos(angle)
+        lines[:, 1, 1] = lines[:, 0, 1] + length * np.sin(angle)
+        return lines
+
+    def bounds(self, width: int, height: int, progress: float):
+        lines = self._lines(width, height, progress)
+        return polygon_bounds(lines, pad=BEAM_THICKNESS) if len(lines) else None
+
+    def draw(self, layer: EffectLayer, progress: float) -> None:
         alpha = 0.6 if progress < 0.5 else 0.6 * (1.0 - (progress - 0.5) / 0.5)
 
-        for beam in self.beams:
-            sx = int(beam['start_x'] * width)
-            sy = int(beam['start_y'] * height)
-
-            length = int(beam['length'] * max(width, height) * progress)
-            angle_rad = np.radians(beam['angle'])
-
-            ex = int(sx + length * np.cos(angle_rad))
-            ey = int(sy + length * np.sin(angle_rad))
-
-            cv2.line(overlay, (sx, sy), (ex, ey), beam['color'], 3)
-
-        cv2.addWeighted(overlay, alpha, frame, 1 - alpha, 0, frame)
-        return frame
+        lines = self._lines(layer.width, layer.height, progress)
+        colors = self.beams.palette[self.beams.color[:len(lines)]]
+        layer.polylines(lines, colors, alpha, thickness=BEAM_THICKNESS)
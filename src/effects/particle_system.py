@@ -0,0 +1,208 @@
+"""Struct-of-arrays particle system shared by the particle effects.
+
+Particle state is stored as one contiguous NumPy array per attribute
+instead of one dict per particle. Motion is closed-form in animation
+progress (initial position, velocity, constant acceleration and a
+sinusoidal wobble), so the positions of every particle at any progress
+come from a handful of array expressions. Particles outside the frame are
+dropped with a mask, and shapes are drawn from polygon templates
+transformed for all particles at once into the ``EffectLayer``, which
+needs one OpenCV call per color.
+"""
+
+from typing import NamedTuple, Optional, Sequence, Tuple
+import numpy as np
+
+
+class ParticleFrame(NamedTuple):
+    """Visible particles at one moment, in pixel coordinates."""
+
+    index: np.ndarray  # indices into the particle arrays
+    x: np.ndarray
+    y: np.ndarray
+    rotation: np.ndarray  # degrees
+
+
+def polygon_template(angles_deg: np.ndarray, radii: np.ndarray) -> np.ndarray:
+    """Build a polygon template from polar coordinates.
+
+    Args:
+        angles_deg: Vertex angles in degrees
+        radii: Vertex distances from the center
+
+    Returns:
+        Template of shape (vertices, 2)
+    """
+    angles = np.radians(angles_deg)
+    return np.stack([radii * np.cos(angles), radii * np.sin(angles)], axis=1).astype(np.float32)
+
+
+def circle_template(num_points: int = 16) -> np.ndarray:
+    """Build a unit circle template.
+
+    Args:
+        num_points: Number of vertices
+
+    Returns:
+        Template of shape (num_points, 2)
+    """
+    return polygon_template(np.arange(num_points) * (360.0 / num_points), np.ones(num_points))
+
+
+def transform_polygons(
+    template: np.ndarray,
+    x: np.ndarray,
+    y: np.ndarray,
+    scale: np.ndarray,
+    rotation: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """Place a polygon template at every particle.
+
+    Args:
+        template: Template of shape (vertices, 2)
+        x: Center x per particle in pixels
+        y: Center y per particle in pixels
+        scale: Template scale per particle
+        rotation: Rotation per particle in degrees
+
+    Returns:
+        Integer vertices of shape (particles, vertices, 2)
+    """
+    u = template[np.newaxis, :, 0] * scale[:, np.newaxis]
+    v = template[np.newaxis, :, 1] * scale[:, np.newaxis]
+
+    if rotation is not None:
+        angle = np.radians(rotation)[:, np.newaxis]
+        cos, sin = np.cos(angle), np.sin(angle)
+        u, v = u * cos - v * sin, u * sin + v * cos
+
+    points = np.empty(u.shape + (2,), dtype=np.int32)
+    points[..., 0] = u + x[:, np.newaxis]
+    points[..., 1] = v + y[:, np.newaxis]
+    return points
+
+
+class ParticleSystem:
+    """Particle attributes stored as contiguous arrays.
+
+    Positions are normalized to the frame (0-1, y down) and evaluated in
+    closed form at animation time ``t``::
+
+        x = x0 + vx * t + ax * t^2 / 2 + wobble * sin(phase + wobble_rate * t)
+        y = y0 + vy * t + ay * t^2 / 2
+        rotation = rotation0 + spin * t
+
+    Effects fill the arrays once and choose the time unit (progress or
+    seconds) when evaluating.
+    """
+
+    def __init__(self, count: int, palette: Sequence[Tuple[int, int, int]]):
+        """Initialize particle system with all attributes zeroed.
+
+        Args:
+            count: Number of particles
+            palette: BGR colors the particles index into
+        """
+        self.count = count
+        self.x0 = np.zeros(count, dtype=np.float32)
+        self.y0 = np.zeros(count, dtype=np.float32)
+        self.vx = np.zeros(count, dtype=np.float32)
+        self.vy = np.zeros(count, dtype=np.float32)
+        self.ax = np.zeros(count, dtype=np.float32)
+        self.ay = np.zeros(count, dtype=np.float32)
+        self.wobble = np.zeros(count, dtype=np.float32)
+        self.wobble_rate = np.zeros(count, dtype=np.float32)
+        self.phase = np.zeros(count, dtype=np.float32)
+        self.rotation0 = np.zeros(count, dtype=np.float32)
+        self.spin = np.zeros(count, dtype=np.float32)
+        self.size = np.zeros(count, dtype=np.float32)  # pixels
+        self.kind = np.zeros(count, dtype=np.uint8)  # effect-specific shape id
+        self.color = np.zeros(count, dtype=np.intp)  # palette index
+        self.palette = np.asarray(palette, dtype=np.uint8).reshape(-1, 3)
+
+    def __len__(self) -> int:
+        """Number of particles."""
+        return self.count
+
+    def positions(self, t: float, count: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Evaluate normalized positions.
+
+        Args:
+            t: Animation time
+            count: Only evaluate the first ``count`` particles
+
+        Returns:
+            Tuple of (x, y) arrays
+        """
+        n = slice(0, count)
+        half_t2 = 0.5 * t * t
+        x = self.x0[n] + self.vx[n] * t + self.ax[n] * half_t2
+        x += self.wobble[n] * np.sin(self.phase[n] + self.wobble_rate[n] * t)
+        y = self.y0[n] + self.vy[n] * t + self.ay[n] * half_t2
+        return x, y
+
+    def visible(
+        self, t: float, width: int, height: int, count: Optional[int] = None
+    ) -> ParticleFrame:
+        """Evaluate the particles that overlap the frame.
+
+        A particle is kept while any part of it, taking its size as
+        its extent, may be inside the frame.
+
+        Args:
+            t: Animation time
+            width: Frame width in pixels
+            height: Frame height in pixels
+            count: Only consider the first ``count`` particles
+
+        Returns:
+            Visible particles in pixel coordinates
+        """
+        x, y = self.positions(t, count)
+        x *= width
+        y *= height
+
+        size = self.size[:len(x)]
+        mask = (x > -size) & (x < width + size) & (y > -size) & (y < height + size)
+        index = np.flatnonzero(mask)
+
+        rotation = self.rotation0[index] + self.spin[index] * t
+        return ParticleFrame(index, x[index], y[index], rotation)
+
+    def bounds(
+        self, t: float, width: int, height: int, count: Optional[int] = None, pad: float = 0.0
+    ) -> Optional[Tuple[int, int, int, int]]:
+        """Get the pixel rectangle covering all visible particles.
+
+        Args:
+            t: Animation time
+            width: Frame width in pixels
+            height: Frame height in pixels
+            count: Only consider the first ``count`` particles
+            pad: Extra pixels around every particle beyond its size
+
+        Returns:
+            Rectangle as (x0, y0, x1, y1), or None if no particle is visible
+        """
+        return self.frame_bounds(self.visible(t, width, height, count), pad)
+
+    def frame_bounds(
+        self, visible: ParticleFrame, pad: float = 0.0
+    ) -> Optional[Tuple[int, int, int, int]]:
+        """Get the pixel rectangle covering already evaluated particles.
+
+        Args:
+            visible: Visible particles from ``visible``
+            pad: Extra pixels around every particle beyond its size
+
+        Returns:
+            Rectangle as (x0, y0, x1, y1), or None if no particle is visible
+        """
+        if len(visible.index) == 0:
+            return None
+
+        extent = self.size[visible.index] + pad
+        return (
+            int(np.floor((visible.x - extent).min())), int(np.floor((visible.y - extent).min())),
+            int(np.ceil((visible.x + extent).max())) + 1, int(np.ceil((visible.y + extent).max())) + 1,
+        )
@@ -1,39 +1,46 @@
 """Thumbs up/down animation effect."""
 
+from typing import Optional
 import cv2
-import numpy as np
+from effect_layer import EffectLayer
 from .base_effect import BaseEffect
 
+FONT = cv2.FONT_HERSHEY_SIMPLEX
+
 
 class ThumbsEffect(BaseEffect):
     """Thumbs up or down animation."""
 
-    def __init__(self, duration: float = 2.0, direction: str = "up"):
-        super().__init__(duration)
+    def __init__(self, duration: float = 2.0, direction: str = "up", seed: Optional[int] = None):
+        super().__init__(duration, seed)
         self.direction = direction  # "up" or "down"
 
-    def render(self, frame: np.ndarray, progress: float) -> np.ndarray:
-        height, width = frame.shape[:2]
-
-        # Scale and fade animation
-        scale = 0.5 + progress * 0.5  # Grow from 50% to 100%
-        alpha = 1.0 - progress  # Fade out
+    def _geometry(self, width: int, height: int, progress: float):
+        # Scale animation: grow from 50% to 100%
+        scale = 0.5 + progress * 0.5
 
-        # Position (center)
+        # Position (center) and emoji size
         cx, cy = width // 2, height // 2
-
-        # Emoji size
         size = int(100 * scale)
+        text = "👍" if self.direction == "up" else "👎"
+        return cx, cy, size, text
+
+    def bounds(self, width: int, height: int, progress: float):
+        cx, cy, size, text = self._geometry(width, height, progress)
+        (text_w, text_h), baseline = cv2.getTextSize(text, FONT, size / 50, 2)
+        x, y = cx - size // 2, cy + size // 2
+        return (
+            min(cx - size, x) - 2, min(cy - size, y - text_h) - 2,
+            max(cx + size, x + text_w) + 3, max(cy + size, y + baseline) + 3,
+        )
+
+    def draw(self, layer: EffectLayer, progress: float) -> None:
+        cx, cy, size, text = self._geometry(layer.width, layer.height, progress)
+        alpha = 1.0 - progress  # Fade out
 
         # Draw thumbs emoji (simplified as colored circle with text)
         color = (0, 255, 0) if self.direction == "up" else (0, 0, 255)
-        overlay = frame.copy()
-        cv2.circle(overlay, (cx, cy), size, color, -1)
+        layer.circle((cx, cy), size, color, alpha)
 
         # Draw thumb symbol
-        text = "👍" if self.direction == "up" else "👎"
-        font = cv2.FONT_HERSHEY_SIMPLEX
-        cv2.putText(overlay, text, (cx - size//2, cy + size//2), font, size/50, (255, 255, 255), 2)
-
-        cv2.addWeighted(overlay, alpha, frame, 1 - alpha, 0, frame)
-        return frame
+        layer.text(text, (cx - size//2, cy + size//2), size/50, (255, 255, 255), alpha, 2, FONT)
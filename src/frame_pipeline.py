@@ -0,0 +1,267 @@
+"""Multi-threaded frame pipeline.
+
+This module splits per-frame work into capture, processing and output
+stages that each run on their own thread. Stages are connected by small
+bounded queues that drop the oldest frame when a consumer falls behind,
+so every stage always works on the freshest image available.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, NamedTuple, Optional
+import numpy as np
+
+from frame_tracer import set_current_frame_id
+from perf_stats import PerfStats
+
+logger = logging.getLogger(__name__)
+
+
+class FramePacket(NamedTuple):
+    """A frame travelling through the pipeline."""
+
+    frame_id: int
+    capture_time: float
+    frame: np.ndarray
+
+
+class LatestFrameQueue:
+    """Bounded queue that discards the oldest item when full."""
+
+    def __init__(self, maxsize: int = 1):
+        """Initialize queue.
+
+        Args:
+            maxsize: Maximum number of queued items
+        """
+        self._items: deque = deque()
+        self._maxsize = max(1, maxsize)
+        self._condition = threading.Condition()
+        self.dropped = 0
+
+    def put(self, item: Any) -> None:
+        """Add an item, dropping the oldest one if the queue is full.
+
+        Args:
+            item: Item to enqueue
+        """
+        with self._condition:
+            if len(self._items) >= self._maxsize:
+                self._items.popleft()
+                self.dropped += 1
+            self._items.append(item)
+            self._condition.notify()
+
+    def get(self, timeout: Optional[float] = None) -> Optional[Any]:
+        """Remove and return the oldest item.
+
+        Args:
+            timeout: Seconds to wait for an item (0 for non-blocking,
+                None to wait forever)
+
+        Returns:
+            Item or None if nothing arrived in time
+        """
+        with self._condition:
+            if not self._items:
+                if timeout == 0:
+                    return None
+                self._condition.wait(timeout)
+            if not self._items:
+                return None
+            return self._items.popleft()
+
+    def clear(self) -> None:
+        """Remove all queued items."""
+        with self._condition:
+            self._items.clear()
+
+    def __len__(self) -> int:
+        with self._condition:
+            return len(self._items)
+
+
+class FramePipeline:
+    """Runs capture, processing and output on separate threads."""
+
+    def __init__(
+        self,
+        capture,
+        process_frame: Callable[[np.ndarray], np.ndarray],
+        output_frame: Optional[Callable[[np.ndarray], Any]] = None,
+        queue_size: int = 1,
+        scheduler=None,
+        perf_stats: Optional[PerfStats] = None
+    ):
+        """Initialize frame pipeline.
+
+        Args:
+            capture: Frame source with a ``read() -> (ok, frame)`` method,
+                e.g. ``cv2.VideoCapture``
+            process_frame: Callable producing the output frame
+            output_frame: Callable receiving every processed frame
+                (e.g. the virtual camera sender)
+            queue_size: Capacity of each inter-stage queue
+            scheduler: Optional ``FrameScheduler``; when set, each frame is
+                planned before processing and ``process_frame`` receives
+                the decision as its second argument
+            perf_stats: Optional statistics collector for stage timings
+        """
+        self.capture = capture
+        self.process_frame = process_frame
+        self.output_frame = output_frame
+        self.scheduler = scheduler
+        self.perf_stats = perf_stats or PerfStats(enabled=False)
+
+        self.capture_queue = LatestFrameQueue(queue_size)
+        self.output_queue = LatestFrameQueue(queue_size)
+        self.preview_queue = LatestFrameQueue(1)
+
+        self.running = False
+        self._threads: Dict[str, threading.Thread] = {}
+        self._next_frame_id = 0
+        self.frames_captured = 0
+        self.frames_processed = 0
+        self.frames_output = 0
+        self.frames_dropped = 0
+
+    def start(self) -> None:
+        """Start all pipeline stages."""
+        if self.running:
+            return
+
+        self.running = True
+        stages = {
+            "capture": self._capture_loop,
+            "process": self._process_loop,
+            "output": self._output_loop,
+        }
+        for name, target in stages.items():
+            thread = threading.Thread(
+                target=target, name=f"pipeline-{name}", daemon=True
+            )
+            self._threads[name] = thread
+            thread.start()
+
+        logger.info("Frame pipeline started")
+
+    def stop(self, timeout: float = 1.0) -> None:
+        """Stop all pipeline stages and wait for them to exit.
+
+        Args:
+            timeout: Seconds to wait for each stage thread
+        """
+        if not self.running:
+            return
+
+        self.running = False
+        for thread in self._threads.values():
+            thread.join(timeout)
+        self._threads.clear()
+
+        self.capture_queue.clear()
+        self.output_queue.clear()
+        self.preview_queue.clear()
+
+        logger.info("Frame pipeline stopped")
+
+    def is_running(self) -> bool:
+        """Check if the pipeline is running.
+
+        Returns:
+            True if stage threads are active
+        """
+        return self.running
+
+    def get_preview_frame(self) -> Optional[np.ndarray]:
+        """Get the newest finished frame for display.
+
+        The calling thread's trace frame ID is set to the returned frame.
+
+        Returns:
+            Processed frame, or None if no new frame is ready
+        """
+        packet = self.preview_queue.get(timeout=0)
+        if packet is None:
+            return None
+
+        set_current_frame_id(packet.frame_id)
+        return packet.frame
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get frame counters for each stage.
+
+        Returns:
+            Dictionary of counters
+        """
+        return {
+            "captured": self.frames_captured,
+            "processed": self.frames_processed,
+            "output": self.frames_output,
+            "dropped_by_scheduler": self.frames_dropped,
+            "dropped_before_process": self.capture_queue.dropped,
+            "dropped_before_output": self.output_queue.dropped,
+        }
+
+    def _capture_loop(self) -> None:
+        """Read frames from the source and queue them for processing."""
+        while self.running:
+            set_current_frame_id(self._next_frame_id)
+            with self.perf_stats.measure("capture"):
+                ret, frame = self.capture.read()
+            if not ret:
+                time.sleep(0.005)
+                continue
+
+            packet = FramePacket(self._next_frame_id, time.time(), frame)
+            self._next_frame_id += 1
+            self.frames_captured += 1
+            self.capture_queue.put(packet)
+
+    def _process_loop(self) -> None:
+        """Run effects processing on the freshest captured frame."""
+        while self.running:
+            packet = self.capture_queue.get(timeout=0.1)
+            if packet is None:
+                continue
+
+            set_current_frame_id(packet.frame_id)
+            try:
+                if self.scheduler is not None:
+                    decision = self.scheduler.plan(packet.capture_time)
+                    if decision.drop:
+                        self.frames_dropped += 1
+                        continue
+                    with self.perf_stats.measure("process"):
+                        processed = self.process_frame(packet.frame, decision)
+                else:
+                    with self.perf_stats.measure("process"):
+                        processed = self.process_frame(packet.frame)
+            except Exception as e:
+                logger.error(f"Error processing frame {packet.frame_id}: {e}")
+                continue
+
+            packet = packet._replace(frame=processed)
+            self.frames_processed += 1
+            self.output_queue.put(packet)
+            self.preview_queue.put(packet)
+
+    def _output_loop(self) -> None:
+        """Deliver processed frames to the output sink."""
+        while self.running:
+            packet = self.output_queue.get(timeout=0.1)
+            if packet is None or self.output_frame is None:
+                continue
+
+            set_current_frame_id(packet.frame_id)
+            try:
+                start = time.perf_counter()
+                self.output_frame(packet.frame)
+                self.frames_output += 1
+                if self.scheduler is not None:
+                    self.scheduler.record("output", time.perf_counter() - start)
+                    self.scheduler.record_latency(time.time() - packet.capture_time)
+            except Exception as e:
+                logger.error(f"Error sending frame {packet.frame_id}: {e}")
@@ -0,0 +1,181 @@
+"""Deadline-driven adaptive frame scheduling.
+
+This module decides, for every captured frame, how much work the
+processing stage can afford. It tracks the recent cost of each stage and
+compares it against a per-frame deadline, then drops stale frames, skips
+gesture detection or lowers effect quality so that latency stays bounded
+under load instead of drifting.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Dict, List, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class FrameDecision(NamedTuple):
+    """Work plan for a single frame."""
+
+    drop: bool
+    detect: bool
+    quality: float
+    reason: str
+
+
+class FrameScheduler:
+    """Adapts per-frame work to meet a frame deadline."""
+
+    def __init__(
+        self,
+        deadline: float = 1.0 / 30,
+        smoothing: float = 0.2,
+        min_quality: float = 0.25,
+        max_detection_skips: int = 5,
+        history: int = 300
+    ):
+        """Initialize frame scheduler.
+
+        Args:
+            deadline: Target processing time per frame in seconds
+            smoothing: Weight of the newest sample in the stage cost averages
+            min_quality: Lowest effect quality the scheduler will choose
+            max_detection_skips: Consecutive frames detection may be skipped
+                before it is forced to run
+            history: Number of recent decisions to keep
+        """
+        self.deadline = deadline
+        self.smoothing = smoothing
+        self.min_quality = min_quality
+        self.max_detection_skips = max_detection_skips
+
+        self.stage_costs: Dict[str, float] = {}
+        self.latency = 0.0
+        self.quality = 1.0
+        self.decisions: deque = deque(maxlen=history)
+        self.counters = {
+            "frames": 0,
+            "dropped": 0,
+            "detection_skipped": 0,
+            "quality_lowered": 0,
+            "quality_raised": 0,
+        }
+
+        self._lock = threading.Lock()
+        self._detection_skips = 0
+        self._slack_frames = 0
+
+    def record(self, stage: str, seconds: float) -> None:
+        """Record the measured cost of a pipeline stage.
+
+        Args:
+            stage: Stage name (e.g. "detect", "render", "output")
+            seconds: Time the stage took
+        """
+        with self._lock:
+            previous = self.stage_costs.get(stage)
+            if previous is None:
+                self.stage_costs[stage] = seconds
+            else:
+                self.stage_costs[stage] = previous + self.smoothing * (seconds - previous)
+
+    def record_latency(self, seconds: float) -> None:
+        """Record the capture-to-output latency of a delivered frame.
+
+        Args:
+            seconds: Time since the frame was captured
+        """
+        with self._lock:
+            self.latency += self.smoothing * (seconds - self.latency)
+
+    def plan(self, capture_time: float, now: Optional[float] = None) -> FrameDecision:
+        """Decide how to process a frame.
+
+        Args:
+            capture_time: Time the frame was captured (``time.time()``)
+            now: Current time, defaults to ``time.time()``
+
+        Returns:
+            Decision for this frame
+        """
+        if now is None:
+            now = time.time()
+
+        with self._lock:
+            age = max(0.0, now - capture_time)
+            detect_cost = self.stage_costs.get("detect", 0.0)
+            render_cost = self.stage_costs.get("render", 0.0)
+            remaining = self.deadline - age
+
+            self.counters["frames"] += 1
+
+            if age > 2 * self.deadline:
+                decision = FrameDecision(True, False, self.quality, "stale")
+                self.counters["dropped"] += 1
+            else:
+                detect, reason = True, "on_time"
+                if (
+                    detect_cost + render_cost > remaining
+                    and self._detection_skips < self.max_detection_skips
+                ):
+                    detect, reason = False, "skip_detection"
+                    self._detection_skips += 1
+                    self.counters["detection_skipped"] += 1
+                else:
+                    self._detection_skips = 0
+
+                self._adapt_quality(render_cost, detect_cost)
+                decision = FrameDecision(False, detect, self.quality, reason)
+
+            self.decisions.append((now, age, decision))
+
+        if decision.reason != "on_time":
+            logger.debug(f"Frame scheduler: {decision.reason} (age={age * 1000:.1f}ms)")
+
+        return decision
+
+    def _adapt_quality(self, render_cost: float, detect_cost: float) -> None:
+        """Lower effect quality under load and restore it when there is slack.
+
+        Args:
+            render_cost: Average effect rendering cost in seconds
+            detect_cost: Average detection cost in seconds
+        """
+        if render_cost > 0.5 * self.deadline and self.quality > self.min_quality:
+            self.quality = max(self.min_quality, self.quality * 0.75)
+            self._slack_frames = 0
+            self.counters["quality_lowered"] += 1
+        elif render_cost + detect_cost < 0.5 * self.deadline and self.quality < 1.0:
+            # Require sustained slack before raising, to avoid oscillating
+            self._slack_frames += 1
+            if self._slack_frames >= 30:
+                self.quality = min(1.0, self.quality / 0.75)
+                self._slack_frames = 0
+                self.counters["quality_raised"] += 1
+        else:
+            self._slack_frames = 0
+
+    def get_decisions(self) -> List:
+        """Get recent scheduling decisions.
+
+        Returns:
+            List of (time, frame_age, FrameDecision) tuples
+        """
+        with self._lock:
+            return list(self.decisions)
+
+    def get_stats(self) -> Dict:
+        """Get scheduler statistics.
+
+        Returns:
+            Dictionary with stage costs, latency, quality and counters
+        """
+        with self._lock:
+            return {
+                "stage_costs": dict(self.stage_costs),
+                "latency": self.latency,
+                "quality": self.quality,
+                **self.counters,
+            }
@@ -0,0 +1,133 @@
+"""Per-frame latency tracing in Chrome trace-event format.
+
+This module records begin/end spans for every pipeline stage, tagged with
+the ID of the frame being worked on, and writes them as Chrome trace-event
+JSON that can be opened in Perfetto (ui.perfetto.dev) or chrome://tracing.
+The current frame ID is tracked per thread, so a frame can be followed
+from capture through detection and effects to the virtual camera.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+_thread_state = threading.local()
+
+
+def set_current_frame_id(frame_id: Optional[int]) -> None:
+    """Set the frame the calling thread is working on.
+
+    Args:
+        frame_id: Frame identifier, or None when idle
+    """
+    _thread_state.frame_id = frame_id
+
+
+def current_frame_id() -> Optional[int]:
+    """Get the frame the calling thread is working on.
+
+    Returns:
+        Frame identifier or None
+    """
+    return getattr(_thread_state, "frame_id", None)
+
+
+class FrameTracer:
+    """Records pipeline spans and exports them as a Chrome trace."""
+
+    def __init__(self, max_events: int = 500000):
+        """Initialize frame tracer.
+
+        Args:
+            max_events: Number of most recent spans kept in memory
+        """
+        self.max_events = max_events
+        self._events: deque = deque(maxlen=max_events)
+        self._thread_names: Dict[int, str] = {}
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter()
+
+    def add_span(self, name: str, start: float, end: float) -> None:
+        """Record a completed span on the calling thread.
+
+        Args:
+            name: Stage name
+            start: Start time from ``time.perf_counter()``
+            end: End time from ``time.perf_counter()``
+        """
+        thread = threading.current_thread()
+        event = (
+            name,
+            (start - self._origin) * 1e6,
+            (end - start) * 1e6,
+            thread.ident,
+            current_frame_id(),
+        )
+
+        with self._lock:
+            if thread.ident not in self._thread_names:
+                self._thread_names[thread.ident] = thread.name
+            self._events.append(event)
+
+    def to_chrome_trace(self) -> Dict:
+        """Build the trace as a Chrome trace-event dictionary.
+
+        Returns:
+            Dictionary with a ``traceEvents`` list
+        """
+        pid = os.getpid()
+
+        with self._lock:
+            events = list(self._events)
+            thread_names = dict(self._thread_names)
+
+        trace_events = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": pid,
+                "tid": tid,
+                "args": {"name": name},
+            }
+            for tid, name in thread_names.items()
+        ]
+
+        for name, ts, dur, tid, frame_id in events:
+            trace_events.append({
+                "name": name,
+                "cat": "frame",
+                "ph": "X",
+                "ts": round(ts, 3),
+                "dur": round(dur, 3),
+                "pid": pid,
+                "tid": tid,
+                "args": {"frame_id": frame_id},
+            })
+
+        return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+    def save(self, path: str) -> None:
+        """Write the trace to a JSON file.
+
+        Args:
+            path: Output file path
+        """
+        output = Path(path)
+        output.parent.mkdir(parents=True, exist_ok=True)
+
+        with open(output, "w") as f:
+            json.dump(self.to_chrome_trace(), f)
+
+        logger.info(f"Frame trace saved to {output} ({len(self._events)} spans)")
+
+    def clear(self) -> None:
+        """Discard all recorded spans."""
+        with self._lock:
+            self._events.clear()
@@ -0,0 +1,279 @@
+"""Learned gesture classification over landmark features.
+
+A small multilayer perceptron classifies normalized hand landmarks into
+gestures. Inference is a couple of NumPy matrix multiplies, so its cost
+does not grow with the number of gestures the way a chain of hand-written
+rules does. Models are trained offline (``scripts/train_gesture_classifier.py``)
+and stored as compact ``.npz`` weight files.
+"""
+
+import logging
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple, Union
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Label used for "no gesture" samples
+NO_GESTURE = "none"
+
+WRIST = 0
+MIDDLE_MCP = 9
+
+
+def landmark_features(hands: np.ndarray) -> np.ndarray:
+    """Build position and scale invariant features for one or more hands.
+
+    Each hand is translated to its wrist and scaled by its palm length
+    (wrist to middle finger MCP). Multiple hands are concatenated in
+    order, followed by the offsets between their wrists in units of the
+    first hand's palm length.
+
+    Args:
+        hands: Landmarks of shape (hands, 21, 3), or (samples, hands, 21, 3)
+
+    Returns:
+        Features of shape (features,) or (samples, features)
+    """
+    batched = hands.ndim == 4
+    if not batched:
+        hands = hands[np.newaxis]
+
+    wrists = hands[:, :, WRIST:WRIST + 1]
+    palm = np.linalg.norm(hands[:, :, MIDDLE_MCP, :2] - hands[:, :, WRIST, :2], axis=-1)
+    palm = np.maximum(palm, 1e-6)[..., np.newaxis, np.newaxis]
+
+    # The wrist itself is always the origin, so it is left out
+    local = ((hands - wrists) / palm)[:, :, 1:]
+    features = [local.reshape(len(hands), -1)]
+
+    if hands.shape[1] > 1:
+        offsets = (hands[:, 1:, WRIST] - hands[:, :1, WRIST]) / palm[:, :1, 0]
+        features.append(offsets.reshape(len(hands), -1))
+
+    result = np.concatenate(features, axis=1).astype(np.float32)
+    return result if batched else result[0]
+
+
+class GestureClassifier:
+    """Multilayer perceptron with ReLU hidden layers and a softmax output."""
+
+    def __init__(
+        self,
+        weights: Sequence[np.ndarray],
+        biases: Sequence[np.ndarray],
+        labels: Sequence[str],
+        num_hands: int = 1,
+        mean: Optional[np.ndarray] = None,
+        std: Optional[np.ndarray] = None
+    ):
+        """Initialize gesture classifier.
+
+        Args:
+            weights: Weight matrices, (inputs, outputs) per layer
+            biases: Bias vectors per layer
+            labels: Gesture name per output class (``NO_GESTURE`` for none)
+            num_hands: Number of hands the model classifies (1 or 2)
+            mean: Feature mean for standardization
+            std: Feature standard deviation for standardization
+        """
+        self.weights = [np.asarray(w, dtype=np.float32) for w in weights]
+        self.biases = [np.asarray(b, dtype=np.float32) for b in biases]
+        self.labels = list(labels)
+        self.num_hands = num_hands
+
+        num_features = self.weights[0].shape[0]
+        self.mean = np.zeros(num_features, np.float32) if mean is None else np.asarray(mean, np.float32)
+        self.std = np.ones(num_features, np.float32) if std is None else np.asarray(std, np.float32)
+
+    def predict_proba(self, features: np.ndarray) -> np.ndarray:
+        """Compute class probabilities.
+
+        Args:
+            features: Features of shape (features,) or (samples, features)
+
+        Returns:
+            Probabilities of shape (classes,) or (samples, classes)
+        """
+        x = (features - self.mean) / self.std
+        for w, b in zip(self.weights[:-1], self.biases[:-1]):
+            x = np.maximum(x @ w + b, 0.0)
+        logits = x @ self.weights[-1] + self.biases[-1]
+
+        logits = logits - logits.max(axis=-1, keepdims=True)
+        exp = np.exp(logits)
+        return exp / exp.sum(axis=-1, keepdims=True)
+
+    def classify(self, hands: np.ndarray) -> Tuple[Optional[str], float]:
+        """Classify the gesture shown by the given hands.
+
+        Args:
+            hands: Landmarks of shape (num_hands, 21, 3)
+
+        Returns:
+            Tuple of (gesture_name, confidence); gesture is None for the
+            no-gesture class
+        """
+        probabilities = self.predict_proba(landmark_features(hands))
+        index = int(np.argmax(probabilities))
+        label = self.labels[index]
+        return (None if label == NO_GESTURE else label), float(probabilities[index])
+
+    def classify_batch(self, samples: np.ndarray) -> Tuple[List[Optional[str]], np.ndarray]:
+        """Classify many hands or hand pairs at once.
+
+        Args:
+            samples: Landmarks of shape (samples, num_hands, 21, 3)
+
+        Returns:
+            Tuple of (gesture name or None per sample, confidence per sample)
+        """
+        probabilities = self.predict_proba(landmark_features(samples))
+        index = np.argmax(probabilities, axis=1)
+        names = [None if self.labels[i] == NO_GESTURE else self.labels[i] for i in index]
+        return names, probabilities[np.arange(len(samples)), index]
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Save the model as an ``.npz`` weights file.
+
+        Args:
+            path: Output file path
+        """
+        arrays = {
+            "labels": np.array(self.labels),
+            "num_hands": np.array(self.num_hands),
+            "mean": self.mean,
+            "std": self.std,
+        }
+        for i, (w, b) in enumerate(zip(self.weights, self.biases)):
+            arrays[f"w{i}"] = w
+            arrays[f"b{i}"] = b
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        np.savez_compressed(path, **arrays)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "GestureClassifier":
+        """Load a model saved with ``save``.
+
+        Args:
+            path: Weights file path
+
+        Returns:
+            Loaded classifier
+        """
+        with np.load(path) as data:
+            num_layers = sum(1 for key in data.files if key.startswith("w"))
+            classifier = cls(
+                weights=[data[f"w{i}"] for i in range(num_layers)],
+                biases=[data[f"b{i}"] for i in range(num_layers)],
+                labels=[str(label) for label in data["labels"]],
+                num_hands=int(data["num_hands"]),
+                mean=data["mean"],
+                std=data["std"]
+            )
+
+        logger.info(
+            f"Loaded gesture classifier from {path} "
+            f"({classifier.num_hands} hand(s), {len(classifier.labels)} classes)"
+        )
+        return classifier
+
+
+def load_classifier(path: Optional[str]) -> Optional[GestureClassifier]:
+    """Load a classifier if a path is configured.
+
+    Args:
+        path: Weights file path, or None
+
+    Returns:
+        Loaded classifier, or None if no path is set or loading failed
+    """
+    if not path:
+        return None
+    try:
+        return GestureClassifier.load(path)
+    except Exception as e:
+        logger.error(f"Failed to load gesture classifier {path}: {e}")
+        return None
+
+
+def train_classifier(
+    features: np.ndarray,
+    labels: Sequence[str],
+    num_hands: int = 1,
+    hidden_sizes: Sequence[int] = (64,),
+    epochs: int = 300,
+    learning_rate: float = 0.01,
+    weight_decay: float = 1e-4,
+    seed: int = 0
+) -> GestureClassifier:
+    """Train a classifier with full-batch Adam on cross-entropy loss.
+
+    Args:
+        features: Features of shape (samples, features)
+        labels: Gesture name per sample (``NO_GESTURE`` for none)
+        num_hands: Number of hands the features were built from
+        hidden_sizes: Width of each hidden layer
+        epochs: Number of optimization steps
+        learning_rate: Adam step size
+        weight_decay: L2 penalty on weights
+        seed: Random seed for weight initialization
+
+    Returns:
+        Trained classifier
+    """
+    rng = np.random.default_rng(seed)
+    class_names = sorted(set(labels))
+    targets = np.array([class_names.index(label) for label in labels])
+
+    mean = features.mean(axis=0)
+    std = features.std(axis=0) + 1e-6
+    x = ((features - mean) / std).astype(np.float32)
+    one_hot = np.eye(len(class_names), dtype=np.float32)[targets]
+
+    sizes = [x.shape[1], *hidden_sizes, len(class_names)]
+    params: List[np.ndarray] = []
+    for fan_in, fan_out in zip(sizes[:-1], sizes[1:]):
+        params.append((rng.standard_normal((fan_in, fan_out)) * np.sqrt(2.0 / fan_in)).astype(np.float32))
+        params.append(np.zeros(fan_out, dtype=np.float32))
+
+    moments = [np.zeros_like(p) for p in params]
+    velocities = [np.zeros_like(p) for p in params]
+    beta1, beta2 = 0.9, 0.999
+
+    for step in range(1, epochs + 1):
+        # Forward pass, keeping activations for backpropagation
+        activations = [x]
+        for i in range(0, len(params) - 2, 2):
+            activations.append(np.maximum(activations[-1] @ params[i] + params[i + 1], 0.0))
+        logits = activations[-1] @ params[-2] + params[-1]
+        logits -= logits.max(axis=1, keepdims=True)
+        probabilities = np.exp(logits)
+        probabilities /= probabilities.sum(axis=1, keepdims=True)
+
+        # Backward pass
+        grads: List[np.ndarray] = [None] * len(params)
+        delta = (probabilities - one_hot) / len(x)
+        for layer in range(len(sizes) - 2, -1, -1):
+            w_index = 2 * layer
+            grads[w_index] = activations[layer].T @ delta + weight_decay * params[w_index]
+            grads[w_index + 1] = delta.sum(axis=0)
+            if layer > 0:
+                delta = (delta @ params[w_index].T) * (activations[layer] > 0)
+
+        for i, grad in enumerate(grads):
+            moments[i] = beta1 * moments[i] + (1 - beta1) * grad
+            velocities[i] = beta2 * velocities[i] + (1 - beta2) * grad ** 2
+            m_hat = moments[i] / (1 - beta1 ** step)
+            v_hat = velocities[i] / (1 - beta2 ** step)
+            params[i] -= learning_rate * m_hat / (np.sqrt(v_hat) + 1e-8)
+
+    return GestureClassifier(
+        weights=params[0::2],
+        biases=params[1::2],
+        labels=class_names,
+        num_hands=num_hands,
+        mean=mean,
+        std=std
+    )
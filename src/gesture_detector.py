@@ -1,43 +1,139 @@
 """Hand gesture detection using MediaPipe.
 
-This module implements real-time hand gesture recognition using Google's
-MediaPipe Hands solution. It detects various hand gestures like thumbs up,
+This module implements real-time hand gesture recognition on top of a
+hand landmark backend (MediaPipe Hands by default, see
+``detector_backends``). It detects various hand gestures like thumbs up,
 peace sign, heart hands, etc.
 """
 
 import logging
-from typing import Optional, Tuple
+import time
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 import cv2
-import mediapipe as mp
 import numpy as np
 
+from buffer_pool import frame_pool
+from detector_backends import BACKENDS, HandLandmarkBackend, create_backend
+from gesture_classifier import GestureClassifier, load_classifier
+from gesture_rules import HandGesture, classify_hands
+from landmark_recording import LandmarkRecorder
+from perf_stats import PerfStats
+
 logger = logging.getLogger(__name__)
 
+# Landmark index pairs forming the hand skeleton
+HAND_CONNECTIONS = (
+    (0, 1), (1, 2), (2, 3), (3, 4),
+    (0, 5), (5, 6), (6, 7), (7, 8),
+    (5, 9), (9, 10), (10, 11), (11, 12),
+    (9, 13), (13, 14), (14, 15), (15, 16),
+    (13, 17), (0, 17), (17, 18), (18, 19), (19, 20),
+)
+
 
 class GestureDetector:
     """Detects hand gestures in video frames using MediaPipe."""
 
-    def __init__(self, confidence_threshold: float = 0.8):
+    def __init__(
+        self,
+        confidence_threshold: float = 0.8,
+        tracking_mode: bool = False,
+        roi_size: int = 256,
+        roi_padding: float = 0.6,
+        redetect_interval: int = 30,
+        backend: Union[str, HandLandmarkBackend] = "solutions",
+        model_path: Optional[str] = None,
+        search_backend: str = "solutions",
+        max_num_hands: int = 2,
+        classifier_paths: Sequence[str] = (),
+        record_path: Optional[str] = None,
+        perf_stats: Optional[PerfStats] = None
+    ):
         """Initialize gesture detector.
 
         Args:
             confidence_threshold: Minimum confidence for gesture detection (0.0-1.0)
+            tracking_mode: Run inference on a downscaled crop around the
+                hands found in the previous frame instead of the full frame
+            roi_size: Longest side of the downscaled crop in pixels
+            roi_padding: Fraction of the hand box size added on each side
+            redetect_interval: Frames between full-frame searches while
+                tracking, so hands entering the frame are picked up
+            backend: Hand landmark backend name (see
+                ``detector_backends.BACKENDS``) or a backend instance
+            model_path: Model file for backends that need one
+            search_backend: Palm-capable backend that searches full frames
+                when ``backend`` can only process hand crops (``onnx``);
+                requires ``tracking_mode``
+            max_num_hands: Maximum number of hands to detect; raise it for
+                group or room cameras
+            classifier_paths: Learned classifier weight files; each one
+                replaces the rules for the number of hands it was trained on
+            record_path: Record every frame's landmarks to this ``.npy``
+                file for later replay with ``ReplayDetector``
+            perf_stats: Optional statistics collector for stage timings
         """
         self.confidence_threshold = confidence_threshold
         self.last_gesture: Optional[str] = None
         self.last_confidence: float = 0.0
+        self.last_hand_count = 0
+        self.last_handedness: List[str] = []
+        self.last_gestures: List[HandGesture] = []
+        self.max_num_hands = max_num_hands
+        self.perf_stats = perf_stats or PerfStats(enabled=False)
+
+        self.tracking_mode = tracking_mode
+        self.roi_size = roi_size
+        self.roi_padding = roi_padding
+        self.redetect_interval = redetect_interval
+        self.tracked_roi: Optional[Tuple[int, int, int, int]] = None
+        self._roi_center: Optional[Tuple[float, float]] = None
+        # One crop per hand for backends that only see a single hand
+        self.tracked_rois: List[Tuple[int, int, int, int]] = []
+        self._hand_centers: List[Tuple[float, float]] = []
+        self._frames_since_search = 0
+
+        # Learned classifiers by number of hands; rules cover the rest
+        self.classifiers: Dict[int, GestureClassifier] = {}
+        for path in classifier_paths:
+            classifier = load_classifier(path)
+            if classifier is not None:
+                self.classifiers[classifier.num_hands] = classifier
+
+        self.recorder: Optional[LandmarkRecorder] = None
+        if record_path:
+            self.recorder = LandmarkRecorder(record_path, max_hands=max_num_hands)
+
+        # Initialize hand landmark backend
+        if isinstance(backend, str):
+            # Crop-only backends track hands a palm-capable backend found
+            search = backend
+            if backend in BACKENDS and not BACKENDS[backend].finds_hands and tracking_mode:
+                search = search_backend
+            self.backend = create_backend(
+                search, model_path=model_path if search == backend else None,
+                max_num_hands=max_num_hands
+            )
 
-        # Initialize MediaPipe Hands
-        self.mp_hands = mp.solutions.hands
-        self.hands = self.mp_hands.Hands(
-            static_image_mode=False,
-            max_num_hands=2,
-            min_detection_confidence=0.7,
-            min_tracking_confidence=0.5
-        )
-        self.mp_drawing = mp.solutions.drawing_utils
+            # Separate graph for crops so its internal tracking state stays
+            # in crop coordinates and never mixes with full-frame inputs
+            self.roi_backend = None
+            if tracking_mode:
+                self.roi_backend = create_backend(
+                    backend, full_frame=False, model_path=model_path,
+                    max_num_hands=max_num_hands
+                )
+        else:
+            self.backend = backend
+            self.roi_backend = backend if tracking_mode else None
 
-        logger.info(f"GestureDetector initialized (threshold={confidence_threshold})")
+        self.roi_per_hand = self.roi_backend is not None and not self.roi_backend.finds_hands
+
+        logger.info(
+            f"GestureDetector initialized (threshold={confidence_threshold}, "
+            f"tracking={tracking_mode}, backend={self.backend.name}, "
+            f"max_hands={max_num_hands})"
+        )
 
     def detect(self, frame: np.ndarray) -> Optional[str]:
         """Detect gesture in the given frame.
@@ -46,227 +142,290 @@ class GestureDetector:
             frame: Input BGR image
 
         Returns:
-            Detected gesture name or None
+            Most confident detected gesture name or None; every gesture
+            in the frame is in ``last_gestures``
         """
-        # Convert BGR to RGB
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        gestures = self.detect_all(frame)
+        if not gestures:
+            return None
 
-        # Process frame
-        results = self.hands.process(rgb_frame)
+        best = max(gestures, key=lambda found: found.confidence)
+        self.last_gesture = best.gesture
+        return best.gesture
 
-        if not results.multi_hand_landmarks:
-            self.last_gesture = None
-            return None
+    def detect_all(self, frame: np.ndarray) -> List[HandGesture]:
+        """Detect the gestures of every hand in the given frame.
 
-        # Analyze detected hands
-        num_hands = len(results.multi_hand_landmarks)
+        Args:
+            frame: Input BGR image
 
-        if num_hands == 1:
-            gesture, confidence = self._detect_single_hand_gesture(
-                results.multi_hand_landmarks[0]
-            )
-        elif num_hands == 2:
-            gesture, confidence = self._detect_two_hand_gesture(
-                results.multi_hand_landmarks[0],
-                results.multi_hand_landmarks[1]
-            )
+        Returns:
+            Gestures at or above the confidence threshold, one per hand
+            or hand pair
+        """
+        if self.tracking_mode:
+            hands = self._process_tracked(frame)
         else:
-            gesture, confidence = None, 0.0
+            hands = self._process_full_frame(frame)
 
-        self.last_confidence = confidence
+        if self.recorder:
+            self.recorder.record(time.time(), hands, self.last_handedness)
 
-        if confidence >= self.confidence_threshold:
-            self.last_gesture = gesture
-            return gesture
-
-        return None
+        self.last_hand_count = len(hands)
+        if len(hands) == 0:
+            self.last_gesture = None
+            self.last_gestures = []
+            return self.last_gestures
+
+        # Learned classifiers replace the rules for the hand counts they
+        # were trained on; all hands and pairs are scored in batches
+        found = classify_hands(
+            hands, self.last_handedness, self.classifiers,
+            min_confidence=self.confidence_threshold
+        )
+        self.last_confidence = max((g.confidence for g in found), default=0.0)
+        self.last_gestures = [g for g in found if g.confidence >= self.confidence_threshold]
+        return self.last_gestures
 
-    def _detect_single_hand_gesture(
-        self, hand_landmarks
-    ) -> Tuple[Optional[str], float]:
-        """Detect gesture from a single hand.
+    def _process_full_frame(self, frame: np.ndarray):
+        """Run hand inference on the whole frame.
 
         Args:
-            hand_landmarks: MediaPipe hand landmarks
+            frame: Input BGR image
 
         Returns:
-            Tuple of (gesture_name, confidence)
+            Hand landmarks of shape (hands, 21, 3)
         """
-        # Extract landmark positions
-        landmarks = hand_landmarks.landmark
+        with frame_pool.borrow(frame.shape) as rgb_frame:
+            # Convert BGR to RGB
+            with self.perf_stats.measure("convert"):
+                cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=rgb_frame)
 
-        # Thumbs up detection
-        if self._is_thumbs_up(landmarks):
-            return "thumbs_up", 0.9
+            # Process frame (MediaPipe copies the image into its own packet)
+            with self.perf_stats.measure("inference"):
+                found = self.backend.process(rgb_frame)
 
-        # Thumbs down detection
-        if self._is_thumbs_down(landmarks):
-            return "thumbs_down", 0.9
+        self.last_handedness = found.handedness
+        return found.landmarks
 
-        # Peace sign detection
-        if self._is_peace_sign(landmarks):
-            return "peace_sign", 0.85
+    def _process_tracked(self, frame: np.ndarray):
+        """Run hand inference on the tracked region, falling back to full frame.
 
-        # Raised fist detection
-        if self._is_raised_fist(landmarks):
-            return "raised_fist", 0.85
+        Args:
+            frame: Input BGR image
 
-        return None, 0.0
+        Returns:
+            Hand landmarks of shape (hands, 21, 3) in full-frame coordinates
+        """
+        hands = None
+        self._frames_since_search += 1
+
+        if self._frames_since_search < self.redetect_interval:
+            if self.roi_per_hand and self.tracked_rois:
+                hands = self._process_hand_rois(frame)
+            elif not self.roi_per_hand and self.tracked_roi is not None:
+                hands = self._process_roi(frame, self.tracked_roi)
+            if hands is not None and len(hands) == 0:
+                logger.debug("Hand tracking lost, searching full frame")
+                hands = None
+
+        if hands is None:
+            hands = self._process_full_frame(frame)
+            self._frames_since_search = 0
+            self._hand_centers = []  # hand order may change after a search
+
+        if self.roi_per_hand:
+            self.tracked_rois = self._predict_hand_rois(hands, frame.shape)
+        else:
+            self.tracked_roi = self._predict_roi(hands, frame.shape)
+        return hands
 
-    def _detect_two_hand_gesture(
-        self, left_hand, right_hand
-    ) -> Tuple[Optional[str], float]:
-        """Detect gesture requiring two hands.
+    def _process_hand_rois(self, frame: np.ndarray):
+        """Run a single-hand backend on one crop per tracked hand.
 
         Args:
-            left_hand: Left hand landmarks
-            right_hand: Right hand landmarks
+            frame: Input BGR image
 
         Returns:
-            Tuple of (gesture_name, confidence)
+            Hand landmarks of shape (hands, 21, 3) in full-frame coordinates,
+            or an empty array if any tracked hand was lost
         """
-        # Two thumbs up detection
-        left_landmarks = left_hand.landmark
-        right_landmarks = right_hand.landmark
-
-        if self._is_thumbs_up(left_landmarks) and self._is_thumbs_up(right_landmarks):
-            return "two_thumbs_up", 0.95
+        hands = []
+        handedness: List[str] = []
+        for roi in self.tracked_rois:
+            found = self._process_roi(frame, roi)
+            if len(found) == 0:
+                return found
+            hands.append(found[:1])
+            handedness.extend(self.last_handedness[:1])
 
-        # Heart hands detection
-        if self._is_heart_hands(left_hand, right_hand):
-            return "heart_hands", 0.9
+        self.last_handedness = handedness
+        return np.concatenate(hands)
 
-        return None, 0.0
-
-    def _is_thumbs_up(self, landmarks) -> bool:
-        """Check if hand is showing thumbs up.
+    def _process_roi(self, frame: np.ndarray, roi: Tuple[int, int, int, int]):
+        """Run hand inference on a downscaled crop of the frame.
 
         Args:
-            landmarks: Hand landmarks
+            frame: Input BGR image
+            roi: Crop as (x, y, width, height) in pixels
 
         Returns:
-            True if thumbs up detected
+            Hand landmarks of shape (hands, 21, 3) mapped back to the full frame
         """
-        # Thumb tip (4) should be above thumb IP (3)
-        # Other fingers should be folded
-        thumb_tip = landmarks[4]
-        thumb_ip = landmarks[3]
-        index_tip = landmarks[8]
-        index_mcp = landmarks[5]
+        x, y, w, h = roi
+        crop = frame[y:y + h, x:x + w]
+
+        with self.perf_stats.measure("convert"):
+            scale = self.roi_size / max(w, h)
+            if scale < 1.0:
+                crop = cv2.resize(
+                    crop, (max(1, int(w * scale)), max(1, int(h * scale))),
+                    interpolation=cv2.INTER_AREA
+                )
+            rgb_crop = cv2.cvtColor(crop, cv2.COLOR_BGR2RGB)
 
-        # Thumb is extended upward
-        thumb_up = thumb_tip.y < thumb_ip.y
+        with self.perf_stats.measure("inference"):
+            found = self.roi_backend.process(rgb_crop)
 
-        # Index finger is folded
-        index_folded = index_tip.y > index_mcp.y
+        # Map crop-normalized landmarks back to frame-normalized coordinates
+        self.last_handedness = found.handedness
+        hands = found.landmarks
+        frame_h, frame_w = frame.shape[:2]
+        hands *= np.array([w / frame_w, h / frame_h, w / frame_w], dtype=np.float32)
+        hands[..., 0] += x / frame_w
+        hands[..., 1] += y / frame_h
+        return hands
 
-        return thumb_up and index_folded
+    def _predict_roi(self, hands: np.ndarray, frame_shape) -> Optional[Tuple[int, int, int, int]]:
+        """Predict the next frame's hand region from the current landmarks.
 
-    def _is_thumbs_down(self, landmarks) -> bool:
-        """Check if hand is showing thumbs down.
+        The box around all detected hands is padded, made square and
+        shifted by the hands' motion since the previous frame.
 
         Args:
-            landmarks: Hand landmarks
+            hands: Hand landmarks of shape (hands, 21, 3) in full-frame coordinates
+            frame_shape: Shape of the input frame
 
         Returns:
-            True if thumbs down detected
+            Region as (x, y, width, height) in pixels, or None to search
+            the full frame next time
         """
-        thumb_tip = landmarks[4]
-        thumb_ip = landmarks[3]
-        index_tip = landmarks[8]
-        index_mcp = landmarks[5]
+        if len(hands) == 0:
+            self._roi_center = None
+            return None
 
-        # Thumb is extended downward
-        thumb_down = thumb_tip.y > thumb_ip.y
+        roi, self._roi_center = self._square_roi(hands, frame_shape, self._roi_center)
+        return roi
 
-        # Index finger is folded
-        index_folded = index_tip.y > index_mcp.y
+    def _predict_hand_rois(self, hands: np.ndarray, frame_shape) -> List[Tuple[int, int, int, int]]:
+        """Predict the next frame's region of every hand separately.
 
-        return thumb_down and index_folded
+        Args:
+            hands: Hand landmarks of shape (hands, 21, 3) in full-frame coordinates
+            frame_shape: Shape of the input frame
 
-    def _is_peace_sign(self, landmarks) -> bool:
-        """Check if hand is showing peace sign (V).
+        Returns:
+            One region per hand, or an empty list to search the full frame
+            next time
+        """
+        rois, centers = [], []
+        for i, hand in enumerate(hands):
+            previous = self._hand_centers[i] if i < len(self._hand_centers) else None
+            roi, center = self._square_roi(hand[np.newaxis], frame_shape, previous)
+            if roi is None:
+                self._hand_centers = []
+                return []
+            rois.append(roi)
+            centers.append(center)
+
+        self._hand_centers = centers
+        return rois
+
+    def _square_roi(
+        self, hands: np.ndarray, frame_shape, previous: Optional[Tuple[float, float]]
+    ) -> Tuple[Optional[Tuple[int, int, int, int]], Tuple[float, float]]:
+        """Compute a padded square region around hands, shifted by their motion.
 
         Args:
-            landmarks: Hand landmarks
+            hands: Hand landmarks of shape (hands, 21, 3) in full-frame coordinates
+            frame_shape: Shape of the input frame
+            previous: Center of the hands in the previous frame, if known
 
         Returns:
-            True if peace sign detected
+            Tuple of (region as (x, y, width, height) or None if it would
+            cover most of the frame, current center of the hands)
         """
-        # Index and middle fingers extended, others folded
-        index_tip = landmarks[8]
-        index_pip = landmarks[6]
-        middle_tip = landmarks[12]
-        middle_pip = landmarks[10]
-        ring_tip = landmarks[16]
-        ring_pip = landmarks[14]
+        frame_h, frame_w = frame_shape[:2]
+        points = hands[..., :2].reshape(-1, 2) * (frame_w, frame_h)
+        min_x, min_y = points.min(axis=0)
+        max_x, max_y = points.max(axis=0)
+        center_x, center_y = (min_x + max_x) / 2, (min_y + max_y) / 2
+        center = (center_x, center_y)
 
-        index_extended = index_tip.y < index_pip.y
-        middle_extended = middle_tip.y < middle_pip.y
-        ring_folded = ring_tip.y > ring_pip.y
+        # Constant-velocity prediction of where the hands will be next
+        if previous is not None:
+            center_x += center_x - previous[0]
+            center_y += center_y - previous[1]
 
-        return index_extended and middle_extended and ring_folded
+        side = max(max_x - min_x, max_y - min_y) * (1 + 2 * self.roi_padding)
+        side = int(min(side, frame_w, frame_h))
 
-    def _is_raised_fist(self, landmarks) -> bool:
-        """Check if hand is showing raised fist.
+        # Cropping most of the frame gains nothing over a full-frame search
+        if side * side > 0.6 * frame_w * frame_h:
+            return None, center
 
-        Args:
-            landmarks: Hand landmarks
+        x = int(min(max(center_x - side / 2, 0), frame_w - side))
+        y = int(min(max(center_y - side / 2, 0), frame_h - side))
+        return (x, y, side, side), center
 
-        Returns:
-            True if raised fist detected
-        """
-        # All fingers folded
-        fingers_folded = all(
-            landmarks[tip].y > landmarks[pip].y
-            for tip, pip in [(8, 6), (12, 10), (16, 14), (20, 18)]
-        )
+    def warm_up(self, width: int = 640, height: int = 480, num_frames: int = 2) -> None:
+        """Run inference on blank frames so the first real frame is not slow.
 
-        return fingers_folded
-
-    def _is_heart_hands(self, left_hand, right_hand) -> bool:
-        """Check if two hands are forming a heart shape.
+        The first calls into a backend allocate its buffers and initialize
+        the inference graph, which can take far longer than a steady-state
+        frame. Nothing is classified or recorded.
 
         Args:
-            left_hand: Left hand landmarks
-            right_hand: Right hand landmarks
-
-        Returns:
-            True if heart hands detected
+            width: Frame width in pixels
+            height: Frame height in pixels
+            num_frames: Number of blank frames per backend
         """
-        # Simplified check: thumbs and index fingers close together
-        left_thumb = left_hand.landmark[4]
-        right_thumb = right_hand.landmark[4]
+        start = time.perf_counter()
+        blank = np.zeros((height, width, 3), dtype=np.uint8)
+        crop = np.zeros((self.roi_size, self.roi_size, 3), dtype=np.uint8)
 
-        distance = np.sqrt(
-            (left_thumb.x - right_thumb.x)**2 +
-            (left_thumb.y - right_thumb.y)**2
-        )
+        for _ in range(num_frames):
+            self.backend.process(blank)
+            if self.roi_backend is not None and self.roi_backend is not self.backend:
+                self.roi_backend.process(crop)
 
-        # Thumbs are close together (forming top of heart)
-        return distance < 0.15
+        logger.info(f"GestureDetector warmed up in {time.perf_counter() - start:.2f}s")
 
-    def draw_landmarks(self, frame: np.ndarray, results) -> np.ndarray:
+    def draw_landmarks(self, frame: np.ndarray, hands: np.ndarray) -> np.ndarray:
         """Draw hand landmarks on frame for debugging.
 
         Args:
             frame: Input frame
-            results: MediaPipe results
+            hands: Hand landmarks of shape (hands, 21, 3)
 
         Returns:
             Frame with landmarks drawn
         """
-        if results.multi_hand_landmarks:
-            for hand_landmarks in results.multi_hand_landmarks:
-                self.mp_drawing.draw_landmarks(
-                    frame,
-                    hand_landmarks,
-                    self.mp_hands.HAND_CONNECTIONS
-                )
+        h, w = frame.shape[:2]
+        for hand in hands:
+            points = (hand[:, :2] * (w, h)).astype(np.int32)
+            for start, end in HAND_CONNECTIONS:
+                cv2.line(frame, tuple(points[start]), tuple(points[end]), (255, 255, 255), 2)
+            for point in points:
+                cv2.circle(frame, tuple(point), 3, (0, 0, 255), -1)
         return frame
 
     def cleanup(self) -> None:
         """Release resources."""
-        if self.hands:
-            self.hands.close()
+        if self.backend:
+            self.backend.close()
+        if self.roi_backend and self.roi_backend is not self.backend:
+            self.roi_backend.close()
+        if self.recorder:
+            self.recorder.close()
         logger.info("GestureDetector cleanup complete")
@@ -0,0 +1,294 @@
+"""Batched gesture rules over hand landmark arrays.
+
+Landmarks are converted once per frame into a ``(hands, 21, 3)`` array of
+normalized (x, y, z) coordinates. Every gesture rule is then evaluated
+for all hands at once with array comparisons, producing a confidence per
+gesture instead of walking landmark objects once per candidate gesture.
+
+With more than two hands in frame (group or room cameras), hands are
+paired for two-hand gestures by handedness and wrist distance, and every
+remaining hand is classified on its own (``classify_hands``).
+"""
+
+import logging
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+NUM_LANDMARKS = 21
+
+# MediaPipe hand landmark indices
+WRIST = 0
+THUMB_IP, THUMB_TIP = 3, 4
+INDEX_MCP, INDEX_PIP, INDEX_TIP = 5, 6, 8
+MIDDLE_MCP, MIDDLE_PIP, MIDDLE_TIP = 9, 10, 12
+RING_PIP, RING_TIP = 14, 16
+PINKY_PIP, PINKY_TIP = 18, 20
+
+FINGER_TIPS = np.array([INDEX_TIP, MIDDLE_TIP, RING_TIP, PINKY_TIP])
+FINGER_PIPS = np.array([INDEX_PIP, MIDDLE_PIP, RING_PIP, PINKY_PIP])
+
+# Gestures and the confidence reported when their rule matches. Order is
+# priority order; it matches confidence order, so argmax picks the winner.
+SINGLE_HAND_GESTURES = ("thumbs_up", "thumbs_down", "peace_sign", "raised_fist")
+SINGLE_HAND_CONFIDENCE = np.array([0.9, 0.9, 0.85, 0.85])
+
+TWO_HAND_GESTURES = ("two_thumbs_up", "heart_hands")
+TWO_HAND_CONFIDENCE = np.array([0.95, 0.9])
+
+# Maximum normalized distance between thumb tips for heart hands
+HEART_THUMB_DISTANCE = 0.15
+
+# Maximum wrist distance, in palm lengths, for two hands to be paired
+PAIR_MAX_DISTANCE = 6.0
+
+# Palm lengths are clamped to this fraction of the frame, so degenerate
+# landmarks do not make every distance infinite
+MIN_PALM_LENGTH = 0.01
+
+
+class HandGesture(NamedTuple):
+    """A gesture shown by one hand or a pair of hands."""
+
+    gesture: str
+    confidence: float
+    hands: Tuple[int, ...]  # indices into the frame's hands
+
+
+def landmarks_to_array(multi_hand_landmarks) -> np.ndarray:
+    """Convert MediaPipe hand landmarks to an array.
+
+    Args:
+        multi_hand_landmarks: Sequence of MediaPipe landmark lists, or None
+
+    Returns:
+        Array of shape (hands, 21, 3) with normalized x, y, z
+    """
+    if not multi_hand_landmarks:
+        return np.empty((0, NUM_LANDMARKS, 3), dtype=np.float32)
+
+    return np.array(
+        [[(lm.x, lm.y, lm.z) for lm in hand.landmark] for hand in multi_hand_landmarks],
+        dtype=np.float32
+    ).reshape(-1, NUM_LANDMARKS, 3)
+
+
+def single_hand_scores(hands: np.ndarray) -> np.ndarray:
+    """Score every single-hand gesture for every hand.
+
+    Args:
+        hands: Landmarks of shape (hands, 21, 3)
+
+    Returns:
+        Confidences of shape (hands, len(SINGLE_HAND_GESTURES)), zero
+        where the gesture's rule does not match
+    """
+    y = hands[..., 1]
+
+    thumb_up = y[:, THUMB_TIP] < y[:, THUMB_IP]
+    thumb_down = y[:, THUMB_TIP] > y[:, THUMB_IP]
+    index_folded = y[:, INDEX_TIP] > y[:, INDEX_MCP]
+
+    # Tip above PIP means extended, below means folded
+    extended = y[:, FINGER_TIPS] < y[:, FINGER_PIPS]
+    folded = y[:, FINGER_TIPS] > y[:, FINGER_PIPS]
+
+    matches = np.stack([
+        thumb_up & index_folded,
+        thumb_down & index_folded,
+        extended[:, 0] & extended[:, 1] & folded[:, 2],
+        folded.all(axis=1),
+    ], axis=1)
+
+    return matches * SINGLE_HAND_CONFIDENCE
+
+
+def two_hand_scores(
+    hands: np.ndarray, pairs: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """Score every two-hand gesture for pairs of hands.
+
+    Args:
+        hands: Landmarks of shape (hands, 21, 3)
+        pairs: Hand index pairs of shape (pairs, 2); defaults to the
+            first two hands
+
+    Returns:
+        Confidences of shape (pairs, len(TWO_HAND_GESTURES))
+    """
+    if pairs is None:
+        pairs = np.array([[0, 1]])
+
+    single = single_hand_scores(hands)
+    thumbs_up = single[:, SINGLE_HAND_GESTURES.index("thumbs_up")] > 0
+
+    first, second = pairs[:, 0], pairs[:, 1]
+    thumb_gap = np.linalg.norm(
+        hands[first, THUMB_TIP, :2] - hands[second, THUMB_TIP, :2], axis=1
+    )
+
+    matches = np.stack([
+        thumbs_up[first] & thumbs_up[second],
+        thumb_gap < HEART_THUMB_DISTANCE,
+    ], axis=1)
+
+    return matches * TWO_HAND_CONFIDENCE
+
+
+def pair_hands(
+    hands: np.ndarray,
+    handedness: Optional[Sequence[str]] = None,
+    max_distance: float = PAIR_MAX_DISTANCE
+) -> np.ndarray:
+    """Pair hands that may form a two-hand gesture.
+
+    All wrist-to-wrist distances are computed at once as a pairwise
+    matrix, in units of the two hands' mean palm length so people far
+    from the camera pair as readily as people close to it. Two hands with
+    the same known handedness are never paired. Pairs are then chosen
+    greedily, closest first, so every hand is in at most one pair.
+
+    Args:
+        hands: Landmarks of shape (hands, 21, 3)
+        handedness: "Left"/"Right" per hand; empty or missing entries
+            pair with anything
+        max_distance: Maximum wrist distance in palm lengths
+
+    Returns:
+        Hand index pairs of shape (pairs, 2)
+    """
+    num_hands = len(hands)
+    if num_hands < 2:
+        return np.empty((0, 2), dtype=np.intp)
+
+    wrists = hands[:, WRIST, :2]
+    palm = np.linalg.norm(hands[:, MIDDLE_MCP, :2] - wrists, axis=1)
+    palm = np.maximum(palm, MIN_PALM_LENGTH)
+
+    distance = np.linalg.norm(wrists[:, np.newaxis] - wrists[np.newaxis], axis=-1)
+    distance /= (palm[:, np.newaxis] + palm[np.newaxis]) / 2
+
+    valid = np.triu(distance <= max_distance, k=1)
+    if handedness is not None and len(handedness) == num_hands:
+        labels = np.array([name or "" for name in handedness])
+        known = labels != ""
+        valid &= ~((labels[:, np.newaxis] == labels[np.newaxis]) & known[:, np.newaxis])
+
+    first, second = np.nonzero(valid)
+    order = np.argsort(distance[first, second], kind="stable")
+
+    pairs = []
+    paired = np.zeros(num_hands, dtype=bool)
+    for a, b in zip(first[order], second[order]):
+        if not paired[a] and not paired[b]:
+            paired[a] = paired[b] = True
+            pairs.append((a, b))
+
+    return np.array(pairs, dtype=np.intp).reshape(-1, 2)
+
+
+def best_gesture(
+    scores: np.ndarray, gestures: Sequence[str]
+) -> Tuple[Optional[str], float]:
+    """Pick the highest-confidence gesture from a score row.
+
+    Args:
+        scores: Confidences of shape (len(gestures),)
+        gestures: Gesture names matching the score columns
+
+    Returns:
+        Tuple of (gesture_name, confidence), or (None, 0.0) if no rule matched
+    """
+    index = int(np.argmax(scores))
+    confidence = float(scores[index])
+    if confidence <= 0.0:
+        return None, 0.0
+    return gestures[index], confidence
+
+
+def classify(hands: np.ndarray) -> Tuple[Optional[str], float]:
+    """Classify the gesture shown by one or two hands.
+
+    Args:
+        hands: Landmarks of shape (hands, 21, 3)
+
+    Returns:
+        Tuple of (gesture_name, confidence)
+    """
+    if len(hands) == 1:
+        return best_gesture(single_hand_scores(hands)[0], SINGLE_HAND_GESTURES)
+    if len(hands) == 2:
+        return best_gesture(two_hand_scores(hands)[0], TWO_HAND_GESTURES)
+    return None, 0.0
+
+
+def _best_rows(scores: np.ndarray, gestures: Sequence[str]) -> Tuple[List[Optional[str]], np.ndarray]:
+    """Pick the highest-confidence gesture of every score row.
+
+    Args:
+        scores: Confidences of shape (rows, len(gestures))
+        gestures: Gesture names matching the score columns
+
+    Returns:
+        Tuple of (gesture name or None per row, confidence per row)
+    """
+    index = np.argmax(scores, axis=1)
+    confidence = scores[np.arange(len(scores)), index]
+    names = [gestures[i] if c > 0.0 else None for i, c in zip(index, confidence)]
+    return names, confidence
+
+
+def classify_hands(
+    hands: np.ndarray,
+    handedness: Optional[Sequence[str]] = None,
+    classifiers: Optional[Dict[int, object]] = None,
+    min_confidence: float = 0.0
+) -> List[HandGesture]:
+    """Classify the gestures of any number of hands.
+
+    Hands are paired with ``pair_hands`` and every pair is scored for
+    two-hand gestures in one batch. Hands not used by a two-hand gesture
+    are then scored for single-hand gestures, also in one batch, so the
+    cost grows linearly with the number of hands apart from the small
+    distance matrix.
+
+    Args:
+        hands: Landmarks of shape (hands, 21, 3)
+        handedness: "Left"/"Right" per hand
+        classifiers: Learned classifiers by number of hands, each with a
+            ``classify_batch`` method; the rules cover missing ones
+        min_confidence: Minimum confidence for a gesture to be reported
+            (and for a pair to claim its hands)
+
+    Returns:
+        Detected gestures, two-hand gestures first
+    """
+    classifiers = classifiers or {}
+    results: List[HandGesture] = []
+    used = np.zeros(len(hands), dtype=bool)
+
+    pairs = pair_hands(hands, handedness)
+    if len(pairs):
+        if 2 in classifiers:
+            names, confidence = classifiers[2].classify_batch(hands[pairs])
+        else:
+            names, confidence = _best_rows(two_hand_scores(hands, pairs), TWO_HAND_GESTURES)
+
+        for (a, b), name, score in zip(pairs, names, confidence):
+            if name is not None and score > 0.0 and score >= min_confidence:
+                used[[a, b]] = True
+                results.append(HandGesture(name, float(score), (int(a), int(b))))
+
+    single = np.flatnonzero(~used)
+    if len(single):
+        if 1 in classifiers:
+            names, confidence = classifiers[1].classify_batch(hands[single, np.newaxis])
+        else:
+            names, confidence = _best_rows(single_hand_scores(hands[single]), SINGLE_HAND_GESTURES)
+
+        for index, name, score in zip(single, names, confidence):
+            if name is not None and score > 0.0 and score >= min_confidence:
+                results.append(HandGesture(name, float(score), (int(index),)))
+
+    return results
@@ -0,0 +1,249 @@
+"""Recording and replay of hand landmarks.
+
+Each detector frame is stored as one fixed-size record (timestamp, hand
+count, handedness and landmarks) in a ``.npy`` file with a structured
+dtype, so a recording can be memory-mapped and sliced without parsing.
+``ReplayDetector`` feeds a recording back through the gesture rules (or a
+learned classifier) without MediaPipe, which makes the classification and
+rendering stages testable and profilable on machines without a camera.
+"""
+
+import logging
+import struct
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+import numpy as np
+
+from gesture_classifier import GestureClassifier, load_classifier
+from gesture_rules import NUM_LANDMARKS, HandGesture, classify_hands
+
+logger = logging.getLogger(__name__)
+
+# Handedness codes stored per hand
+HANDEDNESS_CODES = {"Left": 1, "Right": 2}
+HANDEDNESS_NAMES = {code: name for name, code in HANDEDNESS_CODES.items()}
+
+# Fixed .npy header size, so the record count can be patched in place
+HEADER_SIZE = 256
+
+
+def record_dtype(max_hands: int = 2) -> np.dtype:
+    """Get the record dtype for a recording.
+
+    Args:
+        max_hands: Maximum number of hands stored per frame
+
+    Returns:
+        Structured dtype of one frame record
+    """
+    return np.dtype([
+        ("t", "<f8"),
+        ("num_hands", "u1"),
+        ("handedness", "u1", (max_hands,)),
+        ("landmarks", "<f4", (max_hands, NUM_LANDMARKS, 3)),
+    ])
+
+
+class LandmarkRecorder:
+    """Streams per-frame landmarks to a ``.npy`` file."""
+
+    def __init__(self, path: Union[str, Path], max_hands: int = 2):
+        """Initialize landmark recorder.
+
+        Args:
+            path: Output ``.npy`` file path
+            max_hands: Maximum number of hands stored per frame
+        """
+        self.path = Path(path)
+        self.max_hands = max_hands
+        self.dtype = record_dtype(max_hands)
+        self.count = 0
+        self._record = np.zeros(1, dtype=self.dtype)
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "wb")
+        self._write_header()
+
+        logger.info(f"Recording landmarks to {self.path}")
+
+    def _write_header(self) -> None:
+        """Write the ``.npy`` header for the current record count."""
+        header = repr({
+            "descr": np.lib.format.dtype_to_descr(self.dtype),
+            "fortran_order": False,
+            "shape": (self.count,),
+        })
+        # magic (8 bytes) + header length (2 bytes) + padded header
+        header = header.ljust(HEADER_SIZE - 10 - 1) + "\n"
+        self._file.seek(0)
+        self._file.write(np.lib.format.magic(1, 0))
+        self._file.write(struct.pack("<H", len(header)))
+        self._file.write(header.encode("latin1"))
+
+    def record(self, timestamp: float, hands: np.ndarray, handedness: Sequence[str] = ()) -> None:
+        """Append one frame.
+
+        Args:
+            timestamp: Frame time in seconds
+            hands: Landmarks of shape (hands, 21, 3); extra hands are dropped
+            handedness: "Left"/"Right" per hand
+        """
+        if self._file is None:
+            return
+
+        record = self._record
+        num_hands = min(len(hands), self.max_hands)
+        record["t"] = timestamp
+        record["num_hands"] = num_hands
+        record["handedness"] = 0
+        record["landmarks"] = 0.0
+        record["landmarks"][0, :num_hands] = hands[:num_hands]
+        for i, name in enumerate(handedness[:num_hands]):
+            record["handedness"][0, i] = HANDEDNESS_CODES.get(name, 0)
+
+        self._file.write(self._record.tobytes())
+        self.count += 1
+
+    def close(self) -> None:
+        """Finish the file by writing the final record count."""
+        if self._file is None:
+            return
+        self._write_header()
+        self._file.close()
+        self._file = None
+        logger.info(f"Recorded {self.count} frames to {self.path}")
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+
+
+def load_recording(path: Union[str, Path], mmap: bool = True) -> np.ndarray:
+    """Load a landmark recording.
+
+    Args:
+        path: Recording ``.npy`` file
+        mmap: Memory-map the file instead of reading it
+
+    Returns:
+        Structured array of frame records
+    """
+    return np.load(path, mmap_mode="r" if mmap else None)
+
+
+def record_hands(record) -> Tuple[np.ndarray, List[str]]:
+    """Get the hands stored in a record.
+
+    Args:
+        record: One element of a recording
+
+    Returns:
+        Tuple of (landmarks of shape (hands, 21, 3), handedness names)
+    """
+    num_hands = int(record["num_hands"])
+    handedness = [HANDEDNESS_NAMES.get(int(code), "") for code in record["handedness"][:num_hands]]
+    return np.asarray(record["landmarks"][:num_hands]), handedness
+
+
+class ReplayDetector:
+    """Gesture detector that replays recorded landmarks instead of inferring."""
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        confidence_threshold: float = 0.8,
+        classifier_paths: Sequence[str] = (),
+        loop: bool = False
+    ):
+        """Initialize replay detector.
+
+        Args:
+            path: Recording ``.npy`` file
+            confidence_threshold: Minimum confidence for gesture detection (0.0-1.0)
+            classifier_paths: Learned classifier weight files, as for
+                ``GestureDetector``
+            loop: Restart from the beginning when the recording ends
+        """
+        self.records = load_recording(path)
+        self.confidence_threshold = confidence_threshold
+        self.loop = loop
+        self.position = 0
+        self.last_gesture: Optional[str] = None
+        self.last_confidence: float = 0.0
+        self.last_hand_count = 0
+        self.last_handedness: List[str] = []
+        self.last_gestures: List[HandGesture] = []
+        self.last_timestamp: Optional[float] = None
+
+        self.classifiers: Dict[int, GestureClassifier] = {}
+        for classifier_path in classifier_paths:
+            classifier = load_classifier(classifier_path)
+            if classifier is not None:
+                self.classifiers[classifier.num_hands] = classifier
+
+        logger.info(f"ReplayDetector loaded {len(self.records)} frames from {path}")
+
+    def __len__(self) -> int:
+        """Number of recorded frames."""
+        return len(self.records)
+
+    @property
+    def finished(self) -> bool:
+        """Whether every record has been replayed."""
+        return not self.loop and self.position >= len(self.records)
+
+    def detect(self, frame: Optional[np.ndarray] = None) -> Optional[str]:
+        """Replay the next recorded frame.
+
+        Args:
+            frame: Ignored; accepted for compatibility with ``GestureDetector``
+
+        Returns:
+            Detected gesture name or None
+        """
+        if self.position >= len(self.records):
+            if not self.loop or len(self.records) == 0:
+                return None
+            self.position = 0
+
+        record = self.records[self.position]
+        self.position += 1
+
+        hands, self.last_handedness = record_hands(record)
+        self.last_timestamp = float(record["t"])
+        self.last_hand_count = len(hands)
+        if len(hands) == 0:
+            self.last_gesture = None
+            self.last_gestures = []
+            return None
+
+        found = classify_hands(
+            hands, self.last_handedness, self.classifiers,
+            min_confidence=self.confidence_threshold
+        )
+        self.last_confidence = max((g.confidence for g in found), default=0.0)
+        self.last_gestures = [g for g in found if g.confidence >= self.confidence_threshold]
+        if not self.last_gestures:
+            return None
+
+        self.last_gesture = max(self.last_gestures, key=lambda g: g.confidence).gesture
+        return self.last_gesture
+
+    def frames(self) -> Iterator[Tuple[float, Optional[str]]]:
+        """Replay the remaining records.
+
+        Yields:
+            Tuple of (timestamp, detected gesture or None)
+        """
+        while not self.finished:
+            gesture = self.detect()
+            yield self.last_timestamp, gesture
+
+    def cleanup(self) -> None:
+        """Release the recording."""
+        self.records = np.empty(0, dtype=self.records.dtype)
+        logger.info("ReplayDetector cleanup complete")
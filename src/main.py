@@ -8,75 +8,112 @@ camera output, and the user interface.
 import sys
 import logging
 import signal
+import threading
+import time
 from pathlib import Path
-from typing import Optional
-
-from PyQt5.QtWidgets import QApplication, QMessageBox
-from PyQt5.QtCore import QThread, pyqtSignal
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
 
+# Only lightweight modules are imported here. PyQt5, OpenCV, MediaPipe,
+# the effects and pyvirtualcam are imported where they are first used,
+# so the window can appear before the heavy modules have loaded.
 from config import Config
-from gesture_detector import GestureDetector
-from animation_engine import AnimationEngine
-from virtual_camera import VirtualCamera
-from ui.main_window import MainWindow
-
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.FileHandler("logs/camera_reactions.log"),
-        logging.StreamHandler()
-    ]
-)
+from frame_scheduler import FrameScheduler
+from perf_stats import PerfStats
+from frame_tracer import FrameTracer
+
+if TYPE_CHECKING:
+    from animation_engine import AnimationEngine
+    from camera_capture import CameraCapture
+    from ui.main_window import MainWindow
+    from virtual_camera import VirtualCamera
+
+
 logger = logging.getLogger(__name__)
 
 
+def configure_logging() -> None:
+    """Configure application logging to the console and logs/."""
+    Path("logs").mkdir(exist_ok=True)
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        handlers=[
+            logging.FileHandler("logs/camera_reactions.log"),
+            logging.StreamHandler()
+        ]
+    )
+
+
 class CameraReactionsApp:
     """Main application class coordinating all components."""
 
     def __init__(self):
         """Initialize the Camera Reactions application."""
         self.config = Config()
-        self.gesture_detector: Optional[GestureDetector] = None
-        self.animation_engine: Optional[AnimationEngine] = None
-        self.virtual_camera: Optional[VirtualCamera] = None
-        self.main_window: Optional[MainWindow] = None
+        self.gesture_detector = None
+        self.animation_engine: Optional["AnimationEngine"] = None
+        self.virtual_camera: Optional["VirtualCamera"] = None
+        self.capture: Optional["CameraCapture"] = None
+        self.main_window: Optional["MainWindow"] = None
+        self.scheduler: Optional[FrameScheduler] = None
+        self.perf_stats = PerfStats()
+        self.tracer: Optional[FrameTracer] = None
         self.running = False
 
+        # Staged startup: slow components are built on background threads
+        # and each stage sets its event once the component is usable
+        self.start_time = time.perf_counter()
+        self.detector_ready = threading.Event()
+        self.camera_ready = threading.Event()
+        self.effects_ready = threading.Event()
+        self._stages: Dict[str, threading.Event] = {
+            "gesture detector": self.detector_ready,
+            "virtual camera": self.camera_ready,
+            "effects": self.effects_ready,
+        }
+        self.init_errors: Dict[str, str] = {}
+        self._init_threads: List[threading.Thread] = []
+        self._first_frame_logged = False
+
+        if self.config.get("enable_tracing", False):
+            self.tracer = FrameTracer()
+            self.perf_stats.tracer = self.tracer
+
+        if self.config.get("adaptive_scheduling", True):
+            self.scheduler = FrameScheduler(
+                deadline=self.config.get("frame_deadline_ms", 33) / 1000.0
+            )
+
         # Ensure logs directory exists
         Path("logs").mkdir(exist_ok=True)
 
     def initialize_components(self) -> bool:
         """Initialize all application components.
 
+        The animation engine is created right away; the gesture detector,
+        the virtual camera and the effect renderers are built on
+        background threads so the preview runs while they load. Frames
+        skip detection and virtual camera output until their stage is
+        ready.
+
         Returns:
             True if initialization successful, False otherwise
         """
+        from animation_engine import AnimationEngine
+
         try:
             logger.info("Initializing Camera Reactions...")
 
-            # Initialize gesture detector
-            self.gesture_detector = GestureDetector(
-                confidence_threshold=self.config.get("gesture_confidence", 0.8)
-            )
-            logger.info("Gesture detector initialized")
-
-            # Initialize animation engine
+            # Initialize animation engine (effects are loaded on demand)
             self.animation_engine = AnimationEngine(
-                effect_duration=self.config.get("effect_duration", 3.0)
+                effect_duration=self.config.get("effect_duration", 3.0),
+                perf_stats=self.perf_stats
             )
             logger.info("Animation engine initialized")
 
-            # Initialize virtual camera
-            self.virtual_camera = VirtualCamera(
-                camera_name="Camera Reactions Virtual Camera",
-                width=self.config.get("camera_width", 1280),
-                height=self.config.get("camera_height", 720),
-                fps=self.config.get("camera_fps", 30)
-            )
-            logger.info("Virtual camera initialized")
+            self._start_stage("gesture detector", self._init_gesture_detector, self.detector_ready)
+            self._start_stage("virtual camera", self._init_virtual_camera, self.camera_ready)
+            self._start_stage("effects", self._init_effects, self.effects_ready)
 
             return True
 
@@ -84,9 +121,139 @@ class CameraReactionsApp:
             logger.error(f"Failed to initialize components: {e}", exc_info=True)
             return False
 
+    def _start_stage(self, name: str, build: Callable[[], None], ready: threading.Event) -> None:
+        """Run an initialization stage on a background thread.
+
+        Args:
+            name: Stage name for logs and status
+            build: Callable that creates the component
+            ready: Event set once the component is usable
+        """
+        def run() -> None:
+            stage_start = time.perf_counter()
+            try:
+                build()
+                ready.set()
+                logger.info(
+                    f"{name.capitalize()} ready in {time.perf_counter() - stage_start:.2f}s "
+                    f"({time.perf_counter() - self.start_time:.2f}s after startup)"
+                )
+            except Exception as e:
+                self.init_errors[name] = str(e)
+                logger.error(f"Failed to initialize {name}: {e}", exc_info=True)
+
+        thread = threading.Thread(target=run, name=f"init-{name.replace(' ', '-')}", daemon=True)
+        self._init_threads.append(thread)
+        thread.start()
+
+    def _init_gesture_detector(self) -> None:
+        """Build the gesture detector and warm it up."""
+        detector = self._create_gesture_detector()
+
+        # The first inferences initialize the graph; pay for them here
+        # rather than on the first real frames
+        warm_up = getattr(detector, "warm_up", None)
+        if warm_up is not None:
+            width, height = self._output_size()
+            warm_up(width, height)
+
+        self.gesture_detector = detector
+
+    def _init_virtual_camera(self) -> None:
+        """Open the virtual camera device."""
+        from virtual_camera import VirtualCamera
+
+        # Created at the capture size, so frames never need resizing on
+        # the way out
+        width, height = self._output_size()
+        self.virtual_camera = VirtualCamera(
+            camera_name="Camera Reactions Virtual Camera",
+            width=width,
+            height=height,
+            fps=self.config.get("camera_fps", 30),
+            pixel_format=self.config.get("virtual_camera_format", "auto"),
+            perf_stats=self.perf_stats
+        )
+
+    def _init_effects(self) -> None:
+        """Load every effect renderer ahead of its first gesture."""
+        for gesture_name in self.animation_engine.gestures:
+            self.animation_engine.get_renderer(gesture_name)
+
+    def get_status(self) -> str:
+        """Get a short startup status for the UI.
+
+        Returns:
+            Status text
+        """
+        pending = [
+            name for name, event in self._stages.items()
+            if not event.is_set() and name not in self.init_errors
+        ]
+        if pending:
+            return f"Loading {', '.join(pending)}..."
+        if self.init_errors:
+            return f"Unavailable: {', '.join(self.init_errors)} (see logs)"
+        return "Ready"
+
+    def _create_gesture_detector(self):
+        """Create the gesture detector for the configured detection mode.
+
+        Returns:
+            Detector exposing ``detect(frame)`` and ``cleanup()``
+        """
+        from gesture_detector import GestureDetector
+        from async_detector import AsyncGestureDetector
+        from detector_pool import ProcessGestureDetector
+        from motion_gate import MotionGatedDetector
+
+        detector_kwargs = {
+            "confidence_threshold": self.config.get("gesture_confidence", 0.8),
+            "tracking_mode": self.config.get("detection_tracking", False),
+            "roi_size": self.config.get("detection_roi_size", 256),
+            "backend": self.config.get("detector_backend", "solutions"),
+            "model_path": self.config.get("detector_model_path"),
+            "max_num_hands": self.config.get("max_num_hands", 2),
+            "classifier_paths": self.config.get("gesture_classifier_paths", []),
+        }
+        mode = self.config.get("detection_mode", "sync")
+
+        record_path = self.config.get("landmark_recording_path")
+
+        if mode == "process":
+            if record_path:
+                logger.warning("Landmark recording is not supported in process mode")
+            detector = ProcessGestureDetector(
+                num_workers=self.config.get("detection_workers", 2),
+                **detector_kwargs
+            )
+        else:
+            detector = GestureDetector(
+                record_path=record_path, perf_stats=self.perf_stats, **detector_kwargs
+            )
+
+            if mode == "async":
+                detector = AsyncGestureDetector(
+                    detector, rate_hz=self.config.get("detection_rate_hz", 15)
+                )
+            elif mode != "sync":
+                logger.warning(f"Unknown detection mode '{mode}', using sync")
+
+        # Skip inference entirely while nothing in the scene moves
+        if self.config.get("motion_gating", True):
+            detector = MotionGatedDetector(
+                detector,
+                motion_threshold=self.config.get("motion_threshold", 0.01),
+                keepalive_interval=self.config.get("motion_keepalive_s", 2.0),
+                perf_stats=self.perf_stats
+            )
+
+        return detector
+
     def start(self) -> None:
         """Start the camera reactions system."""
         if not self.initialize_components():
+            from PyQt5.QtWidgets import QMessageBox
             QMessageBox.critical(
                 None,
                 "Initialization Error",
@@ -97,11 +264,48 @@ class CameraReactionsApp:
         self.running = True
         logger.info("Camera Reactions started successfully")
 
+    def open_camera(self) -> Optional["CameraCapture"]:
+        """Open the webcam in the configured output mode.
+
+        Returns:
+            Opened camera capture, or None if the camera is unavailable
+        """
+        from camera_capture import CameraCapture
+
+        capture = CameraCapture(
+            index=self.config.get("camera_index", 0),
+            width=self.config.get("camera_width", 1280),
+            height=self.config.get("camera_height", 720),
+            fps=self.config.get("camera_fps", 30),
+            fourcc=self.config.get("camera_fourcc", "MJPG") or None,
+            buffer_size=self.config.get("camera_buffer_size", 1)
+        )
+        if not capture.open():
+            return None
+
+        self.capture = capture
+        return capture
+
+    def _output_size(self) -> Tuple[int, int]:
+        """Get the virtual camera size.
+
+        Returns:
+            (width, height) granted by the webcam, or the configured size
+        """
+        if self.capture is not None:
+            return self.capture.frame_size
+        return self.config.get("camera_width", 1280), self.config.get("camera_height", 720)
+
     def stop(self) -> None:
         """Stop the camera reactions system and cleanup resources."""
         logger.info("Stopping Camera Reactions...")
         self.running = False
 
+        # Let stages that are still loading finish, so their components
+        # are released below
+        for thread in self._init_threads:
+            thread.join(timeout=10.0)
+
         if self.virtual_camera:
             self.virtual_camera.stop()
 
@@ -111,13 +315,17 @@ class CameraReactionsApp:
         if self.gesture_detector:
             self.gesture_detector.cleanup()
 
+        if self.tracer:
+            self.save_trace()
+
         logger.info("Camera Reactions stopped")
 
-    def process_frame(self, frame):
+    def process_frame(self, frame, decision=None):
         """Process a single video frame.
 
         Args:
             frame: Input video frame from webcam
+            decision: Optional ``FrameDecision`` from the frame scheduler
 
         Returns:
             Processed frame with effects applied
@@ -125,28 +333,99 @@ class CameraReactionsApp:
         if not self.running:
             return frame
 
-        # Detect gesture
-        gesture = self.gesture_detector.detect(frame)
-
-        # Trigger animation if gesture detected
-        if gesture and self.config.is_gesture_enabled(gesture):
-            self.animation_engine.trigger_effect(gesture)
-            logger.debug(f"Triggered effect for gesture: {gesture}")
+        if not self._first_frame_logged:
+            self._first_frame_logged = True
+            logger.info(f"First frame after {time.perf_counter() - self.start_time:.2f}s")
+
+        if decision is not None:
+            self.animation_engine.set_quality(decision.quality)
+
+        # Detect gesture once the detector has finished loading
+        if self.detector_ready.is_set() and (decision is None or decision.detect):
+            start = time.perf_counter()
+            with self.perf_stats.measure("detect"):
+                gesture = self.gesture_detector.detect(frame)
+            if self.scheduler:
+                self.scheduler.record("detect", time.perf_counter() - start)
+
+            # Every person's gesture triggers its effect, not only the
+            # most confident one
+            gestures = [found.gesture for found in getattr(self.gesture_detector, "last_gestures", [])]
+            for name in dict.fromkeys(gestures or [gesture]):
+                if name and self.config.is_gesture_enabled(name):
+                    self.animation_engine.trigger_effect(name)
+                    logger.debug(f"Triggered effect for gesture: {name}")
 
         # Render animations on frame
-        output_frame = self.animation_engine.render(frame)
+        start = time.perf_counter()
+        with self.perf_stats.measure("render"):
+            output_frame = self.animation_engine.render(frame)
+        if self.scheduler:
+            self.scheduler.record("render", time.perf_counter() - start)
+
+        if self.config.get("show_debug_overlay", False):
+            # The engine passes the input through untouched when idle, and
+            # the input may still be in use by an asynchronous detector
+            if output_frame is frame:
+                output_frame = frame.copy()
+            output_frame = self.perf_stats.draw_overlay(output_frame)
 
         return output_frame
 
+    def get_perf_stats(self):
+        """Get per-stage timing percentiles.
+
+        Returns:
+            Dictionary mapping stage name to count, mean, p50, p95 and
+            p99 in milliseconds
+        """
+        return self.perf_stats.snapshot()
+
+    def save_trace(self, path: Optional[str] = None) -> None:
+        """Write recorded frame spans as a Chrome trace.
+
+        Args:
+            path: Output file (uses the ``trace_file`` setting if None)
+        """
+        if not self.tracer:
+            logger.warning("Tracing is disabled - set enable_tracing in config")
+            return
+
+        try:
+            self.tracer.save(path or self.config.get("trace_file", "logs/frame_trace.json"))
+        except Exception as e:
+            logger.error(f"Failed to save frame trace: {e}")
+
+    def output_frame(self, frame) -> bool:
+        """Send a processed frame to the virtual camera.
+
+        Args:
+            frame: Processed video frame
+
+        Returns:
+            True if the frame was delivered
+        """
+        if not self.running or not self.camera_ready.is_set():
+            return False
+
+        return self.virtual_camera.send_frame(frame)
+
 
 def signal_handler(signum, frame):
     """Handle system signals for graceful shutdown."""
+    from PyQt5.QtWidgets import QApplication
+
     logger.info("Received shutdown signal")
     QApplication.quit()
 
 
 def main():
     """Application entry point."""
+    configure_logging()
+
+    from PyQt5.QtWidgets import QApplication, QMessageBox
+    from ui.main_window import MainWindow
+
     # Set up signal handlers
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
@@ -165,6 +444,9 @@ def main():
         camera_app.main_window = window
         window.show()
 
+        # Paint the window before the detector and effects load
+        app.processEvents()
+
         # Start application
         camera_app.start()
 
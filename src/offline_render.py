@@ -0,0 +1,317 @@
+"""Headless offline renderer for recorded video.
+
+This module streams a video file or an image sequence through gesture
+detection and the animation engine without a camera, display or Qt, and
+writes the result to a file. It reports throughput, per-stage timings and
+the gestures that triggered effects, which makes it usable for batch
+processing recordings and for performance work on CI machines.
+
+Usage:
+    python src/offline_render.py meeting.mp4 -o meeting_reactions.mp4
+    python src/offline_render.py "frames/*.png" -o out_frames/ --fps 30
+"""
+
+import argparse
+import glob
+import json
+import logging
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+import cv2
+import numpy as np
+
+from config import Config
+from gesture_detector import GestureDetector
+from animation_engine import AnimationEngine
+from landmark_recording import ReplayDetector
+
+logger = logging.getLogger(__name__)
+
+IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".bmp", ".tif", ".tiff"}
+VIDEO_EXTENSIONS = {".mp4", ".avi", ".mov", ".mkv"}
+
+
+def read_frames(source: str, fps: Optional[float] = None) -> Tuple[Iterator[np.ndarray], float]:
+    """Open a video file, image directory or glob pattern.
+
+    Args:
+        source: Video file path, directory of images or glob pattern
+        fps: Frame rate to assume (required for image sequences without
+            a video container, overrides the video's own rate)
+
+    Returns:
+        Tuple of (frame iterator, frames per second)
+    """
+    path = Path(source)
+
+    if path.is_dir():
+        files = sorted(p for p in path.iterdir() if p.suffix.lower() in IMAGE_EXTENSIONS)
+    elif path.is_file() and path.suffix.lower() not in IMAGE_EXTENSIONS:
+        capture = cv2.VideoCapture(str(path))
+        if not capture.isOpened():
+            raise IOError(f"Failed to open video {source}")
+
+        video_fps = fps or capture.get(cv2.CAP_PROP_FPS) or 30.0
+
+        def video_frames() -> Iterator[np.ndarray]:
+            try:
+                while True:
+                    ret, frame = capture.read()
+                    if not ret:
+                        return
+                    yield frame
+            finally:
+                capture.release()
+
+        return video_frames(), video_fps
+    else:
+        files = [Path(p) for p in sorted(glob.glob(source))]
+
+    if not files:
+        raise IOError(f"No input frames found for {source}")
+
+    def image_frames() -> Iterator[np.ndarray]:
+        for file in files:
+            frame = cv2.imread(str(file))
+            if frame is None:
+                logger.warning(f"Skipping unreadable image {file}")
+                continue
+            yield frame
+
+    return image_frames(), fps or 30.0
+
+
+class FrameWriter:
+    """Writes frames to a video file or a directory of images."""
+
+    def __init__(self, output: str, fps: float):
+        """Initialize frame writer.
+
+        Args:
+            output: Video file path, or a directory for numbered PNG files
+            fps: Output frame rate for video files
+        """
+        self.output = Path(output)
+        self.fps = fps
+        self.writer: Optional[cv2.VideoWriter] = None
+        self.count = 0
+
+        if self.output.suffix.lower() not in VIDEO_EXTENSIONS:
+            self.output.mkdir(parents=True, exist_ok=True)
+
+    def write(self, frame: np.ndarray) -> None:
+        """Write a single frame.
+
+        Args:
+            frame: BGR image
+        """
+        if self.output.suffix.lower() in VIDEO_EXTENSIONS:
+            if self.writer is None:
+                height, width = frame.shape[:2]
+                fourcc = cv2.VideoWriter_fourcc(*"mp4v")
+                self.writer = cv2.VideoWriter(str(self.output), fourcc, self.fps, (width, height))
+            self.writer.write(frame)
+        else:
+            cv2.imwrite(str(self.output / f"frame_{self.count:06d}.png"), frame)
+        self.count += 1
+
+    def close(self) -> None:
+        """Finish writing."""
+        if self.writer is not None:
+            self.writer.release()
+            self.writer = None
+
+
+def render_offline(
+    source: str,
+    output: Optional[str],
+    config: Config,
+    fps: Optional[float] = None,
+    max_frames: Optional[int] = None,
+    landmarks: Optional[str] = None,
+    record_landmarks: Optional[str] = None
+) -> Dict:
+    """Run detection and effects over a recording.
+
+    Effects are timed by the recording's frame timestamps rather than the
+    wall clock, so the output matches what a live session would produce.
+
+    Args:
+        source: Video file path, directory of images or glob pattern
+        output: Output video file or directory (None to discard frames)
+        config: Application configuration
+        fps: Frame rate override
+        max_frames: Stop after this many frames
+        landmarks: Replay this landmark recording instead of running
+            hand inference
+        record_landmarks: Record the detected landmarks to this file
+
+    Returns:
+        Report dictionary with throughput, stage timings and gestures
+    """
+    frames, source_fps = read_frames(source, fps)
+
+    if landmarks:
+        detector = ReplayDetector(
+            landmarks,
+            confidence_threshold=config.get("gesture_confidence", 0.8),
+            classifier_paths=config.get("gesture_classifier_paths", [])
+        )
+    else:
+        detector = GestureDetector(
+            confidence_threshold=config.get("gesture_confidence", 0.8),
+            tracking_mode=config.get("detection_tracking", False),
+            roi_size=config.get("detection_roi_size", 256),
+            backend=config.get("detector_backend", "solutions"),
+            model_path=config.get("detector_model_path"),
+            max_num_hands=config.get("max_num_hands", 2),
+            classifier_paths=config.get("gesture_classifier_paths", []),
+            record_path=record_landmarks
+        )
+    engine = AnimationEngine(effect_duration=config.get("effect_duration", 3.0))
+    writer = FrameWriter(output, source_fps) if output else None
+
+    timings: Dict[str, List[float]] = defaultdict(list)
+    triggered: List[Dict] = []
+    frame_count = 0
+    start = time.perf_counter()
+
+    try:
+        read_start = time.perf_counter()
+        for frame in frames:
+            timings["read"].append(time.perf_counter() - read_start)
+            timestamp = frame_count / source_fps
+
+            stage_start = time.perf_counter()
+            gesture = detector.detect(frame)
+            timings["detect"].append(time.perf_counter() - stage_start)
+
+            gestures = [found.gesture for found in detector.last_gestures] or [gesture]
+            for name in dict.fromkeys(gestures):
+                if not name or not config.is_gesture_enabled(name):
+                    continue
+                if name not in engine.active_effects:
+                    triggered.append({
+                        "frame": frame_count,
+                        "time": round(timestamp, 3),
+                        "gesture": name,
+                    })
+                engine.trigger_effect(name, timestamp=timestamp)
+
+            stage_start = time.perf_counter()
+            output_frame = engine.render(frame, timestamp=timestamp)
+            timings["render"].append(time.perf_counter() - stage_start)
+
+            if writer:
+                stage_start = time.perf_counter()
+                writer.write(output_frame)
+                timings["write"].append(time.perf_counter() - stage_start)
+
+            frame_count += 1
+            if max_frames and frame_count >= max_frames:
+                break
+            read_start = time.perf_counter()
+    finally:
+        if writer:
+            writer.close()
+        engine.cleanup()
+        detector.cleanup()
+
+    elapsed = time.perf_counter() - start
+
+    return {
+        "source": source,
+        "output": output,
+        "frames": frame_count,
+        "seconds": round(elapsed, 3),
+        "fps": round(frame_count / elapsed, 2) if elapsed > 0 else 0.0,
+        "stages_ms": {
+            stage: {
+                "mean": round(float(np.mean(values)) * 1000, 3),
+                "p50": round(float(np.percentile(values, 50)) * 1000, 3),
+                "p95": round(float(np.percentile(values, 95)) * 1000, 3),
+                "max": round(float(np.max(values)) * 1000, 3),
+            }
+            for stage, values in timings.items() if values
+        },
+        "gestures": triggered,
+    }
+
+
+def print_report(report: Dict) -> None:
+    """Print a human-readable render report.
+
+    Args:
+        report: Report from ``render_offline``
+    """
+    print(f"Frames:  {report['frames']} in {report['seconds']}s ({report['fps']} fps)")
+    print("Stage timings (ms):")
+    for stage, stats in report["stages_ms"].items():
+        print(
+            f"  {stage:<8} mean {stats['mean']:>8.2f}  p50 {stats['p50']:>8.2f}  "
+            f"p95 {stats['p95']:>8.2f}  max {stats['max']:>8.2f}"
+        )
+    print(f"Gestures triggered: {len(report['gestures'])}")
+    for event in report["gestures"]:
+        print(f"  frame {event['frame']:>6}  {event['time']:>8.2f}s  {event['gesture']}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point.
+
+    Args:
+        argv: Command line arguments (defaults to ``sys.argv``)
+
+    Returns:
+        Process exit code
+    """
+    parser = argparse.ArgumentParser(
+        description="Render Camera Reactions effects onto a recorded video."
+    )
+    parser.add_argument("input", help="Video file, image directory or glob pattern")
+    parser.add_argument(
+        "-o", "--output",
+        help="Output video file (.mp4/.avi/...) or directory for PNG frames"
+    )
+    parser.add_argument("--fps", type=float, help="Frame rate override")
+    parser.add_argument("--max-frames", type=int, help="Stop after this many frames")
+    parser.add_argument("--config", default="config.json", help="Configuration file")
+    parser.add_argument("--report", help="Write the report as JSON to this file")
+    parser.add_argument("--landmarks", help="Replay a landmark recording instead of inference")
+    parser.add_argument("--record-landmarks", help="Record detected landmarks to this .npy file")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Debug logging")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.WARNING,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
+
+    try:
+        report = render_offline(
+            args.input,
+            args.output,
+            Config(args.config, create=False),
+            fps=args.fps,
+            max_frames=args.max_frames,
+            landmarks=args.landmarks,
+            record_landmarks=args.record_landmarks
+        )
+    except IOError as e:
+        logger.error(str(e))
+        return 1
+
+    print_report(report)
+
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump(report, f, indent=4)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
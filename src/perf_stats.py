@@ -0,0 +1,153 @@
+"""Per-stage performance instrumentation.
+
+This module collects rolling timing samples for each stage of the frame
+pipeline (capture, color conversion, inference, effect rendering, virtual
+camera output, preview) and exposes their percentiles through an API and
+an on-frame debug overlay. When a ``FrameTracer`` is attached, every
+measured stage is also recorded as a trace span.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, Iterator
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class PerfStats:
+    """Rolling per-stage timing statistics."""
+
+    def __init__(self, window: int = 300, enabled: bool = True):
+        """Initialize performance statistics.
+
+        Args:
+            window: Number of recent samples kept per stage
+            enabled: Whether samples are recorded at all
+        """
+        self.window = window
+        self.enabled = enabled
+        self.tracer = None
+        self._samples: Dict[str, deque] = {}
+        self._lock = threading.Lock()
+
+    def record(self, stage: str, seconds: float) -> None:
+        """Record a timing sample.
+
+        Args:
+            stage: Stage name
+            seconds: Duration of the stage
+        """
+        if not self.enabled:
+            return
+
+        with self._lock:
+            samples = self._samples.get(stage)
+            if samples is None:
+                samples = self._samples[stage] = deque(maxlen=self.window)
+            samples.append(seconds)
+
+    @contextmanager
+    def measure(self, stage: str) -> Iterator[None]:
+        """Time the enclosed block as a stage.
+
+        Args:
+            stage: Stage name
+        """
+        if not self.enabled and self.tracer is None:
+            yield
+            return
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            self.record(stage, end - start)
+            if self.tracer is not None:
+                self.tracer.add_span(stage, start, end)
+
+    def percentiles(self, stage: str) -> Dict[str, float]:
+        """Get timing percentiles for a stage.
+
+        Args:
+            stage: Stage name
+
+        Returns:
+            Dictionary with count, mean, p50, p95 and p99 in milliseconds
+            (empty if the stage has no samples)
+        """
+        with self._lock:
+            samples = self._samples.get(stage)
+            if not samples:
+                return {}
+            values = np.fromiter(samples, dtype=np.float64) * 1000
+
+        p50, p95, p99 = np.percentile(values, [50, 95, 99])
+        return {
+            "count": len(values),
+            "mean": float(values.mean()),
+            "p50": float(p50),
+            "p95": float(p95),
+            "p99": float(p99),
+        }
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """Get percentiles for every recorded stage.
+
+        Returns:
+            Dictionary mapping stage name to its percentiles
+        """
+        with self._lock:
+            stages = sorted(self._samples)
+        return {stage: self.percentiles(stage) for stage in stages}
+
+    def reset(self) -> None:
+        """Discard all samples."""
+        with self._lock:
+            self._samples.clear()
+
+    def draw_overlay(self, frame: np.ndarray) -> np.ndarray:
+        """Draw a stage timing table onto the frame.
+
+        Args:
+            frame: BGR image, modified in place
+
+        Returns:
+            Frame with the overlay drawn
+        """
+        # Imported here so collecting stats never pulls in OpenCV
+        import cv2
+
+        stats = self.snapshot()
+        if not stats:
+            return frame
+
+        rows = [("stage (ms)", "p50", "p95", "p99")]
+        for stage, values in stats.items():
+            rows.append((
+                stage,
+                f"{values['p50']:.1f}",
+                f"{values['p95']:.1f}",
+                f"{values['p99']:.1f}",
+            ))
+
+        font = cv2.FONT_HERSHEY_PLAIN
+        line_height = 16
+        columns = (6, 170, 225, 280)
+        height = min(frame.shape[0], line_height * len(rows) + 8)
+        width = min(frame.shape[1], 335)
+
+        # Darken only the overlay region instead of blending the whole frame
+        region = frame[:height, :width]
+        region //= 3
+
+        for i, row in enumerate(rows):
+            y = 16 + i * line_height
+            for x, text in zip(columns, row):
+                cv2.putText(frame, text, (x, y), font, 1.0, (0, 255, 0), 1, cv2.LINE_AA)
+
+        return frame
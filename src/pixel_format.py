@@ -0,0 +1,123 @@
+"""BGR to YUV conversion for virtual camera output.
+
+Virtual camera backends store frames in a YUV layout internally. Handing
+them BGR makes the backend convert and copy every frame again, so this
+module converts once, in our own pipeline, straight into the backend's
+native layout. Every YUV format is derived from a single vectorized
+``cv2.COLOR_BGR2YUV_I420`` conversion into a preallocated buffer, followed
+by cheap NumPy repacking of the chroma planes where needed.
+"""
+
+import logging
+from typing import Tuple
+import cv2
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Output formats supported by FrameConverter (pyvirtualcam PixelFormat names)
+PIXEL_FORMATS = ("bgr", "i420", "nv12", "yuyv")
+
+
+def frame_shape(pixel_format: str, width: int, height: int) -> Tuple[int, ...]:
+    """Get the buffer shape for a frame in the given format.
+
+    Args:
+        pixel_format: One of ``PIXEL_FORMATS``
+        width: Frame width in pixels
+        height: Frame height in pixels
+
+    Returns:
+        Array shape accepted by ``pyvirtualcam.Camera.send``
+    """
+    if pixel_format == "bgr":
+        return (height, width, 3)
+    if pixel_format in ("i420", "nv12"):
+        return (height * 3 // 2, width)
+    if pixel_format == "yuyv":
+        return (height, width * 2)
+    raise ValueError(f"Unsupported pixel format: {pixel_format}")
+
+
+class FrameConverter:
+    """Converts BGR frames to a YUV layout in a preallocated buffer."""
+
+    def __init__(self, pixel_format: str, width: int, height: int):
+        """Initialize frame converter.
+
+        Args:
+            pixel_format: Output format, one of ``PIXEL_FORMATS``
+            width: Frame width in pixels (must be even for YUV formats)
+            height: Frame height in pixels (must be even for YUV formats)
+        """
+        if pixel_format != "bgr" and (width % 2 or height % 2):
+            raise ValueError(f"{pixel_format} needs even dimensions, got {width}x{height}")
+
+        self.pixel_format = pixel_format
+        self.width = width
+        self.height = height
+        self.output = np.empty(frame_shape(pixel_format, width, height), dtype=np.uint8)
+
+        # NV12 converts in place and only needs the chroma planes moved
+        # aside; YUYV repacks from a separate I420 frame
+        if pixel_format == "nv12":
+            self._scratch = np.empty((height // 2, width), dtype=np.uint8)
+        elif pixel_format == "yuyv":
+            self._scratch = np.empty((height * 3 // 2, width), dtype=np.uint8)
+
+    def convert(self, frame: np.ndarray) -> np.ndarray:
+        """Convert a BGR frame.
+
+        Args:
+            frame: BGR image of the converter's size
+
+        Returns:
+            The converter's output buffer, valid until the next call
+        """
+        if self.pixel_format == "bgr":
+            np.copyto(self.output, frame)
+        elif self.pixel_format == "i420":
+            cv2.cvtColor(frame, cv2.COLOR_BGR2YUV_I420, dst=self.output)
+        elif self.pixel_format == "nv12":
+            self._convert_nv12(frame)
+        else:
+            self._convert_yuyv(frame)
+        return self.output
+
+    def _convert_nv12(self, frame: np.ndarray) -> None:
+        """Convert to NV12: full Y plane followed by interleaved U/V.
+
+        Args:
+            frame: BGR image
+        """
+        h, w = self.height, self.width
+        cv2.cvtColor(frame, cv2.COLOR_BGR2YUV_I420, dst=self.output)
+
+        # I420 stores U then V as planes after Y; interleave them
+        np.copyto(self._scratch, self.output[h:])
+        chroma = self._scratch.reshape(2, h // 2, w // 2)
+        uv = self.output[h:].reshape(h // 2, w // 2, 2)
+        uv[..., 0] = chroma[0]
+        uv[..., 1] = chroma[1]
+
+    def _convert_yuyv(self, frame: np.ndarray) -> None:
+        """Convert to packed YUYV 4:2:2 (Y0 U Y1 V).
+
+        Chroma rows of the 4:2:0 conversion are repeated vertically.
+
+        Args:
+            frame: BGR image
+        """
+        h, w = self.height, self.width
+        cv2.cvtColor(frame, cv2.COLOR_BGR2YUV_I420, dst=self._scratch)
+
+        y = self._scratch[:h]
+        chroma = self._scratch[h:].reshape(2, h // 2, w // 2)
+
+        packed = self.output.reshape(h, w // 2, 4)
+        packed[..., 0] = y[:, 0::2]
+        packed[..., 2] = y[:, 1::2]
+
+        row_pairs = packed.reshape(h // 2, 2, w // 2, 4)
+        row_pairs[..., 1] = chroma[0][:, None, :]
+        row_pairs[..., 3] = chroma[1][:, None, :]
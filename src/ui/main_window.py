@@ -12,6 +12,9 @@ from PyQt5.QtWidgets import (
 from PyQt5.QtCore import QTimer, Qt
 from PyQt5.QtGui import QImage, QPixmap, QIcon
 
+from buffer_pool import frame_pool
+from frame_pipeline import FramePipeline
+
 logger = logging.getLogger(__name__)
 
 
@@ -27,8 +30,14 @@ class MainWindow(QMainWindow):
         super().__init__()
         self.app = app
         self.camera = None
+        self.pipeline: Optional[FramePipeline] = None
         self.timer = QTimer()
 
+        # Preview refreshes at its own capped rate; the virtual camera
+        # output runs independently on the pipeline's output thread
+        preview_fps = max(1, self.app.config.get("preview_fps", 15))
+        self.preview_interval_ms = int(1000 / preview_fps)
+
         self.setWindowTitle("Camera Reactions")
         self.setGeometry(100, 100, 800, 600)
 
@@ -49,6 +58,10 @@ class MainWindow(QMainWindow):
         self.preview_label.setStyleSheet("background-color: black;")
         layout.addWidget(self.preview_label)
 
+        # Startup progress of components loading in the background
+        self.status_label = QLabel(self.app.get_status())
+        layout.addWidget(self.status_label)
+
         # Controls
         controls_layout = QHBoxLayout()
 
@@ -91,6 +104,14 @@ class MainWindow(QMainWindow):
         gestures_group.setLayout(gestures_layout)
         layout.addWidget(gestures_group)
 
+        # Performance overlay toggle
+        self.overlay_checkbox = QCheckBox("Show performance overlay")
+        self.overlay_checkbox.setChecked(self.app.config.get("show_debug_overlay", False))
+        self.overlay_checkbox.stateChanged.connect(
+            lambda state: self.app.config.set("show_debug_overlay", state == Qt.Checked)
+        )
+        layout.addWidget(self.overlay_checkbox)
+
     def _create_tray_icon(self) -> None:
         """Create system tray icon."""
         self.tray_icon = QSystemTrayIcon(self)
@@ -110,74 +131,85 @@ class MainWindow(QMainWindow):
 
     def _start_camera(self) -> None:
         """Start camera capture."""
-        camera_index = self.app.config.get("camera_index", 0)
-        self.camera = cv2.VideoCapture(camera_index)
-
-        if not self.camera.isOpened():
-            logger.error(f"Failed to open camera {camera_index}")
+        # The capture mode is negotiated to match the virtual camera size
+        self.camera = self.app.open_camera()
+        if self.camera is None:
             return
 
-        # Set resolution
-        self.camera.set(cv2.CAP_PROP_FRAME_WIDTH, 1280)
-        self.camera.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
+        # Capture, processing and virtual camera output run off the GUI thread
+        self.pipeline = FramePipeline(
+            self.camera,
+            process_frame=self.app.process_frame,
+            output_frame=self.app.output_frame,
+            scheduler=self.app.scheduler,
+            perf_stats=self.app.perf_stats
+        )
+        self.pipeline.start()
 
-        # Start timer for frame updates
+        # Start timer for preview updates
         self.timer.timeout.connect(self._update_frame)
-        self.timer.start(33)  # ~30 FPS
+        self.timer.start(self.preview_interval_ms)
 
         logger.info("Camera started")
 
     def _update_frame(self) -> None:
-        """Update preview frame."""
-        if not self.camera or not self.camera.isOpened():
-            return
-
-        ret, frame = self.camera.read()
-        if not ret:
+        """Update preview with the newest processed frame."""
+        if not self.pipeline:
             return
 
-        # Process frame through app pipeline
-        processed_frame = self.app.process_frame(frame)
+        status = self.app.get_status()
+        if status != self.status_label.text():
+            self.status_label.setText(status)
 
-        # Send to virtual camera
-        if self.app.virtual_camera:
-            self.app.virtual_camera.send_frame(processed_frame)
+        frame = self.pipeline.get_preview_frame()
+        if frame is None:
+            return
 
-        # Update preview
-        self._display_frame(processed_frame)
+        with self.app.perf_stats.measure("preview"):
+            self._display_frame(frame)
 
     def _display_frame(self, frame: np.ndarray) -> None:
         """Display frame in preview label.
 
+        The BGR frame is shrunk to the label size first and wrapped in a
+        BGR888 QImage, so there is no color conversion and no full-size
+        pixmap to build and scale.
+
         Args:
             frame: BGR image to display
         """
-        # Convert BGR to RGB
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-
-        # Convert to QImage
-        h, w, ch = rgb_frame.shape
-        bytes_per_line = ch * w
-        q_image = QImage(rgb_frame.data, w, h, bytes_per_line, QImage.Format_RGB888)
-
-        # Scale to fit label
-        pixmap = QPixmap.fromImage(q_image)
-        scaled_pixmap = pixmap.scaled(
-            self.preview_label.size(),
-            Qt.KeepAspectRatio,
-            Qt.SmoothTransformation
-        )
+        h, w = frame.shape[:2]
+        scale = min(self.preview_label.width() / w, self.preview_label.height() / h)
+        if scale <= 0:
+            return
 
-        self.preview_label.setPixmap(scaled_pixmap)
+        target_w, target_h = max(1, int(w * scale)), max(1, int(h * scale))
+
+        with frame_pool.borrow((target_h, target_w, 3)) as scaled:
+            if (target_w, target_h) == (w, h) and frame.flags["C_CONTIGUOUS"]:
+                scaled = frame
+            else:
+                cv2.resize(
+                    frame, (target_w, target_h), dst=scaled,
+                    interpolation=cv2.INTER_LINEAR
+                )
+
+            # fromImage copies the pixels, so the buffer can be reused
+            q_image = QImage(scaled.data, target_w, target_h, 3 * target_w, QImage.Format_BGR888)
+            self.preview_label.setPixmap(QPixmap.fromImage(q_image))
 
     def _toggle_camera(self) -> None:
         """Toggle camera on/off."""
         if self.timer.isActive():
             self.timer.stop()
+            if self.pipeline:
+                self.pipeline.stop()
             self.start_button.setText("Start")
             logger.info("Camera stopped")
         else:
-            self.timer.start(33)
+            if self.pipeline:
+                self.pipeline.start()
+            self.timer.start(self.preview_interval_ms)
             self.start_button.setText("Stop")
             logger.info("Camera started")
 
@@ -194,7 +226,9 @@ class MainWindow(QMainWindow):
 
     def closeEvent(self, event) -> None:
         """Handle window close event."""
+        self.timer.stop()
+        if self.pipeline:
+            self.pipeline.stop()
         if self.camera:
             self.camera.release()
-        self.timer.stop()
         event.accept()
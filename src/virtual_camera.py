@@ -1,7 +1,9 @@
 """Virtual camera integration for feeding processed video to apps.
 
 This module creates a virtual camera device that video conferencing
-applications can use as a camera source.
+applications can use as a camera source. Frames are delivered by a
+background sender thread at a steady rate, independent of how fast the
+processing stage produces them.
 """
 
 import logging
@@ -10,6 +12,10 @@ from typing import Optional
 import cv2
 import numpy as np
 
+from frame_tracer import current_frame_id, set_current_frame_id
+from perf_stats import PerfStats
+from pixel_format import PIXEL_FORMATS, FrameConverter
+
 try:
     import pyvirtualcam
     VIRTUAL_CAM_AVAILABLE = True
@@ -28,7 +34,9 @@ class VirtualCamera:
         camera_name: str = "Camera Reactions Virtual Camera",
         width: int = 1280,
         height: int = 720,
-        fps: int = 30
+        fps: int = 30,
+        pixel_format: str = "auto",
+        perf_stats: Optional[PerfStats] = None
     ):
         """Initialize virtual camera.
 
@@ -37,16 +45,33 @@ class VirtualCamera:
             width: Output width in pixels
             height: Output height in pixels
             fps: Frames per second
+            pixel_format: Device pixel format ("bgr", "i420", "nv12",
+                "yuyv"), or "auto" to use the backend's native format
+            perf_stats: Optional statistics collector for send timings
         """
         self.camera_name = camera_name
         self.width = width
         self.height = height
         self.fps = fps
+        self.pixel_format = pixel_format
+        self.perf_stats = perf_stats or PerfStats(enabled=False)
 
         self.camera: Optional[pyvirtualcam.Camera] = None
+        self.output_format: Optional[str] = None
+        self._converter: Optional[FrameConverter] = None
         self.running = False
         self.frame_lock = threading.Lock()
-        self.latest_frame: Optional[np.ndarray] = None
+
+        # Double buffer: send_frame writes the back buffer, the sender
+        # thread swaps it to the front and delivers the front buffer
+        self._back_buffer = np.zeros((height, width, 3), dtype=np.uint8)
+        self._front_buffer = np.zeros((height, width, 3), dtype=np.uint8)
+        self._back_frame_id: Optional[int] = None
+        self._pending = False
+        self._has_frame = False
+        self._sender: Optional[threading.Thread] = None
+        self.frames_sent = 0
+        self.frames_repeated = 0
 
         if VIRTUAL_CAM_AVAILABLE:
             self._initialize_camera()
@@ -54,60 +79,157 @@ class VirtualCamera:
             logger.error("Virtual camera not available - install pyvirtualcam")
 
     def _initialize_camera(self) -> None:
-        """Initialize the virtual camera device."""
+        """Initialize the virtual camera device and start the sender."""
         try:
-            self.camera = pyvirtualcam.Camera(
-                width=self.width,
-                height=self.height,
-                fps=self.fps,
-                fmt=pyvirtualcam.PixelFormat.BGR
-            )
+            if self.pixel_format != "auto" and self.pixel_format not in PIXEL_FORMATS:
+                raise ValueError(f"Unsupported pixel format: {self.pixel_format}")
+
+            if self.pixel_format == "auto":
+                camera = self._open_camera("bgr")
+                native = self._native_format(camera)
+                if native is not None and native != "bgr":
+                    # Reopen in the device's own layout so the backend
+                    # passes frames through instead of converting them
+                    camera.close()
+                    camera = self._open_camera(native)
+                output_format = native or "bgr"
+            else:
+                camera = self._open_camera(self.pixel_format)
+                output_format = self.pixel_format
+
+            if output_format != "bgr":
+                self._converter = FrameConverter(output_format, self.width, self.height)
+            self.output_format = output_format
+            self.camera = camera
             self.running = True
+            self._sender = threading.Thread(
+                target=self._send_loop, name="virtual-camera", daemon=True
+            )
+            self._sender.start()
             logger.info(
                 f"Virtual camera initialized: {self.camera_name} "
-                f"({self.width}x{self.height} @ {self.fps}fps)"
+                f"({self.width}x{self.height} @ {self.fps}fps, {self.output_format})"
             )
         except Exception as e:
             logger.error(f"Failed to initialize virtual camera: {e}")
             self.camera = None
 
+    def _open_camera(self, pixel_format: str) -> "pyvirtualcam.Camera":
+        """Open the virtual camera device.
+
+        Args:
+            pixel_format: Name of the pyvirtualcam pixel format to send
+
+        Returns:
+            Opened camera
+        """
+        return pyvirtualcam.Camera(
+            width=self.width,
+            height=self.height,
+            fps=self.fps,
+            fmt=getattr(pyvirtualcam.PixelFormat, pixel_format.upper())
+        )
+
+    @staticmethod
+    def _native_format(camera) -> Optional[str]:
+        """Get the device's native pixel format if we can produce it.
+
+        Args:
+            camera: Opened camera
+
+        Returns:
+            Format name from ``PIXEL_FORMATS`` or None
+        """
+        native = getattr(camera, "native_fmt", None)
+        if native is None:
+            return None
+        for name in PIXEL_FORMATS:
+            if native == getattr(pyvirtualcam.PixelFormat, name.upper(), None):
+                return name
+        return None
+
     def send_frame(self, frame: np.ndarray) -> bool:
-        """Send a frame to the virtual camera.
+        """Queue a frame for the virtual camera.
+
+        The frame is copied (and resized if necessary) into the back
+        buffer and delivered by the sender thread at the next frame slot.
+        This never waits for the device.
 
         Args:
             frame: BGR image to send
 
         Returns:
-            True if frame sent successfully
+            True if frame was queued
         """
         if not self.running or not self.camera:
             return False
 
         try:
-            # Resize frame if necessary
-            if frame.shape[:2] != (self.height, self.width):
-                frame = cv2.resize(frame, (self.width, self.height))
-
-            # Send frame to virtual camera
-            self.camera.send(frame)
-
             with self.frame_lock:
-                self.latest_frame = frame
+                if frame.shape[:2] != (self.height, self.width):
+                    cv2.resize(frame, (self.width, self.height), dst=self._back_buffer)
+                else:
+                    np.copyto(self._back_buffer, frame)
+                self._back_frame_id = current_frame_id()
+                self._pending = True
 
             return True
 
         except Exception as e:
-            logger.error(f"Error sending frame to virtual camera: {e}")
+            logger.error(f"Error queueing frame for virtual camera: {e}")
             return False
 
+    def _send_loop(self) -> None:
+        """Deliver the newest frame at exactly the configured rate.
+
+        When no new frame arrived since the last slot, the previous frame
+        is repeated so the device sees a steady cadence.
+        """
+        while self.running:
+            with self.frame_lock:
+                if self._pending:
+                    self._front_buffer, self._back_buffer = self._back_buffer, self._front_buffer
+                    set_current_frame_id(self._back_frame_id)
+                    self._pending = False
+                    self._has_frame = True
+                    fresh = True
+                else:
+                    fresh = False
+
+            camera = self.camera
+            if camera is None:
+                break
+
+            if self._has_frame:
+                try:
+                    # The front buffer is only swapped by this thread, so
+                    # it can be converted outside the lock; repeats reuse
+                    # the previous conversion
+                    output = self._front_buffer
+                    if self._converter is not None:
+                        if fresh:
+                            with self.perf_stats.measure("vcam_convert"):
+                                self._converter.convert(self._front_buffer)
+                        output = self._converter.output
+
+                    with self.perf_stats.measure("vcam_send"):
+                        camera.send(output)
+                    self.frames_sent += 1
+                    if not fresh:
+                        self.frames_repeated += 1
+                except Exception as e:
+                    logger.error(f"Error sending frame to virtual camera: {e}")
+
+            camera.sleep_until_next_frame()
+
     def get_latest_frame(self) -> Optional[np.ndarray]:
         """Get the latest frame sent to virtual camera.
 
         Returns:
-            Latest frame or None
+            Copy of the latest frame or None
         """
         with self.frame_lock:
-            return self.latest_frame.copy() if self.latest_frame is not None else None
+            return self._front_buffer.copy() if self._has_frame else None
 
     def is_running(self) -> bool:
         """Check if virtual camera is running.
@@ -118,12 +240,18 @@ class VirtualCamera:
         return self.running and self.camera is not None
 
     def stop(self) -> None:
-        """Stop the virtual camera."""
+        """Stop the sender thread and the virtual camera."""
         if self.camera:
             self.running = False
+            if self._sender is not None:
+                self._sender.join(timeout=1.0)
+                self._sender = None
             self.camera.close()
             self.camera = None
-            logger.info("Virtual camera stopped")
+            logger.info(
+                f"Virtual camera stopped ({self.frames_sent} frames sent, "
+                f"{self.frames_repeated} repeated)"
+            )
 
     def __enter__(self):
         """Context manager entry."""
@@ -0,0 +1,8 @@
+"""Shared pytest configuration."""
+
+import sys
+from pathlib import Path
+
+# Application modules import each other as top-level modules (as when
+# running src/main.py), so make src importable alongside the src package.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
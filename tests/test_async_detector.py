@@ -0,0 +1,102 @@
+"""Tests for the asynchronous gesture detector."""
+
+import threading
+import time
+import numpy as np
+from src.async_detector import AsyncGestureDetector
+
+
+class FakeDetector:
+    """Detector naming each frame by its first pixel value."""
+
+    confidence_threshold = 0.8
+
+    def __init__(self):
+        self.frames = []
+        self.busy = threading.Event()
+        self.release = threading.Event()
+        self.release.set()
+        self.cleaned = False
+
+    def detect(self, frame):
+        self.busy.set()
+        self.release.wait(timeout=5.0)
+        self.frames.append(int(frame[0, 0, 0]))
+        return f"frame{frame[0, 0, 0]}"
+
+    def cleanup(self):
+        self.cleaned = True
+
+
+def _frame(value):
+    """Build a small frame filled with one value."""
+    return np.full((4, 4, 3), value, dtype=np.uint8)
+
+
+def _wait_for(condition, timeout=5.0):
+    """Poll until a condition holds or the timeout passes."""
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.005)
+    return condition()
+
+
+def test_result_is_delivered_once():
+    """Test each detection is returned by exactly one detect call."""
+    fake = FakeDetector()
+    detector = AsyncGestureDetector(fake, rate_hz=2.0)
+    try:
+        assert detector.detect(_frame(1)) is None
+        assert _wait_for(lambda: detector._result_seq == 1)
+
+        assert detector.detect(_frame(2)) == "frame1"
+        assert detector.detect(_frame(3)) is None
+    finally:
+        detector.cleanup()
+
+
+def test_only_newest_frame_is_processed():
+    """Test frames submitted while the worker is busy are replaced."""
+    fake = FakeDetector()
+    fake.release.clear()
+    detector = AsyncGestureDetector(fake, rate_hz=0)
+    try:
+        detector.detect(_frame(1))
+        assert fake.busy.wait(timeout=5.0)
+        for value in range(2, 6):
+            detector.detect(_frame(value))
+
+        fake.release.set()
+        assert _wait_for(lambda: len(fake.frames) == 2)
+        time.sleep(0.05)
+        assert fake.frames == [1, 5]
+        assert detector._frames.dropped == 3
+    finally:
+        detector.cleanup()
+
+
+def test_rate_limits_inference():
+    """Test the worker runs no more often than rate_hz."""
+    fake = FakeDetector()
+    detector = AsyncGestureDetector(fake, rate_hz=20.0)
+    try:
+        end = time.monotonic() + 0.5
+        while time.monotonic() < end:
+            detector.detect(_frame(1))
+            time.sleep(0.001)
+    finally:
+        detector.cleanup()
+
+    assert 3 <= len(fake.frames) <= 12
+
+
+def test_cleanup_joins_worker():
+    """Test cleanup stops the worker thread and releases the detector."""
+    fake = FakeDetector()
+    detector = AsyncGestureDetector(fake, rate_hz=30.0)
+    detector.detect(_frame(1))
+
+    detector.cleanup()
+
+    assert not detector._worker.is_alive()
+    assert fake.cleaned
@@ -0,0 +1,37 @@
+"""Tests for reusable frame buffers."""
+
+import numpy as np
+from src.buffer_pool import BufferPool, FrameRing
+
+
+def test_released_buffer_is_reused():
+    """Test a released buffer is handed out again for the same shape."""
+    pool = BufferPool()
+    first = pool.acquire((720, 1280, 3))
+    pool.release(first)
+
+    second = pool.acquire((720, 1280, 3))
+
+    assert second is first
+    assert pool.get_stats()["allocations"] == 1
+    assert pool.get_stats()["reuses"] == 1
+
+
+def test_different_shapes_do_not_mix():
+    """Test buffers are keyed by shape and dtype."""
+    pool = BufferPool()
+    with pool.borrow((10, 10, 3)) as buffer:
+        pass
+
+    assert pool.acquire((10, 10, 3), np.float32) is not buffer
+    assert pool.acquire((10, 10, 4)) is not buffer
+    assert pool.acquire((10, 10, 3)) is buffer
+
+
+def test_frame_ring_rotates():
+    """Test ring buffers come back only after a full rotation."""
+    ring = FrameRing(size=3)
+    buffers = [ring.next((4, 4, 3)) for _ in range(4)]
+
+    assert len({id(b) for b in buffers[:3]}) == 3
+    assert buffers[3] is buffers[0]
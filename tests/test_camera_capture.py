@@ -0,0 +1,80 @@
+"""Tests for capture mode negotiation using a fake VideoCapture."""
+
+import cv2
+import pytest
+from src import camera_capture
+from src.camera_capture import CameraCapture, decode_fourcc
+
+
+class FakeVideoCapture:
+    """Stand-in for cv2.VideoCapture that grants a fixed set of modes."""
+
+    modes = {(1280, 720), (640, 480)}
+
+    def __init__(self, index, backend=cv2.CAP_ANY):
+        self.props = {
+            cv2.CAP_PROP_FRAME_WIDTH: 640,
+            cv2.CAP_PROP_FRAME_HEIGHT: 480,
+            cv2.CAP_PROP_FPS: 30,
+            cv2.CAP_PROP_FOURCC: cv2.VideoWriter_fourcc(*"YUYV"),
+        }
+        self.set_order = []
+
+    def isOpened(self):
+        return True
+
+    def set(self, prop, value):
+        self.set_order.append(prop)
+        if prop == cv2.CAP_PROP_FRAME_HEIGHT:
+            size = (int(self.props[cv2.CAP_PROP_FRAME_WIDTH]), int(value))
+            if size not in self.modes:
+                size = (640, 480)
+            self.props[cv2.CAP_PROP_FRAME_WIDTH], self.props[prop] = size
+        else:
+            self.props[prop] = value
+        return True
+
+    def get(self, prop):
+        return self.props.get(prop, 0)
+
+    def read(self):
+        return False, None
+
+    def release(self):
+        pass
+
+
+@pytest.fixture
+def fake_video_capture(monkeypatch):
+    """Replace cv2.VideoCapture with the fake device."""
+    monkeypatch.setattr(camera_capture.cv2, "VideoCapture", FakeVideoCapture)
+
+
+def test_negotiates_requested_mode(fake_video_capture):
+    """Test the requested mode is set and read back."""
+    capture = CameraCapture(width=1280, height=720, fps=30)
+    assert capture.open()
+
+    assert capture.mode.width == 1280
+    assert capture.mode.height == 720
+    assert capture.mode.fourcc == "MJPG"
+    assert capture.frame_size == (1280, 720)
+    assert capture.capture.props[cv2.CAP_PROP_BUFFERSIZE] == 1
+
+    # FOURCC must be set before the frame size
+    order = capture.capture.set_order
+    assert order.index(cv2.CAP_PROP_FOURCC) < order.index(cv2.CAP_PROP_FRAME_WIDTH)
+
+
+def test_reports_granted_mode(fake_video_capture):
+    """Test an unsupported size reports what the driver granted."""
+    capture = CameraCapture(width=1920, height=1080)
+    assert capture.open()
+
+    assert capture.frame_size == (640, 480)
+
+
+def test_decode_fourcc():
+    """Test FOURCC property values decode to strings."""
+    assert decode_fourcc(cv2.VideoWriter_fourcc(*"MJPG")) == "MJPG"
+    assert decode_fourcc(0) == ""
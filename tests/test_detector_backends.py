@@ -0,0 +1,163 @@
+"""Tests for hand landmark backends."""
+
+import numpy as np
+import pytest
+from src import detector_backends
+from src.detector_backends import HandLandmarkBackend, HandLandmarks, create_backend
+from src.gesture_detector import GestureDetector
+
+
+class FakeBackend(HandLandmarkBackend):
+    """Backend returning fixed landmarks."""
+
+    name = "fake"
+
+    def __init__(self, landmarks, handedness=None):
+        self.landmarks = landmarks
+        self.handedness = handedness or ["Right"] * len(landmarks)
+        self.closed = False
+
+    def process(self, image):
+        return HandLandmarks(self.landmarks.copy(), list(self.handedness))
+
+    def close(self):
+        self.closed = True
+
+
+def _thumbs_up():
+    hand = np.full((21, 3), 0.5, dtype=np.float32)
+    hand[4, 1], hand[3, 1] = 0.3, 0.4
+    hand[8, 1], hand[5, 1] = 0.7, 0.6
+    return hand[np.newaxis]
+
+
+def test_unknown_backend():
+    """Test an unknown backend name is rejected."""
+    with pytest.raises(ValueError):
+        create_backend("does_not_exist")
+
+
+def test_solutions_backend_no_hands():
+    """Test the default backend returns an empty landmark array."""
+    backend = create_backend("solutions")
+    found = backend.process(np.zeros((240, 320, 3), dtype=np.uint8))
+    backend.close()
+
+    assert found.landmarks.shape == (0, 21, 3)
+    assert found.handedness == []
+
+
+def test_onnx_backend_requires_onnxruntime(monkeypatch):
+    """Test the ONNX backend fails clearly without onnxruntime."""
+    monkeypatch.setattr(detector_backends, "ONNX_AVAILABLE", False)
+    with pytest.raises(RuntimeError):
+        create_backend("onnx_int8", full_frame=False)
+
+
+def test_crop_only_backend_rejected_on_full_frames():
+    """Test a backend without palm detection cannot search full frames."""
+    with pytest.raises(ValueError):
+        create_backend("onnx")
+    with pytest.raises(ValueError):
+        GestureDetector(backend="onnx_int8")
+
+
+def _hand_at(x, y, spread):
+    """Build one hand's landmarks spread diagonally around a point."""
+    hand = np.zeros((21, 3), dtype=np.float32)
+    hand[:, 0] = x + np.linspace(-spread, spread, 21)
+    hand[:, 1] = y + np.linspace(-spread, spread, 21)
+    return hand
+
+
+def test_crop_only_backend_tracks_each_hand(monkeypatch):
+    """Test a crop-only backend runs on one crop per hand a palm search found."""
+    from src import gesture_detector
+
+    class PalmBackend(HandLandmarkBackend):
+        name = "fake_palm"
+        calls = 0
+
+        def __init__(self, **kwargs):
+            pass
+
+        def process(self, image):
+            PalmBackend.calls += 1
+            hands = np.stack([_hand_at(0.25, 0.5, 0.03), _hand_at(0.75, 0.5, 0.03)])
+            return HandLandmarks(hands, ["Right", "Left"])
+
+    class CropBackend(HandLandmarkBackend):
+        name = "fake_crop"
+        finds_hands = False
+        crops = []
+
+        def __init__(self, **kwargs):
+            pass
+
+        def process(self, image):
+            CropBackend.crops.append(image.shape)
+            return HandLandmarks(_hand_at(0.5, 0.5, 0.1)[np.newaxis], ["Right"])
+
+    monkeypatch.setitem(gesture_detector.BACKENDS, "fake_palm", PalmBackend)
+    monkeypatch.setitem(gesture_detector.BACKENDS, "fake_crop", CropBackend)
+    detector = GestureDetector(backend="fake_crop", search_backend="fake_palm", tracking_mode=True)
+    frame = np.zeros((480, 640, 3), dtype=np.uint8)
+
+    detector.detect(frame)
+    assert PalmBackend.calls == 1 and not CropBackend.crops
+    assert len(detector.tracked_rois) == 2
+
+    detector.detect(frame)
+    assert PalmBackend.calls == 1
+    assert len(CropBackend.crops) == 2
+    assert detector.last_hand_count == 2
+    assert detector.last_handedness == ["Right", "Right"]
+    detector.cleanup()
+
+
+def test_detector_uses_backend():
+    """Test gesture rules run unchanged on a custom backend."""
+    backend = FakeBackend(_thumbs_up())
+    detector = GestureDetector(backend=backend)
+
+    assert detector.detect(np.zeros((240, 320, 3), dtype=np.uint8)) == "thumbs_up"
+    assert detector.last_handedness == ["Right"]
+
+    detector.cleanup()
+    assert backend.closed
+
+
+def test_weak_pair_leaves_hands_to_single_gestures():
+    """Test a pair below the threshold does not claim hands with strong gestures."""
+    class WeakPairClassifier:
+        num_hands = 2
+
+        def classify_batch(self, samples):
+            return ["heart_hands"] * len(samples), np.full(len(samples), 0.4)
+
+    hands = np.concatenate([_thumbs_up(), _thumbs_up()])
+    hands[1, :, 0] += 0.03
+    detector = GestureDetector(backend=FakeBackend(hands, ["Left", "Right"]), confidence_threshold=0.8)
+    detector.classifiers[2] = WeakPairClassifier()
+
+    found = detector.detect_all(np.zeros((240, 320, 3), dtype=np.uint8))
+
+    assert [(g.gesture, g.hands) for g in found] == [("thumbs_up", (0,)), ("thumbs_up", (1,))]
+
+
+def test_warm_up_runs_backend_without_classifying():
+    """Test warm-up feeds blank frames to the backend and leaves no state."""
+    class CountingBackend(FakeBackend):
+        calls = 0
+
+        def process(self, image):
+            self.calls += 1
+            return super().process(image)
+
+    backend = CountingBackend(_thumbs_up())
+    detector = GestureDetector(backend=backend, confidence_threshold=0.8)
+    detector.warm_up(width=64, height=48, num_frames=3)
+
+    assert backend.calls == 3
+    assert detector.last_gesture is None
+    assert detector.last_hand_count == 0
@@ -0,0 +1,114 @@
+"""Tests for the multi-process gesture detector."""
+
+import time
+import numpy as np
+from src.detector_pool import ProcessGestureDetector
+
+
+class FakeDetector:
+    """Detector naming each frame by its first pixel value.
+
+    Defined at module level so spawned workers can import it.
+    """
+
+    def __init__(self, delay=0.0, **kwargs):
+        self.delay = delay
+        self.last_confidence = 0.0
+        self.last_hand_count = 0
+        self.last_gestures = []
+
+    def warm_up(self):
+        pass
+
+    def detect(self, frame):
+        time.sleep(self.delay)
+        self.last_confidence = 1.0
+        self.last_hand_count = 1
+        return f"frame{frame[0, 0, 0]}"
+
+    def cleanup(self):
+        pass
+
+
+class BrokenDetector(FakeDetector):
+    """Detector whose creation fails, like a bad model path."""
+
+    def __init__(self, **kwargs):
+        raise RuntimeError("model not found")
+
+
+def _frame(value):
+    """Build a small frame filled with one value."""
+    return np.full((4, 4, 3), value, dtype=np.uint8)
+
+
+def _run(detector, values, timeout=20.0):
+    """Detect on frames of the given values, then wait for the workers.
+
+    Returns:
+        Frame values of the results, in the order they were returned
+    """
+    results = []
+    for value in values:
+        results.append(detector.detect(_frame(value)))
+        time.sleep(0.02)
+
+    deadline = time.monotonic() + timeout
+    while detector._in_flight and time.monotonic() < deadline:
+        detector._collect()
+        time.sleep(0.01)
+    if detector._fresh_result:
+        results.append(detector.last_gesture)
+        detector._fresh_result = False
+
+    return [int(name[len("frame"):]) for name in results if name]
+
+
+def test_returns_newest_result_once_and_reuses_slots():
+    """Test results come newest first, once each, through a fixed slot ring."""
+    detector = ProcessGestureDetector(
+        num_workers=2, slots_per_worker=1, detector_factory=FakeDetector, delay=0.01
+    )
+    try:
+        numbers = _run(detector, range(1, 61))
+        shm_name = detector._shm.name
+
+        assert len(numbers) > 10
+        assert numbers == sorted(set(numbers))
+        assert detector.detect(_frame(0)) is None
+        assert detector.last_hand_count == 1
+
+        assert detector._shm.name == shm_name
+        assert len(detector._free_slots) + detector._in_flight == detector.num_slots
+    finally:
+        detector.cleanup()
+
+
+def test_dead_workers_release_their_slots():
+    """Test workers that fail to start do not block detection silently."""
+    detector = ProcessGestureDetector(num_workers=2, detector_factory=BrokenDetector)
+    try:
+        deadline = time.monotonic() + 20.0
+        while detector._workers and time.monotonic() < deadline:
+            detector.detect(_frame(1))
+            time.sleep(0.01)
+
+        assert not detector._workers
+        assert detector._in_flight == 0
+        assert len(detector._free_slots) == detector.num_slots
+        assert detector.detect(_frame(1)) is None
+    finally:
+        detector.cleanup()
+
+
+def test_cleanup_stops_workers_and_frees_memory():
+    """Test cleanup joins every worker and unlinks the frame ring."""
+    detector = ProcessGestureDetector(num_workers=2, detector_factory=FakeDetector)
+    workers = list(detector._workers)
+    _run(detector, [1, 2])
+
+    detector.cleanup()
+
+    assert not any(worker.is_alive() for worker in workers)
+    assert all(worker.exitcode == 0 for worker in workers)
+    assert detector._shm is None
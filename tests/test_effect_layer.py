@@ -0,0 +1,110 @@
+"""Tests for the premultiplied effect layer."""
+
+import numpy as np
+from src.effect_layer import EffectLayer
+
+
+def _squares(*xs):
+    """Build 10x10 square polygons at the given x offsets."""
+    return np.array([[[x, 0], [x + 9, 0], [x + 9, 9], [x, 9]] for x in xs], dtype=np.int32)
+
+
+def test_per_shape_alpha():
+    """Test each polygon blends with its own alpha."""
+    layer = EffectLayer(40, 10)
+    layer.fill_polys(
+        _squares(0, 10, 20), np.array([(0, 0, 255)] * 3), np.array([1.0, 0.5, 0.0])
+    )
+
+    frame = np.full((10, 40, 3), 100, dtype=np.uint8)
+    output = layer.composite(frame, np.empty_like(frame))
+
+    assert output[5, 5].tolist() == [0, 0, 255]
+    assert np.allclose(output[5, 15], [50, 50, 178], atol=1)
+    assert output[5, 25].tolist() == [100, 100, 100]
+    assert output[5, 35].tolist() == [100, 100, 100]
+
+
+def test_overlapping_shapes_composite_over():
+    """Test a translucent shape tints earlier shapes instead of replacing them."""
+    layer = EffectLayer(20, 10)
+    layer.fill_polys(_squares(0), np.array([(0, 0, 255)]), 1.0)
+    layer.fill_polys(_squares(5), np.array([(255, 0, 0)]), 0.3)
+    layer.circle((16, 5), 2, (0, 255, 0), alpha=0.5)
+
+    frame = np.full((10, 20, 3), 255, dtype=np.uint8)
+    output = layer.composite(frame, np.empty_like(frame))
+
+    assert output[5, 2].tolist() == [0, 0, 255]
+    assert np.allclose(output[5, 7], [76, 0, 178], atol=1)  # blue 0.3 over red
+    assert np.allclose(output[5, 12], [255, 178, 178], atol=1)  # blue 0.3 over white
+    assert np.allclose(output[5, 14], [127, 217, 89], atol=1)  # green 0.5 over blue 0.3
+    assert np.allclose(layer.alpha[5, 14], 166, atol=1)
+
+
+def test_clear_makes_layer_transparent():
+    """Test a cleared layer leaves the frame unchanged."""
+    layer = EffectLayer(20, 10)
+    layer.circle((10, 5), 4, (255, 255, 255))
+    layer.clear()
+
+    frame = np.random.default_rng(0).integers(0, 256, (10, 20, 3), dtype=np.uint8)
+    assert np.array_equal(layer.composite(frame, np.empty_like(frame)), frame)
+
+
+def test_engine_blends_all_effects_once():
+    """Test the engine draws every effect into one layer and keeps the input."""
+    from src.animation_engine import AnimationEngine
+
+    engine = AnimationEngine()
+    frame = np.zeros((120, 160, 3), dtype=np.uint8)
+    engine.trigger_effect("thumbs_up", timestamp=0.0)
+    engine.trigger_effect("raised_fist", timestamp=0.0)
+
+    output = engine.render(frame, timestamp=0.5)
+
+    assert output is not frame
+    assert output.any()
+    assert not frame.any()
+
+
+def test_merge_rects():
+    """Test overlapping rectangles merge and disjoint ones stay apart."""
+    from src.effect_layer import merge_rects
+
+    merged = merge_rects([(0, 0, 10, 10), (5, 5, 15, 15), (30, 30, 40, 40), (14, 0, 20, 6)])
+
+    assert sorted(merged) == [(0, 0, 20, 15), (30, 30, 40, 40)]
+
+
+def test_composite_touches_only_dirty_rects():
+    """Test blending and clearing are limited to what was drawn."""
+    layer = EffectLayer(100, 100)
+    layer.fill_polys(_squares(10), np.array([(255, 255, 255)]))
+    assert layer.dirty_rects() == [(10, 0, 20, 10)]
+
+    # Pixels outside the dirty rectangle are never read
+    layer.alpha[50:, 50:] = 255
+    frame = np.zeros((100, 100, 3), dtype=np.uint8)
+    output = layer.composite(frame, np.empty_like(frame))
+    assert output[5, 15].tolist() == [255, 255, 255]
+    assert not output[50:, 50:].any()
+
+    layer.clear()
+    assert layer.is_empty
+    assert not layer.color[:10, 10:20].any()
+
+
+def test_engine_skips_off_screen_effects():
+    """Test an effect outside the frame does no pixel work."""
+    from src.animation_engine import AnimationEngine
+
+    engine = AnimationEngine()
+    renderer = engine.get_renderer("raised_fist")
+    renderer.bounds = lambda width, height, progress: (-50, -50, -10, -10)
+    renderer.draw = lambda layer, progress: (_ for _ in ()).throw(AssertionError("drawn"))
+
+    frame = np.zeros((120, 160, 3), dtype=np.uint8)
+    engine.trigger_effect("raised_fist", timestamp=0.0)
+
+    assert engine.render(frame, timestamp=0.5) is frame
@@ -0,0 +1,48 @@
+"""Tests for the threaded frame pipeline."""
+
+import time
+import numpy as np
+from src.frame_pipeline import FramePipeline, LatestFrameQueue
+
+
+class FakeCapture:
+    """Frame source producing numbered frames."""
+
+    def __init__(self):
+        self.count = 0
+
+    def read(self):
+        time.sleep(0.001)
+        self.count += 1
+        return True, np.full((4, 4, 3), self.count % 256, dtype=np.uint8)
+
+
+def test_latest_frame_queue_drops_oldest():
+    """Test full queue discards the oldest item."""
+    q = LatestFrameQueue(maxsize=2)
+    for i in range(5):
+        q.put(i)
+
+    assert q.dropped == 3
+    assert q.get(timeout=0) == 3
+    assert q.get(timeout=0) == 4
+    assert q.get(timeout=0) is None
+
+
+def test_pipeline_processes_and_outputs_frames():
+    """Test frames flow through every stage."""
+    outputs = []
+    pipeline = FramePipeline(
+        FakeCapture(),
+        process_frame=lambda frame: 255 - frame,
+        output_frame=outputs.append
+    )
+    pipeline.start()
+    time.sleep(0.2)
+    preview = pipeline.get_preview_frame()
+    pipeline.stop()
+
+    assert outputs
+    assert preview is not None
+    assert pipeline.get_stats()["processed"] > 0
+    assert not pipeline.is_running()
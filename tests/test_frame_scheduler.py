@@ -0,0 +1,49 @@
+"""Tests for the adaptive frame scheduler."""
+
+from src.frame_scheduler import FrameScheduler
+
+
+def test_on_time_frame_runs_everything():
+    """Test frames within budget get full processing."""
+    scheduler = FrameScheduler(deadline=0.033)
+    scheduler.record("detect", 0.005)
+    scheduler.record("render", 0.005)
+
+    decision = scheduler.plan(capture_time=100.0, now=100.001)
+
+    assert not decision.drop
+    assert decision.detect
+    assert decision.quality == 1.0
+
+
+def test_stale_frame_is_dropped():
+    """Test frames older than twice the deadline are dropped."""
+    scheduler = FrameScheduler(deadline=0.033)
+
+    decision = scheduler.plan(capture_time=100.0, now=100.1)
+
+    assert decision.drop
+    assert scheduler.get_stats()["dropped"] == 1
+
+
+def test_detection_skipped_when_over_budget():
+    """Test detection is skipped, but not indefinitely, under load."""
+    scheduler = FrameScheduler(deadline=0.033, max_detection_skips=2)
+    scheduler.record("detect", 0.030)
+    scheduler.record("render", 0.005)
+
+    decisions = [scheduler.plan(capture_time=100.0, now=100.010) for _ in range(3)]
+
+    assert [d.detect for d in decisions] == [False, False, True]
+    assert len(scheduler.get_decisions()) == 3
+
+
+def test_quality_lowered_for_slow_rendering():
+    """Test effect quality drops when rendering eats the budget."""
+    scheduler = FrameScheduler(deadline=0.033, min_quality=0.5)
+    scheduler.record("render", 0.030)
+
+    for _ in range(10):
+        decision = scheduler.plan(capture_time=100.0, now=100.0)
+
+    assert decision.quality == 0.5
@@ -0,0 +1,52 @@
+"""Tests for Chrome-trace frame tracing."""
+
+import json
+import threading
+
+from src.frame_tracer import FrameTracer, current_frame_id, set_current_frame_id
+from src.perf_stats import PerfStats
+
+
+def test_spans_carry_frame_id(tmp_path):
+    """Test measured stages become complete events tagged with frame IDs."""
+    tracer = FrameTracer()
+    stats = PerfStats()
+    stats.tracer = tracer
+
+    set_current_frame_id(7)
+    with stats.measure("inference"):
+        pass
+    set_current_frame_id(None)
+
+    path = tmp_path / "trace.json"
+    tracer.save(str(path))
+    events = json.loads(path.read_text())["traceEvents"]
+
+    spans = [e for e in events if e["ph"] == "X"]
+    assert len(spans) == 1
+    assert spans[0]["name"] == "inference"
+    assert spans[0]["args"]["frame_id"] == 7
+    assert any(e["ph"] == "M" and e["name"] == "thread_name" for e in events)
+
+
+def test_frame_id_is_per_thread():
+    """Test each thread tracks its own current frame."""
+    set_current_frame_id(1)
+    seen = []
+    worker = threading.Thread(target=lambda: seen.append(current_frame_id()))
+    worker.start()
+    worker.join()
+
+    assert seen == [None]
+    assert current_frame_id() == 1
+    set_current_frame_id(None)
+
+
+def test_event_buffer_is_bounded():
+    """Test only the most recent spans are kept."""
+    tracer = FrameTracer(max_events=10)
+    for i in range(25):
+        tracer.add_span("capture", i, i + 0.001)
+
+    spans = [e for e in tracer.to_chrome_trace()["traceEvents"] if e["ph"] == "X"]
+    assert len(spans) == 10
@@ -0,0 +1,41 @@
+"""Tests for the learned gesture classifier."""
+
+import numpy as np
+from src.gesture_classifier import (
+    GestureClassifier, landmark_features, train_classifier
+)
+
+
+def _samples(rng, count, thumb_y):
+    """Random hands with the thumb tip raised or lowered."""
+    hands = rng.normal(0.5, 0.02, (count, 1, 21, 3)).astype(np.float32)
+    hands[:, 0, 9, 1] = hands[:, 0, 0, 1] - 0.1
+    hands[:, 0, 4, 1] = hands[:, 0, 0, 1] + thumb_y
+    return hands
+
+
+def test_features_are_translation_invariant():
+    """Test features ignore where the hand is in the frame."""
+    hand = np.random.default_rng(0).random((1, 21, 3)).astype(np.float32)
+    shifted = hand + np.array([0.2, -0.1, 0.0], dtype=np.float32)
+
+    assert np.allclose(landmark_features(hand), landmark_features(shifted), atol=1e-5)
+    assert landmark_features(np.concatenate([hand, shifted])).shape == (20 * 3 * 2 + 3,)
+
+
+def test_train_save_load_classify(tmp_path):
+    """Test a trained model separates classes and survives a round trip."""
+    rng = np.random.default_rng(0)
+    up, idle = _samples(rng, 100, -0.15), _samples(rng, 100, 0.0)
+    features = landmark_features(np.concatenate([up, idle]))
+    labels = ["thumbs_up"] * 100 + ["none"] * 100
+
+    classifier = train_classifier(features, labels, epochs=100)
+    path = tmp_path / "model.npz"
+    classifier.save(path)
+    loaded = GestureClassifier.load(path)
+
+    gesture, confidence = loaded.classify(_samples(rng, 1, -0.15)[0])
+    assert gesture == "thumbs_up"
+    assert confidence > 0.5
+    assert loaded.classify(_samples(rng, 1, 0.0)[0])[0] is None
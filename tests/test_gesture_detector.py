@@ -32,3 +32,31 @@ def test_cleanup(detector):
     """Test cleanup releases resources."""
     detector.cleanup()
     # Should not raise exception
+
+
+def _fake_hands(points):
+    """Build a landmark array with one hand at the given points."""
+    hand = [(x, y, 0.0) for x, y in points]
+    return np.array([hand], dtype=np.float32)
+
+
+def test_tracking_mode_no_hands():
+    """Test tracking mode falls back to full-frame search without hands."""
+    detector = GestureDetector(tracking_mode=True)
+    frame = np.zeros((720, 1280, 3), dtype=np.uint8)
+
+    assert detector.detect(frame) is None
+    assert detector.tracked_roi is None
+    detector.cleanup()
+
+
+def test_predict_roi_around_hand(detector):
+    """Test predicted region is a square crop containing the hand."""
+    hands = _fake_hands([(0.45, 0.45), (0.55, 0.6)] * 10 + [(0.5, 0.5)])
+
+    x, y, w, h = detector._predict_roi(hands, (720, 1280, 3))
+
+    assert w == h
+    assert x <= 0.45 * 1280 and x + w >= 0.55 * 1280
+    assert y <= 0.45 * 720 and y + h >= 0.6 * 720
+    assert w * h < 0.2 * 1280 * 720
@@ -0,0 +1,94 @@
+"""Tests for batched gesture rules."""
+
+import numpy as np
+from src.gesture_rules import (
+    SINGLE_HAND_GESTURES, classify, classify_hands, landmarks_to_array, pair_hands,
+    single_hand_scores
+)
+
+
+def _hand(**ys):
+    """Build one hand at mid-height with the given landmark y overrides."""
+    hand = np.full((21, 3), 0.5, dtype=np.float32)
+    for index, y in ys.items():
+        hand[int(index[1:]), 1] = y
+    return hand
+
+
+# Thumb tip above its IP joint, index tip below its MCP
+THUMBS_UP = _hand(l4=0.3, l3=0.4, l8=0.7, l5=0.6)
+# Index and middle extended, ring and pinky folded
+PEACE = _hand(l4=0.5, l3=0.5, l8=0.2, l6=0.4, l12=0.2, l10=0.4, l16=0.7, l14=0.6)
+
+
+def test_single_hand_scores_batch():
+    """Test each hand in a batch gets its own scores."""
+    scores = single_hand_scores(np.stack([THUMBS_UP, PEACE]))
+
+    assert scores.shape == (2, len(SINGLE_HAND_GESTURES))
+    assert classify(THUMBS_UP[None]) == ("thumbs_up", 0.9)
+    assert classify(PEACE[None]) == ("peace_sign", 0.85)
+
+
+def test_two_thumbs_up():
+    """Test two thumbs up outranks heart hands."""
+    gesture, confidence = classify(np.stack([THUMBS_UP, THUMBS_UP]))
+
+    assert gesture == "two_thumbs_up"
+    assert confidence == 0.95
+
+
+def test_heart_hands():
+    """Test thumbs close together form heart hands."""
+    left, right = PEACE.copy(), PEACE.copy()
+    left[4, :2] = (0.45, 0.3)
+    right[4, :2] = (0.55, 0.3)
+
+    assert classify(np.stack([left, right]))[0] == "heart_hands"
+
+    right[4, 0] = 0.9
+    assert classify(np.stack([left, right])) == (None, 0.0)
+
+
+def test_landmarks_to_array():
+    """Test MediaPipe-like landmarks convert to (hands, 21, 3)."""
+
+    class Landmark:
+        def __init__(self, i):
+            self.x, self.y, self.z = i / 21, 0.5, 0.0
+
+    hand = type("Hand", (), {"landmark": [Landmark(i) for i in range(21)]})()
+
+    hands = landmarks_to_array([hand, hand])
+    assert hands.shape == (2, 21, 3)
+    assert np.isclose(hands[1, 20, 0], 20 / 21)
+    assert landmarks_to_array(None).shape == (0, 21, 3)
+
+
+def _at(hand, x):
+    """Move a hand horizontally, with a palm length of 0.05."""
+    hand = hand.copy()
+    hand[:, 0] += x - 0.5
+    hand[9, :2] = hand[0, :2] + (0.0, -0.05)
+    return hand
+
+
+def test_pair_hands_by_distance_and_handedness():
+    """Test nearby opposite hands pair and same-handed hands do not."""
+    hands = np.stack([_at(THUMBS_UP, x) for x in (0.1, 0.2, 0.8, 0.9)])
+
+    pairs = pair_hands(hands, ["Left", "Right", "Left", "Right"])
+    assert sorted(map(tuple, pairs.tolist())) == [(0, 1), (2, 3)]
+
+    assert len(pair_hands(hands, ["Right"] * 4)) == 0
+
+
+def test_classify_hands_reports_every_person():
+    """Test a third hand gets its own gesture instead of none."""
+    hands = np.stack([_at(THUMBS_UP, 0.1), _at(THUMBS_UP, 0.2), _at(PEACE, 0.8)])
+
+    found = classify_hands(hands, ["Left", "Right", "Left"])
+
+    assert [(g.gesture, g.hands) for g in found] == [
+        ("two_thumbs_up", (0, 1)), ("peace_sign", (2,))
+    ]
@@ -0,0 +1,45 @@
+"""Tests for landmark recording and replay."""
+
+import numpy as np
+from src.landmark_recording import LandmarkRecorder, ReplayDetector, load_recording
+
+
+def _thumbs_up():
+    hand = np.full((1, 21, 3), 0.5, dtype=np.float32)
+    hand[0, 4, 1], hand[0, 3, 1] = 0.3, 0.4
+    hand[0, 8, 1], hand[0, 5, 1] = 0.7, 0.6
+    return hand
+
+
+def _record(path):
+    with LandmarkRecorder(path) as recorder:
+        recorder.record(0.0, np.empty((0, 21, 3), dtype=np.float32))
+        recorder.record(0.033, _thumbs_up(), ["Right"])
+        recorder.record(0.066, np.concatenate([_thumbs_up()] * 3), ["Left", "Right", "Left"])
+
+
+def test_recording_is_memory_mappable(tmp_path):
+    """Test recordings load as a memory-mapped structured array."""
+    path = tmp_path / "landmarks.npy"
+    _record(path)
+
+    records = load_recording(path)
+    assert isinstance(records, np.memmap)
+    assert len(records) == 3
+    assert list(records["num_hands"]) == [0, 1, 2]
+    assert np.allclose(records["t"], [0.0, 0.033, 0.066])
+    assert np.allclose(records["landmarks"][1, 0], _thumbs_up()[0])
+
+
+def test_replay_detector(tmp_path):
+    """Test replay runs recorded hands through the gesture rules."""
+    path = tmp_path / "landmarks.npy"
+    _record(path)
+
+    detector = ReplayDetector(path)
+    assert detector.detect() is None
+    assert detector.detect() == "thumbs_up"
+    assert detector.last_handedness == ["Right"]
+    assert detector.detect() == "two_thumbs_up"
+    assert detector.finished
+    detector.cleanup()
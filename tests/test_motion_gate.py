@@ -0,0 +1,60 @@
+"""Tests for motion-gated gesture detection."""
+
+import numpy as np
+from src.motion_gate import MotionGatedDetector
+
+
+class FakeDetector:
+    """Detector stub that counts inferences."""
+
+    confidence_threshold = 0.8
+
+    def __init__(self, gesture=None, hands=0):
+        self.gesture = gesture
+        self.last_hand_count = hands
+        self.calls = 0
+
+    def detect(self, frame):
+        self.calls += 1
+        return self.gesture
+
+    def cleanup(self):
+        pass
+
+
+def _frame(value):
+    return np.full((120, 160, 3), value, dtype=np.uint8)
+
+
+def test_static_scene_is_gated():
+    """Test static frames skip inference after the hold period."""
+    inner = FakeDetector()
+    gate = MotionGatedDetector(inner, hand_hold=0.0, keepalive_interval=60.0)
+
+    for _ in range(10):
+        gate.detect(_frame(50))
+
+    assert inner.calls == 1
+    assert gate.get_stats() == {"gated": 9, "inferred": 1}
+
+
+def test_motion_wakes_detector():
+    """Test a changed frame runs inference immediately."""
+    inner = FakeDetector(gesture="thumbs_up")
+    gate = MotionGatedDetector(inner, hand_hold=0.0, keepalive_interval=60.0)
+
+    gate.detect(_frame(50))
+    gate.detect(_frame(50))
+    assert gate.detect(_frame(200)) == "thumbs_up"
+    assert inner.calls == 2
+
+
+def test_visible_hand_keeps_inference_running():
+    """Test a detected hand keeps inference going without motion."""
+    inner = FakeDetector(hands=1)
+    gate = MotionGatedDetector(inner, hand_hold=10.0, keepalive_interval=60.0)
+
+    for _ in range(5):
+        gate.detect(_frame(50))
+
+    assert inner.calls == 5
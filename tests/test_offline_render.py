@@ -0,0 +1,57 @@
+"""Tests for the headless offline renderer."""
+
+import cv2
+import numpy as np
+from src.config import Config
+from src.landmark_recording import LandmarkRecorder
+from src.offline_render import main, render_offline
+
+
+def _thumbs_up():
+    hand = np.full((1, 21, 3), 0.5, dtype=np.float32)
+    hand[0, 4, 1], hand[0, 3, 1] = 0.3, 0.4
+    hand[0, 8, 1], hand[0, 5, 1] = 0.7, 0.6
+    return hand
+
+
+def _write_inputs(tmp_path, num_frames=12):
+    """Write a synthetic video and a landmark recording with a late thumbs up."""
+    video = tmp_path / "input.avi"
+    writer = cv2.VideoWriter(str(video), cv2.VideoWriter_fourcc(*"MJPG"), 10.0, (64, 48))
+    for i in range(num_frames):
+        writer.write(np.full((48, 64, 3), i * 10, dtype=np.uint8))
+    writer.release()
+
+    landmarks = tmp_path / "landmarks.npy"
+    with LandmarkRecorder(landmarks) as recorder:
+        for i in range(num_frames):
+            if i >= 4:
+                recorder.record(i / 10.0, _thumbs_up(), ["Right"])
+            else:
+                recorder.record(i / 10.0, np.empty((0, 21, 3), dtype=np.float32))
+    return video, landmarks
+
+
+def test_render_offline_reports_frames_and_gestures(tmp_path):
+    """Test a recording renders every frame and reports the triggered effect."""
+    video, landmarks = _write_inputs(tmp_path)
+    output = tmp_path / "frames"
+
+    report = render_offline(
+        str(video), str(output), Config(tmp_path / "config.json", create=False),
+        landmarks=str(landmarks)
+    )
+
+    assert report["frames"] == 12
+    assert len(list(output.glob("*.png"))) == 12
+    assert report["gestures"] == [{"frame": 4, "time": 0.4, "gesture": "thumbs_up"}]
+    assert set(report["stages_ms"]) == {"read", "detect", "render", "write"}
+
+
+def test_cli_does_not_create_config(tmp_path, monkeypatch):
+    """Test the command line renderer leaves no config file behind."""
+    video, landmarks = _write_inputs(tmp_path, num_frames=3)
+    monkeypatch.chdir(tmp_path)
+
+    assert main([str(video), "--landmarks", str(landmarks)]) == 0
+    assert not (tmp_path / "config.json").exists()
@@ -0,0 +1,89 @@
+"""Tests for the struct-of-arrays particle system."""
+
+import numpy as np
+from src.effects.particle_system import ParticleSystem, circle_template, transform_polygons
+
+
+def test_closed_form_positions():
+    """Test positions follow velocity, acceleration and wobble."""
+    particles = ParticleSystem(2, [(255, 255, 255)])
+    particles.x0[:] = 0.5
+    particles.vx[:] = (0.1, -0.1)
+    particles.ay[:] = 2.0
+    particles.wobble[1] = 0.05
+    particles.wobble_rate[1] = np.pi
+
+    x, y = particles.positions(0.5)
+
+    assert np.allclose(x, [0.55, 0.45 + 0.05])
+    assert np.allclose(y, [0.25, 0.25])
+
+
+def test_visible_culls_off_screen():
+    """Test particles outside the frame, beyond their size, are culled."""
+    particles = ParticleSystem(3, [(255, 255, 255)])
+    particles.x0[:] = (0.5, -0.5, 1.01)
+    particles.y0[:] = 0.5
+    particles.size[:] = 10
+    particles.spin[:] = 90
+
+    visible = particles.visible(1.0, 100, 100)
+
+    # The third particle's center is 1 px right of the frame, within its size
+    assert visible.index.tolist() == [0, 2]
+    assert np.allclose(visible.x, [50, 101])
+    assert np.allclose(visible.rotation, 90)
+
+
+def test_transform_polygons_batch():
+    """Test one template is placed, scaled and rotated per particle."""
+    polygons = transform_polygons(
+        circle_template(4), np.array([10.0, 50.0]), np.array([10.0, 50.0]),
+        np.array([5.0, 10.0]), np.array([0.0, 90.0])
+    )
+
+    assert polygons.shape == (2, 4, 2)
+    assert polygons[0, 0].tolist() == [15, 10]
+    assert polygons[1, 0].tolist() == [50, 60]
+
+
+def test_effects_render_thousands_of_particles():
+    """Test ported effects draw large particle counts."""
+    from src.effects.confetti import ConfettiEffect
+    from src.effects.hearts import HeartsEffect
+
+    frame = np.zeros((120, 160, 3), dtype=np.uint8)
+    for effect in (HeartsEffect(num_hearts=2000), ConfettiEffect(num_particles=5000)):
+        output = effect.render(frame.copy(), 0.5)
+        assert output.shape == frame.shape
+        assert output.any()
+
+
+def test_seeded_effects_are_reproducible():
+    """Test effects with the same seed render the same frame."""
+    from src.effects.balloons import BalloonsEffect
+    from src.effects.lasers import LasersEffect
+
+    frame = np.zeros((120, 160, 3), dtype=np.uint8)
+    for effect_class in (BalloonsEffect, LasersEffect):
+        first = effect_class(seed=3).render(frame.copy(), 0.5)
+        second = effect_class(seed=3).render(frame.copy(), 0.5)
+        assert np.array_equal(first, second)
+
+
+def test_bounds_and_draw_share_visible_particles():
+    """Test the engine's bounds() and draw() calls evaluate particles once."""
+    from src.effect_layer import EffectLayer
+    from src.effects.hearts import HeartsEffect
+
+    effect = HeartsEffect(seed=0)
+    calls = []
+    visible = effect.hearts.visible
+    effect.hearts.visible = lambda *args: calls.append(args) or visible(*args)
+
+    layer = EffectLayer(160, 120)
+    for progress in (0.3, 0.6):
+        effect.bounds(160, 120, progress)
+        effect.draw(layer, progress)
+
+    assert len(calls) == 2
@@ -0,0 +1,37 @@
+"""Tests for per-stage performance statistics."""
+
+import numpy as np
+from src.perf_stats import PerfStats
+
+
+def test_percentiles_over_rolling_window():
+    """Test only the most recent samples are kept."""
+    stats = PerfStats(window=100)
+    for ms in range(200):
+        stats.record("render", ms / 1000)
+
+    render = stats.percentiles("render")
+    assert render["count"] == 100
+    assert 140 <= render["p50"] <= 160
+    assert render["p99"] <= 199.0
+
+
+def test_disabled_stats_record_nothing():
+    """Test a disabled collector ignores samples."""
+    stats = PerfStats(enabled=False)
+    with stats.measure("capture"):
+        pass
+
+    assert stats.snapshot() == {}
+
+
+def test_overlay_draws_on_frame():
+    """Test overlay changes the frame once stages have samples."""
+    stats = PerfStats()
+    stats.record("inference", 0.012)
+    frame = np.full((480, 640, 3), 255, dtype=np.uint8)
+
+    stats.draw_overlay(frame)
+
+    assert frame[:20, :100].mean() < 255
+    assert frame[400:, 400:].min() == 255
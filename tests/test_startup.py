@@ -0,0 +1,78 @@
+"""Startup regression tests: importing the app must stay lightweight."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+
+HEAVY_MODULES = ("mediapipe", "cv2", "PyQt5", "pyvirtualcam", "onnxruntime")
+
+
+def _loaded_after_import(module):
+    """Import a module in a fresh interpreter and list heavy modules loaded."""
+    code = (
+        f"import sys; import {module}; "
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=SRC_DIR, capture_output=True, text=True, timeout=60
+    )
+    assert result.returncode == 0, result.stderr
+    return [name for name in result.stdout.strip().split(",") if name]
+
+
+def test_main_import_is_lightweight():
+    """Test importing main loads no GUI, vision or camera libraries."""
+    assert _loaded_after_import("main") == []
+
+
+def test_engine_import_loads_no_effects():
+    """Test effects are only imported when first triggered."""
+    code = (
+        "import sys; from animation_engine import AnimationEngine; AnimationEngine(); "
+        "print(any(m.startswith('effects.') and m != 'effects.base_effect' for m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=SRC_DIR, capture_output=True, text=True, timeout=60
+    )
+    assert result.stdout.strip() == "False", result.stderr
+
+
+def test_components_load_in_background(tmp_path, monkeypatch):
+    """Test frames flow before the detector and virtual camera are ready."""
+    import threading
+    import numpy as np
+    from src.main import CameraReactionsApp
+
+    monkeypatch.chdir(tmp_path)
+    release = threading.Event()
+
+    class SlowDetector:
+        def detect(self, frame):
+            return None
+
+        def cleanup(self):
+            pass
+
+    def slow_detector():
+        release.wait(5.0)
+        return SlowDetector()
+
+    app = CameraReactionsApp()
+    monkeypatch.setattr(app, "_create_gesture_detector", slow_detector)
+    monkeypatch.setattr(app, "_init_virtual_camera", lambda: None)
+    monkeypatch.setattr(app, "_init_effects", lambda: None)
+
+    app.start()
+    frame = np.zeros((48, 64, 3), dtype=np.uint8)
+    assert app.process_frame(frame) is frame
+    assert "gesture detector" in app.get_status()
+
+    release.set()
+    assert app.detector_ready.wait(5.0)
+    for thread in app._init_threads:
+        thread.join(5.0)
+    assert app.get_status() == "Ready"
+    app.process_frame(frame)
+    app.stop()
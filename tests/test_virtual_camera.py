@@ -0,0 +1,161 @@
+"""Tests for the virtual camera using a fake pyvirtualcam backend."""
+
+import time
+from enum import Enum
+from types import SimpleNamespace
+
+import cv2
+import numpy as np
+import pytest
+from src import virtual_camera
+from src.pixel_format import FrameConverter, frame_shape
+from src.virtual_camera import VirtualCamera
+
+
+class FakePixelFormat(Enum):
+    """Subset of pyvirtualcam.PixelFormat."""
+
+    BGR = "24BG"
+    I420 = "I420"
+    NV12 = "NV12"
+    YUYV = "YUYV"
+
+
+class FakeCamera:
+    """Stand-in for pyvirtualcam.Camera that records sent frames."""
+
+    native_fmt = None
+
+    def __init__(self, width, height, fps, fmt=FakePixelFormat.BGR, **kwargs):
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.fmt = fmt
+        self.sent = []
+        self.closed = False
+
+    def send(self, frame):
+        self.sent.append(frame.copy())
+
+    def sleep_until_next_frame(self):
+        time.sleep(1.0 / self.fps)
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def fake_pyvirtualcam(monkeypatch):
+    """Replace pyvirtualcam with the fake backend."""
+    fake = SimpleNamespace(Camera=FakeCamera, PixelFormat=FakePixelFormat)
+    monkeypatch.setattr(virtual_camera, "pyvirtualcam", fake, raising=False)
+    monkeypatch.setattr(virtual_camera, "VIRTUAL_CAM_AVAILABLE", True)
+    return fake
+
+
+def test_send_frame_does_not_block(fake_pyvirtualcam):
+    """Test queueing a frame returns immediately."""
+    camera = VirtualCamera(width=64, height=48, fps=5)
+    frame = np.zeros((48, 64, 3), dtype=np.uint8)
+
+    start = time.perf_counter()
+    for _ in range(10):
+        assert camera.send_frame(frame)
+    elapsed = time.perf_counter() - start
+    camera.stop()
+
+    assert elapsed < 0.1
+
+
+def test_sender_repeats_last_frame(fake_pyvirtualcam):
+    """Test the last frame is repeated when upstream stalls."""
+    camera = VirtualCamera(width=64, height=48, fps=50)
+    device = camera.camera
+    camera.send_frame(np.full((96, 128, 3), 7, dtype=np.uint8))
+    time.sleep(0.2)
+    camera.stop()
+
+    assert len(device.sent) >= 3
+    assert camera.frames_repeated >= 2
+    assert all(frame.shape == (48, 64, 3) for frame in device.sent)
+    assert all((frame == 7).all() for frame in device.sent)
+    assert device.closed
+
+
+def test_latest_frame_is_a_copy(fake_pyvirtualcam):
+    """Test get_latest_frame returns the delivered frame."""
+    camera = VirtualCamera(width=64, height=48, fps=50)
+    assert camera.get_latest_frame() is None
+
+    camera.send_frame(np.full((48, 64, 3), 3, dtype=np.uint8))
+    time.sleep(0.1)
+    latest = camera.get_latest_frame()
+    camera.stop()
+
+    assert (latest == 3).all()
+
+
+def test_auto_format_uses_native_yuv(fake_pyvirtualcam, monkeypatch):
+    """Test the camera is reopened in its native format."""
+    monkeypatch.setattr(FakeCamera, "native_fmt", FakePixelFormat.NV12)
+    camera = VirtualCamera(width=64, height=48, fps=50)
+    device = camera.camera
+    camera.send_frame(np.full((48, 64, 3), 128, dtype=np.uint8))
+    time.sleep(0.1)
+    camera.stop()
+
+    assert camera.output_format == "nv12"
+    assert device.fmt == FakePixelFormat.NV12
+    assert device.sent
+    assert all(frame.shape == (72, 64) for frame in device.sent)
+
+
+def test_auto_format_falls_back_to_bgr(fake_pyvirtualcam):
+    """Test BGR is kept when the native format is unknown."""
+    camera = VirtualCamera(width=64, height=48, fps=50)
+    camera.stop()
+
+    assert camera.output_format == "bgr"
+
+
+def _random_frame(height=48, width=64):
+    rng = np.random.default_rng(0)
+    return rng.integers(0, 256, (height, width, 3), dtype=np.uint8)
+
+
+def test_i420_matches_opencv():
+    """Test I420 output is OpenCV's planar conversion."""
+    frame = _random_frame()
+    converter = FrameConverter("i420", 64, 48)
+
+    expected = cv2.cvtColor(frame, cv2.COLOR_BGR2YUV_I420)
+    assert np.array_equal(converter.convert(frame), expected)
+
+
+def test_nv12_interleaves_chroma():
+    """Test NV12 output holds interleaved U/V after the Y plane."""
+    frame = _random_frame()
+    i420 = cv2.cvtColor(frame, cv2.COLOR_BGR2YUV_I420)
+    nv12 = FrameConverter("nv12", 64, 48).convert(frame)
+
+    u = i420[48:60].reshape(-1)
+    v = i420[60:].reshape(-1)
+    assert np.array_equal(nv12[:48], i420[:48])
+    assert np.array_equal(nv12[48:].reshape(-1)[0::2], u)
+    assert np.array_equal(nv12[48:].reshape(-1)[1::2], v)
+
+
+def test_yuyv_packs_422():
+    """Test YUYV output packs luma with row-shared chroma."""
+    frame = _random_frame()
+    i420 = cv2.cvtColor(frame, cv2.COLOR_BGR2YUV_I420)
+    yuyv = FrameConverter("yuyv", 64, 48).convert(frame)
+
+    packed = yuyv.reshape(48, 32, 4)
+    u = i420[48:60].reshape(24, 32)
+    v = i420[60:].reshape(24, 32)
+    assert yuyv.shape == frame_shape("yuyv", 64, 48)
+    assert np.array_equal(packed[..., 0], i420[:48, 0::2])
+    assert np.array_equal(packed[..., 2], i420[:48, 1::2])
+    assert np.array_equal(packed[0::2, :, 1], u)
+    assert np.array_equal(packed[1::2, :, 3], v)